@@ -0,0 +1,101 @@
+"""
+Read-through response cache for read-only endpoints
+"""
+import asyncio
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, Tuple
+
+
+class ResponseCache:
+    """TTL cache with LRU eviction and single-flight request coalescing.
+
+    Keys are tuples whose first element names the endpoint, for example
+    ("resources", "pods", "default"). A miss runs the factory in its own
+    task; concurrent requests for the same key await that task instead of
+    starting another upstream call, and a client that disconnects does not
+    cancel it for the others. Failures are never cached. At most
+    max_entries values are kept, the least recently used going first.
+    """
+
+    def __init__(self, ttl: float = 2.0, max_entries: int = 256):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        self._inflight: Dict[Hashable, asyncio.Task] = {}
+        self._generation = 0
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0
+        self.evictions = 0
+
+    def _lookup(self, key: Hashable) -> Tuple[bool, Any]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return False, None
+        expires, value = entry
+        if expires <= time.monotonic():
+            del self._entries[key]
+            return False, None
+        self._entries.move_to_end(key)
+        return True, value
+
+    def _store(self, key: Hashable, value: Any, ttl: float):
+        self._entries[key] = (time.monotonic() + ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    async def get_or_compute(self, key: Hashable, factory: Callable[[], Awaitable[Any]],
+                             ttl: Optional[float] = None) -> Any:
+        """Return the cached value for key, or await factory() once for all concurrent callers"""
+        ttl = self.ttl if ttl is None else ttl
+        if ttl <= 0:
+            return await factory()
+
+        found, value = self._lookup(key)
+        if found:
+            self.hits += 1
+            return value
+
+        task = self._inflight.get(key)
+        if task is not None:
+            self.coalesced += 1
+        else:
+            self.misses += 1
+            task = asyncio.ensure_future(factory())
+            self._inflight[key] = task
+            generation = self._generation
+
+            def done(finished: asyncio.Task):
+                if self._inflight.get(key) is finished:
+                    del self._inflight[key]
+                # A value computed across an invalidation may already be stale
+                if generation == self._generation and not finished.cancelled() and finished.exception() is None:
+                    self._store(key, finished.result(), ttl)
+
+            task.add_done_callback(done)
+        return await asyncio.shield(task)
+
+    def invalidate(self, endpoint: str = None):
+        """Drop cached values of one endpoint, or everything when endpoint is None"""
+        self._generation += 1
+        # Calls already in flight finish for their waiters, but new requests start over
+        for store in (self._entries, self._inflight):
+            for key in [k for k in store if endpoint is None or (isinstance(k, tuple) and k and k[0] == endpoint)]:
+                del store[key]
+
+    def metrics(self) -> Dict[str, Any]:
+        lookups = self.hits + self.coalesced + self.misses
+        return {
+            "ttl": self.ttl,
+            "max_entries": self.max_entries,
+            "entries": len(self._entries),
+            "inflight": len(self._inflight),
+            "hits": self.hits,
+            "misses": self.misses,
+            "coalesced": self.coalesced,
+            "evictions": self.evictions,
+            "hit_rate": round((self.hits + self.coalesced) / lookups, 4) if lookups else 0.0,
+        }
@@ -0,0 +1,173 @@
+"""
+WebSocket connection manager with per-connection send queues
+"""
+import asyncio
+import json
+import logging
+from typing import Any, Dict, Iterable, List, Union
+
+from fastapi import WebSocket
+
+logger = logging.getLogger(__name__)
+
+SLOW_CONSUMER_POLICIES = ("drop", "disconnect")
+
+
+class _Connection:
+    """One WebSocket, its bounded outgoing queue and the task draining it"""
+
+    def __init__(self, websocket: WebSocket, queue_size: int):
+        self.websocket = websocket
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=queue_size)
+        self.writer: asyncio.Task = None
+        self.dropped = 0
+
+
+class ConnectionManager:
+    """Tracks WebSocket connections and delivers messages without blocking.
+
+    Every connection has a bounded queue drained by its own writer task, so
+    a slow client never delays the others. Messages are serialized once and
+    the same string is queued for every recipient. When a queue is full the
+    slow-consumer policy applies: "drop" discards the oldest queued message,
+    "disconnect" closes the connection. Only messages sent with
+    droppable=True (progress updates, status) are ever dropped; messages a
+    client cannot recover from losing, such as resource snapshots and deltas
+    or chat replies, are sent with droppable=False. When the queue holds
+    nothing droppable and such a message does not fit, the client is
+    disconnected so that it reconnects and starts from a fresh snapshot. A
+    send that takes longer than send_timeout always disconnects the client.
+    """
+
+    def __init__(self, queue_size: int = 256, slow_consumer_policy: str = "drop", send_timeout: float = 10.0):
+        if slow_consumer_policy not in SLOW_CONSUMER_POLICIES:
+            raise ValueError(f"slow_consumer_policy must be one of {SLOW_CONSUMER_POLICIES}")
+        self.queue_size = queue_size
+        self.slow_consumer_policy = slow_consumer_policy
+        self.send_timeout = send_timeout
+        self.connections: Dict[WebSocket, _Connection] = {}
+        self.dropped_messages = 0
+        self.slow_disconnects = 0
+        self.sent_messages = 0
+
+    @property
+    def active_connections(self) -> List[WebSocket]:
+        return list(self.connections)
+
+    async def connect(self, websocket: WebSocket):
+        await websocket.accept()
+        connection = _Connection(websocket, self.queue_size)
+        connection.writer = asyncio.create_task(self._writer(connection))
+        self.connections[websocket] = connection
+
+    def disconnect(self, websocket: WebSocket):
+        connection = self.connections.pop(websocket, None)
+        if connection and connection.writer and connection.writer is not asyncio.current_task():
+            connection.writer.cancel()
+
+    async def _writer(self, connection: _Connection):
+        try:
+            while True:
+                message, _ = await connection.queue.get()
+                await asyncio.wait_for(connection.websocket.send_text(message), self.send_timeout)
+                self.sent_messages += 1
+        except asyncio.CancelledError:
+            raise
+        except asyncio.TimeoutError:
+            logger.warning(f"WebSocket send exceeded {self.send_timeout}s, disconnecting slow client")
+            self.slow_disconnects += 1
+            await self._close(connection)
+        except Exception as e:
+            logger.info(f"WebSocket send failed, removing connection: {str(e)}")
+            self.disconnect(connection.websocket)
+
+    async def _close(self, connection: _Connection):
+        self.disconnect(connection.websocket)
+        try:
+            await asyncio.wait_for(connection.websocket.close(code=1013), self.send_timeout)
+        except Exception:
+            pass
+
+    @staticmethod
+    def _drop_oldest(connection: _Connection) -> bool:
+        """Discard the oldest droppable queued message; False when every queued message must be delivered"""
+        queued = [connection.queue.get_nowait() for _ in range(connection.queue.qsize())]
+        index = next((i for i, (_, droppable) in enumerate(queued) if droppable), None)
+        if index is not None:
+            del queued[index]
+        for item in queued:
+            connection.queue.put_nowait(item)
+        return index is not None
+
+    async def _enqueue(self, connection: _Connection, message: str, droppable: bool = True):
+        try:
+            connection.queue.put_nowait((message, droppable))
+            return
+        except asyncio.QueueFull:
+            pass
+
+        if self.slow_consumer_policy == "drop":
+            if self._drop_oldest(connection):
+                connection.queue.put_nowait((message, droppable))
+            elif not droppable:
+                logger.warning("WebSocket send queue full of undroppable messages, disconnecting slow client")
+                self.slow_disconnects += 1
+                await self._close(connection)
+                return
+            # Otherwise the new message is the only one that may go
+            connection.dropped += 1
+            self.dropped_messages += 1
+            return
+
+        logger.warning("WebSocket send queue full, disconnecting slow client")
+        self.slow_disconnects += 1
+        await self._close(connection)
+
+    @staticmethod
+    def _serialize(message: Union[str, Dict[str, Any]]) -> str:
+        return message if isinstance(message, str) else json.dumps(message)
+
+    async def send_personal_message(self, message: Union[str, Dict[str, Any]], websocket: WebSocket,
+                                    droppable: bool = True):
+        connection = self.connections.get(websocket)
+        if connection:
+            await self._enqueue(connection, self._serialize(message), droppable)
+
+    async def send_blocking(self, message: Union[str, Dict[str, Any]], websocket: WebSocket) -> bool:
+        """Wait for room in the connection's queue instead of applying the slow-consumer policy.
+
+        Used by producers that can pause, such as log streams. Returns False
+        when the connection is gone or its queue stays full for send_timeout,
+        in which case the client is disconnected as a slow consumer.
+        """
+        connection = self.connections.get(websocket)
+        if connection is None:
+            return False
+        try:
+            await asyncio.wait_for(connection.queue.put((self._serialize(message), False)), self.send_timeout)
+        except asyncio.TimeoutError:
+            logger.warning(f"WebSocket queue stayed full for {self.send_timeout}s, disconnecting slow client")
+            self.slow_disconnects += 1
+            await self._close(connection)
+            return False
+        return websocket in self.connections
+
+    async def send_many(self, message: Union[str, Dict[str, Any]], websockets: Iterable[WebSocket],
+                        droppable: bool = True):
+        """Queue one serialized message for several connections at once"""
+        text = self._serialize(message)
+        connections = [self.connections[ws] for ws in websockets if ws in self.connections]
+        await asyncio.gather(*(self._enqueue(connection, text, droppable) for connection in connections))
+
+    async def broadcast(self, message: Union[str, Dict[str, Any]]):
+        await self.send_many(message, list(self.connections))
+
+    def metrics(self) -> Dict[str, Any]:
+        return {
+            "active_connections": len(self.connections),
+            "queued_messages": sum(c.queue.qsize() for c in self.connections.values()),
+            "sent_messages": self.sent_messages,
+            "dropped_messages": self.dropped_messages,
+            "slow_disconnects": self.slow_disconnects,
+            "slow_consumer_policy": self.slow_consumer_policy,
+        }
@@ -0,0 +1,94 @@
+"""
+Bounded executor for blocking calls made from async route handlers
+"""
+import asyncio
+import contextvars
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict
+
+
+class ExecutorSaturated(Exception):
+    """Raised when the executor queue is full"""
+    pass
+
+
+class BoundedExecutor:
+    """Runs blocking calls on a fixed-size thread pool.
+
+    At most max_workers calls run at once and at most max_queue wait for a
+    worker; further submissions raise ExecutorSaturated instead of piling up.
+    Queue depth and the time calls spend waiting for a worker are tracked
+    for the status and metrics endpoints.
+    """
+
+    def __init__(self, max_workers: int = 8, max_queue: int = 64):
+        self.max_workers = max_workers
+        self.max_queue = max_queue
+        self._pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="k8s-blocking")
+        self._lock = threading.Lock()
+        self.queued = 0
+        self.running = 0
+        self.completed = 0
+        self.rejected = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+        self.last_wait = 0.0
+
+    async def run(self, fn: Callable[..., Any], *args, **kwargs) -> Any:
+        """Run fn(*args, **kwargs) on the pool and await its result.
+
+        fn runs in a copy of the caller's context, so the current trace span
+        carries over to the worker thread.
+        """
+        with self._lock:
+            if self.queued >= self.max_queue:
+                self.rejected += 1
+                raise ExecutorSaturated(f"Executor queue is full ({self.max_queue} calls waiting)")
+            self.queued += 1
+        submitted = time.perf_counter()
+        context = contextvars.copy_context()
+
+        def call():
+            wait = time.perf_counter() - submitted
+            with self._lock:
+                self.queued -= 1
+                self.running += 1
+                self.total_wait += wait
+                self.max_wait = max(self.max_wait, wait)
+                self.last_wait = wait
+            try:
+                return context.run(fn, *args, **kwargs)
+            finally:
+                with self._lock:
+                    self.running -= 1
+                    self.completed += 1
+
+        future = self._pool.submit(call)
+        try:
+            return await asyncio.wrap_future(future)
+        except asyncio.CancelledError:
+            # A call that never reached a worker leaves the queue here
+            if future.cancel():
+                with self._lock:
+                    self.queued -= 1
+            raise
+
+    def metrics(self) -> Dict[str, Any]:
+        with self._lock:
+            started = self.completed + self.running
+            return {
+                "max_workers": self.max_workers,
+                "max_queue": self.max_queue,
+                "queue_depth": self.queued,
+                "running": self.running,
+                "completed": self.completed,
+                "rejected": self.rejected,
+                "avg_wait_ms": round(self.total_wait / started * 1000, 3) if started else 0.0,
+                "max_wait_ms": round(self.max_wait * 1000, 3),
+                "last_wait_ms": round(self.last_wait * 1000, 3),
+            }
+
+    def shutdown(self):
+        self._pool.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,155 @@
+"""
+Streaming pod logs over NDJSON responses and the /ws endpoint.
+
+Lines are read from K8sOperations.astream_logs into a byte-bounded buffer
+and handed out in batches. When the consumer falls behind, the buffer fills
+up and reading from the cluster pauses until it drains, so a stream never
+holds more than max_buffer_bytes of log data.
+"""
+import asyncio
+import json
+from collections import deque
+from datetime import datetime
+from typing import Any, AsyncIterator, Dict, List, Optional
+
+from fastapi import WebSocket
+
+from connections import ConnectionManager
+from k8s import K8sOperations
+
+
+class LogBuffer:
+    """Byte-bounded line buffer between a log reader and its consumer"""
+
+    def __init__(self, lines: AsyncIterator[str], max_buffer_bytes: int = 262144,
+                 max_batch_bytes: int = 65536, flush_interval: float = 0.1):
+        self.lines = lines
+        self.max_buffer_bytes = max_buffer_bytes
+        self.max_batch_bytes = max_batch_bytes
+        self.flush_interval = flush_interval
+        self._buffer: deque = deque()
+        self._bytes = 0
+        self._done = False
+        self._error: Optional[BaseException] = None
+        self._changed = asyncio.Condition()
+
+    async def _read(self):
+        try:
+            async for line in self.lines:
+                async with self._changed:
+                    await self._changed.wait_for(lambda: self._bytes < self.max_buffer_bytes)
+                    # UTF-8 size plus the newline, as sent to the client
+                    size = len(line.encode("utf-8")) + 1
+                    self._buffer.append((line, size))
+                    self._bytes += size
+                    self._changed.notify_all()
+        except Exception as e:
+            self._error = e
+        finally:
+            async with self._changed:
+                self._done = True
+                self._changed.notify_all()
+
+    def _take(self) -> List[str]:
+        batch, size = [], 0
+        while self._buffer and (not batch or size + self._buffer[0][1] <= self.max_batch_bytes):
+            line, line_size = self._buffer.popleft()
+            size += line_size
+            batch.append(line)
+        self._bytes -= size
+        self._changed.notify_all()
+        return batch
+
+    async def batches(self) -> AsyncIterator[List[str]]:
+        """Yield lists of lines, flushed every flush_interval or once max_batch_bytes is reached"""
+        reader = asyncio.create_task(self._read())
+        try:
+            while True:
+                async with self._changed:
+                    await self._changed.wait_for(lambda: self._buffer or self._done)
+                    if not self._buffer:
+                        break
+                    try:
+                        await asyncio.wait_for(
+                            self._changed.wait_for(lambda: self._bytes >= self.max_batch_bytes or self._done),
+                            self.flush_interval
+                        )
+                    except asyncio.TimeoutError:
+                        pass
+                    batch = self._take()
+                yield batch
+            if self._error is not None:
+                raise self._error
+        finally:
+            reader.cancel()
+            await asyncio.gather(reader, return_exceptions=True)
+
+
+async def ndjson_log_stream(k8s_ops: K8sOperations, pod_name: str, namespace: Optional[str] = None,
+                            **options) -> AsyncIterator[str]:
+    """Body of a streaming HTTP response: one JSON object per log batch"""
+    lines = k8s_ops.astream_logs(pod_name, namespace, **options)
+    try:
+        async for batch in LogBuffer(lines).batches():
+            yield json.dumps({"type": "log_lines", "pod_name": pod_name, "lines": batch}) + "\n"
+        yield json.dumps({"type": "log_end", "pod_name": pod_name}) + "\n"
+    except Exception as e:
+        yield json.dumps({"type": "error", "pod_name": pod_name, "message": str(e)}) + "\n"
+
+
+class LogStreamHub:
+    """Per-WebSocket log streams started by logs_subscribe messages.
+
+    Each stream runs in its own task and sends log_lines messages through
+    ConnectionManager.send_blocking, which waits for room in the client's
+    queue instead of dropping lines.
+    """
+
+    def __init__(self, k8s_ops: K8sOperations, manager: ConnectionManager):
+        self.k8s_ops = k8s_ops
+        self.manager = manager
+        self.streams: Dict[WebSocket, Dict[str, asyncio.Task]] = {}
+
+    def subscribe(self, websocket: WebSocket, stream_id: str, pod_name: str, namespace: Optional[str] = None,
+                  **options):
+        self.unsubscribe(websocket, stream_id)
+        task = asyncio.create_task(self._stream(websocket, stream_id, pod_name, namespace, options))
+        self.streams.setdefault(websocket, {})[stream_id] = task
+        task.add_done_callback(lambda _: self._forget(websocket, stream_id, task))
+
+    def _forget(self, websocket: WebSocket, stream_id: str, task: asyncio.Task):
+        streams = self.streams.get(websocket, {})
+        if streams.get(stream_id) is task:
+            del streams[stream_id]
+            if not streams:
+                self.streams.pop(websocket, None)
+
+    def unsubscribe(self, websocket: WebSocket, stream_id: str = None):
+        """Stop one stream, or every stream of the connection when stream_id is None"""
+        streams = self.streams.get(websocket, {})
+        for key in [stream_id] if stream_id is not None else list(streams):
+            task = streams.get(key)
+            if task:
+                task.cancel()
+
+    async def _send(self, websocket: WebSocket, message: Dict[str, Any]) -> bool:
+        message["timestamp"] = datetime.now().isoformat()
+        return await self.manager.send_blocking(json.dumps(message), websocket)
+
+    async def _stream(self, websocket: WebSocket, stream_id: str, pod_name: str, namespace: Optional[str],
+                      options: Dict[str, Any]):
+        base = {"stream_id": stream_id, "pod_name": pod_name}
+        lines = self.k8s_ops.astream_logs(pod_name, namespace, **options)
+        try:
+            async for batch in LogBuffer(lines).batches():
+                if not await self._send(websocket, {"type": "log_lines", **base, "lines": batch}):
+                    return
+            await self._send(websocket, {"type": "log_end", **base})
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            await self._send(websocket, {"type": "error", **base, "message": f"Log stream failed: {str(e)}"})
+
+    def close(self):
+        for websocket in list(self.streams):
+            self.unsubscribe(websocket)
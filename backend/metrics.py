@@ -0,0 +1,125 @@
+"""
+Prometheus metrics for the FastAPI backend.
+
+Route latency and in-flight requests are recorded by MetricsMiddleware;
+cache, executor and WebSocket figures are read from their metrics() at
+scrape time. kubectl, API request and tool metrics are defined in k8s.py
+and end up in the same default registry.
+"""
+import time
+from typing import Any, Dict, Iterator
+
+try:
+    from prometheus_client import CONTENT_TYPE_LATEST, REGISTRY, Gauge, Histogram, generate_latest
+    from prometheus_client.core import CounterMetricFamily, GaugeMetricFamily
+    PROMETHEUS_AVAILABLE = True
+except ImportError:
+    PROMETHEUS_AVAILABLE = False
+    CONTENT_TYPE_LATEST = "text/plain; version=0.0.4; charset=utf-8"
+
+from k8s import LATENCY_BUCKETS
+
+if PROMETHEUS_AVAILABLE:
+    HTTP_REQUEST_SECONDS = Histogram(
+        "k8s_agent_http_request_duration_seconds",
+        "Latency of HTTP requests by route template",
+        ["method", "route", "status"],
+        buckets=LATENCY_BUCKETS
+    )
+    HTTP_IN_FLIGHT = Gauge(
+        "k8s_agent_http_requests_in_flight",
+        "HTTP requests currently being served"
+    )
+
+
+class MetricsMiddleware:
+    """ASGI middleware timing each HTTP request.
+
+    Requests are labelled with the matched route template, for example
+    /api/resources/{resource_type}, so path parameters do not create new
+    series. Streaming responses are timed until their last chunk is sent.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not PROMETHEUS_AVAILABLE:
+            await self.app(scope, receive, send)
+            return
+
+        status = 500
+
+        async def send_with_status(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        HTTP_IN_FLIGHT.inc()
+        start = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            HTTP_IN_FLIGHT.dec()
+            route = getattr(scope.get("route"), "path", None) or "unmatched"
+            HTTP_REQUEST_SECONDS.labels(scope["method"], route, str(status)).observe(time.perf_counter() - start)
+
+
+class BackendCollector:
+    """Exposes the response cache, executor and WebSocket manager figures"""
+
+    def __init__(self, cache, executor, manager):
+        self.cache = cache
+        self.executor = executor
+        self.manager = manager
+
+    @staticmethod
+    def _gauge(name: str, documentation: str, value: Any):
+        return GaugeMetricFamily(name, documentation, value=value)
+
+    @staticmethod
+    def _counter(name: str, documentation: str, value: Any):
+        return CounterMetricFamily(name, documentation, value=value)
+
+    def collect(self) -> Iterator[Any]:
+        cache: Dict[str, Any] = self.cache.metrics()
+        yield self._counter("k8s_agent_cache_hits", "Response cache hits", cache["hits"])
+        yield self._counter("k8s_agent_cache_misses", "Response cache misses", cache["misses"])
+        yield self._counter("k8s_agent_cache_coalesced", "Requests that joined an in-flight computation",
+                            cache["coalesced"])
+        yield self._counter("k8s_agent_cache_evictions", "Entries evicted from the response cache",
+                            cache["evictions"])
+        yield self._gauge("k8s_agent_cache_entries", "Entries in the response cache", cache["entries"])
+        yield self._gauge("k8s_agent_cache_hit_ratio", "Share of lookups answered without a new upstream call",
+                          cache["hit_rate"])
+
+        executor: Dict[str, Any] = self.executor.metrics()
+        yield self._gauge("k8s_agent_executor_queue_depth", "Blocking calls waiting for a worker",
+                          executor["queue_depth"])
+        yield self._gauge("k8s_agent_executor_running", "Blocking calls running", executor["running"])
+        yield self._counter("k8s_agent_executor_completed", "Blocking calls completed", executor["completed"])
+        yield self._counter("k8s_agent_executor_rejected", "Blocking calls rejected with a full queue",
+                            executor["rejected"])
+
+        websockets: Dict[str, Any] = self.manager.metrics()
+        yield self._gauge("k8s_agent_websocket_connections", "Open WebSocket connections",
+                          websockets["active_connections"])
+        yield self._gauge("k8s_agent_websocket_queued_messages", "Messages waiting in WebSocket send queues",
+                          websockets["queued_messages"])
+        yield self._counter("k8s_agent_websocket_sent_messages", "Messages sent over WebSockets",
+                            websockets["sent_messages"])
+        yield self._counter("k8s_agent_websocket_dropped_messages", "Messages dropped for slow consumers",
+                            websockets["dropped_messages"])
+        yield self._counter("k8s_agent_websocket_slow_disconnects", "Clients disconnected as slow consumers",
+                            websockets["slow_disconnects"])
+
+
+def register_backend_collector(cache, executor, manager):
+    if PROMETHEUS_AVAILABLE:
+        REGISTRY.register(BackendCollector(cache, executor, manager))
+
+
+def render_metrics() -> bytes:
+    """The default registry in the Prometheus text format"""
+    return generate_latest(REGISTRY)
@@ -0,0 +1,57 @@
+"""
+Rollout progress streams for the /ws endpoint
+"""
+import asyncio
+import json
+from datetime import datetime
+from typing import Any, Dict, Optional, Set
+
+from fastapi import WebSocket
+
+from connections import ConnectionManager
+from k8s import K8sOperations
+
+
+class RolloutStreamHub:
+    """Runs rollout_watch requests and sends their progress to the requesting client.
+
+    Waits go through K8sOperations.await_rollout, so every watched
+    deployment in a namespace shares the same informer watch.
+    """
+
+    def __init__(self, k8s_ops: K8sOperations, manager: ConnectionManager):
+        self.k8s_ops = k8s_ops
+        self.manager = manager
+        self.tasks: Dict[WebSocket, Set[asyncio.Task]] = {}
+
+    def watch(self, websocket: WebSocket, name: str, namespace: Optional[str] = None, timeout: float = None):
+        task = asyncio.create_task(self._watch(websocket, name, namespace, timeout))
+        tasks = self.tasks.setdefault(websocket, set())
+        tasks.add(task)
+        task.add_done_callback(tasks.discard)
+
+    async def _send(self, websocket: WebSocket, message: Dict[str, Any]):
+        message["timestamp"] = datetime.now().isoformat()
+        # A later progress message supersedes a dropped one; the result and errors have no successor
+        droppable = message["type"] == "rollout_progress"
+        await self.manager.send_personal_message(json.dumps(message), websocket, droppable)
+
+    async def _watch(self, websocket: WebSocket, name: str, namespace: Optional[str], timeout: float):
+        async def progress(status: Dict[str, Any]):
+            await self._send(websocket, {"type": "rollout_progress", **status})
+        
+        try:
+            status = await self.k8s_ops.await_rollout(name, namespace, timeout, progress)
+            await self._send(websocket, {"type": "rollout_result", **status})
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            await self._send(websocket, {"type": "error", "name": name, "message": f"Rollout watch failed: {str(e)}"})
+
+    def cancel(self, websocket: WebSocket):
+        for task in self.tasks.pop(websocket, set()):
+            task.cancel()
+
+    def close(self):
+        for websocket in list(self.tasks):
+            self.cancel(websocket)
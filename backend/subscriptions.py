@@ -0,0 +1,161 @@
+"""
+Resource change subscriptions for the /ws endpoint.
+
+Each (resource type, namespace) pair is backed by the shared informer of
+K8sOperations, so one upstream watch serves every subscribed client.
+"""
+import asyncio
+import json
+from datetime import datetime
+from typing import Any, Dict, Optional, Tuple
+
+from fastapi import WebSocket
+
+from connections import ConnectionManager
+from k8s import K8sOperations, ResourceError, resolve_resource_kind
+
+
+def _object_key(obj: Dict[str, Any]) -> str:
+    metadata = obj.get("metadata", {})
+    return f"{metadata.get('namespace', '')}/{metadata.get('name', '')}"
+
+
+def _version(obj: Dict[str, Any]) -> str:
+    return obj.get("metadata", {}).get("resourceVersion", "")
+
+
+def _stale(version: str, seen: str, inclusive: bool) -> bool:
+    """Whether version is before (or, when inclusive, at) seen; resourceVersions that are not integers only compare equal"""
+    try:
+        return int(version) <= int(seen) if inclusive else int(version) < int(seen)
+    except ValueError:
+        return inclusive and version == seen
+
+
+class _Topic:
+    """Subscribers of one collection plus the queue that orders its events.
+
+    Each subscriber maps to the resourceVersion it last saw per object,
+    starting from its snapshot.
+    """
+
+    def __init__(self, resource: str, namespace: Optional[str]):
+        self.resource = resource
+        self.namespace = namespace
+        self.subscribers: Dict[WebSocket, Dict[str, str]] = {}
+        self.queue: asyncio.Queue = asyncio.Queue()
+        self.pump: Optional[asyncio.Task] = None
+        self.handler = None
+
+
+class ResourceEventHub:
+    """Fans informer events out to subscribed WebSockets.
+
+    Subscribers first receive a resource_snapshot message with the current
+    rows, then resource_event messages carrying ADDED, MODIFIED or DELETED
+    deltas in the order the watch delivered them. The informer updates its
+    store before its handlers run, so deltas still queued when a snapshot
+    is taken may already be part of it; those are dropped for that
+    subscriber by comparing resourceVersions.
+    """
+
+    def __init__(self, k8s_ops: K8sOperations, manager: ConnectionManager):
+        self.k8s_ops = k8s_ops
+        self.manager = manager
+        self.topics: Dict[Tuple[str, Optional[str]], _Topic] = {}
+
+    def _key(self, resource: str, namespace: Optional[str]) -> Tuple[str, Optional[str]]:
+        if self.k8s_ops.informers is None or not self.k8s_ops.informers.supports(resource):
+            raise ResourceError(f"Subscriptions for '{resource}' need the api backend with K8S_INFORMER_CACHE enabled")
+        kind = resolve_resource_kind(resource)
+        namespace = (namespace or self.k8s_ops.config.namespace) if kind.namespaced else None
+        return kind.plural, namespace
+
+    async def subscribe(self, websocket: WebSocket, resource: str, namespace: Optional[str] = None):
+        key = self._key(resource, namespace)
+        informer = self.k8s_ops.informers.informer(*key)
+        if not informer.synced.is_set():
+            await asyncio.to_thread(informer.wait_for_sync, self.k8s_ops.config.timeout)
+
+        topic = self.topics.get(key)
+        if topic is None:
+            topic = _Topic(*key)
+            loop = asyncio.get_running_loop()
+            topic.handler = lambda event_type, obj: loop.call_soon_threadsafe(
+                topic.queue.put_nowait, (event_type, obj)
+            )
+            topic.pump = asyncio.create_task(self._pump(topic))
+            informer.add_handler(topic.handler)
+            self.topics[key] = topic
+
+        # Listed after the handler is registered, so no change falls between the two
+        items = informer.list()
+        topic.subscribers[websocket] = {_object_key(item): _version(item) for item in items}
+
+        await self.manager.send_personal_message(json.dumps({
+            "type": "resource_snapshot",
+            "resource": topic.resource,
+            "namespace": topic.namespace,
+            # What the client asked for, so it can pair the snapshot with its subscription
+            "requested_namespace": namespace or None,
+            "items": K8sOperations.summarize_items({"items": items}, topic.resource),
+            "timestamp": datetime.now().isoformat()
+        }), websocket, droppable=False)
+
+    def unsubscribe(self, websocket: WebSocket, resource: str = None, namespace: Optional[str] = None):
+        """Remove one subscription, or all of them when resource is None"""
+        if resource is None:
+            keys = [key for key, topic in self.topics.items() if websocket in topic.subscribers]
+        else:
+            keys = [self._key(resource, namespace)]
+        for key in keys:
+            topic = self.topics.get(key)
+            if topic is None:
+                continue
+            topic.subscribers.pop(websocket, None)
+            if not topic.subscribers:
+                self._close_topic(key, topic)
+
+    def _close_topic(self, key, topic: _Topic):
+        self.topics.pop(key, None)
+        self.k8s_ops.informers.informer(*key).remove_handler(topic.handler)
+        topic.pump.cancel()
+
+    @staticmethod
+    def _is_new(seen: Dict[str, str], event_type: str, obj: Dict[str, Any]) -> bool:
+        """Record the delta for one subscriber unless its snapshot or an earlier delta already covered it"""
+        key, version = _object_key(obj), _version(obj)
+        if event_type == "DELETED":
+            # A relist reports deletions with the last version it had cached
+            if key not in seen or _stale(version, seen[key], inclusive=False):
+                return False
+            del seen[key]
+            return True
+        if key in seen and _stale(version, seen[key], inclusive=True):
+            return False
+        seen[key] = version
+        return True
+
+    async def _pump(self, topic: _Topic):
+        while True:
+            event_type, obj = await topic.queue.get()
+            recipients = [
+                websocket for websocket, seen in topic.subscribers.items()
+                if self._is_new(seen, event_type, obj)
+            ]
+            if not recipients:
+                continue
+            message = json.dumps({
+                "type": "resource_event",
+                "event": event_type,
+                "resource": topic.resource,
+                "namespace": topic.namespace,
+                "object": K8sOperations.project_object(obj, topic.resource),
+                "timestamp": datetime.now().isoformat()
+            })
+            # A lost delta would leave the client's copy wrong for good
+            await self.manager.send_many(message, recipients, droppable=False)
+
+    def close(self):
+        for key, topic in list(self.topics.items()):
+            self._close_topic(key, topic)
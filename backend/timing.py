@@ -0,0 +1,69 @@
+"""
+Per-request phase breakdown for /api/* responses and /ws chat replies.
+
+Phases are collected by k8s.collect_timings: intent planning, input validation, YAML
+rendering, cluster I/O (kubectl and API calls), terminal UI rendering and
+JSON serialization. HTTP responses carry them in a Server-Timing header,
+which browser devtools show in the request's Timing tab.
+"""
+import time
+from typing import Any, Dict
+
+from fastapi.responses import JSONResponse
+
+from k8s import PhaseTimings, collect_timings, timed_phase
+
+PHASES = {
+    "plan": "Intent planning",
+    "validate": "Input validation",
+    "render": "YAML generation",
+    "cluster": "kubectl and API calls",
+    "ui": "UI rendering",
+    "serialize": "JSON serialization",
+}
+
+
+def timings_ms(timings: PhaseTimings, total: float) -> Dict[str, float]:
+    """Phase durations in milliseconds, plus the total"""
+    result = {phase: round(timings[phase] * 1000, 3) for phase in PHASES if phase in timings}
+    result["total"] = round(total * 1000, 3)
+    return result
+
+
+def server_timing_header(timings: PhaseTimings, total: float) -> str:
+    entries = [f'{phase};desc="{PHASES.get(phase, phase)}";dur={ms}'
+               for phase, ms in timings_ms(timings, total).items() if phase != "total"]
+    entries.append(f"total;dur={round(total * 1000, 3)}")
+    return ", ".join(entries)
+
+
+class TimedJSONResponse(JSONResponse):
+    """JSONResponse whose encoding counts toward the serialize phase"""
+
+    def render(self, content: Any) -> bytes:
+        with timed_phase("serialize"):
+            return super().render(content)
+
+
+class ServerTimingMiddleware:
+    """ASGI middleware adding a Server-Timing header to responses under prefix"""
+
+    def __init__(self, app, prefix: str = "/api/"):
+        self.app = app
+        self.prefix = prefix
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not scope["path"].startswith(self.prefix):
+            await self.app(scope, receive, send)
+            return
+
+        start = time.perf_counter()
+        with collect_timings() as timings:
+            async def send_with_timing(message):
+                if message["type"] == "http.response.start":
+                    header = server_timing_header(timings, time.perf_counter() - start)
+                    message = {**message, "headers": [*message.get("headers", []),
+                                                      (b"server-timing", header.encode("latin-1"))]}
+                await send(message)
+
+            await self.app(scope, receive, send_with_timing)
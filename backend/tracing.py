@@ -0,0 +1,61 @@
+"""
+Request spans for the FastAPI backend.
+
+Each HTTP request opens a server span that becomes the parent of the
+agent, tool and kubectl spans created while it is handled. A W3C
+traceparent header from the caller continues the caller's trace.
+"""
+import re
+from typing import Optional, Tuple
+
+from k8s import tracer
+
+TRACEPARENT = re.compile(r"^00-([0-9a-f]{32})-([0-9a-f]{16})-([0-9a-f]{2})$")
+
+
+def parse_traceparent(value: Optional[str]) -> Optional[Tuple[str, str, bool]]:
+    """(trace_id, parent span id, sampled) from a traceparent header, or None"""
+    match = TRACEPARENT.match((value or "").strip().lower())
+    if match is None:
+        return None
+    trace_id, span_id, flags = match.groups()
+    return trace_id, span_id, bool(int(flags, 16) & 1)
+
+
+class TracingMiddleware:
+    """ASGI middleware opening a server span around each HTTP request"""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not tracer.enabled:
+            await self.app(scope, receive, send)
+            return
+
+        headers = dict(scope.get("headers") or [])
+        parent = parse_traceparent(headers.get(b"traceparent", b"").decode("latin-1"))
+        status = 500
+
+        async def send_with_status(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        with tracer.span(f"{scope['method']} {scope['path']}", kind="server", parent=parent) as span:
+            try:
+                await self.app(scope, receive, send_with_status)
+            finally:
+                route = getattr(scope.get("route"), "path", None)
+                if span.sampled:
+                    if route:
+                        span.name = f"{scope['method']} {route}"
+                    span.set_attributes({
+                        "http.request.method": scope["method"],
+                        "http.route": route,
+                        "url.path": scope["path"],
+                        "http.response.status_code": status
+                    })
+                    if status >= 500:
+                        span.set_error(f"HTTP {status}")
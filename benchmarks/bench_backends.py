@@ -0,0 +1,94 @@
+"""
+Compare K8sOperations backends against the same local stand-in API server.
+
+Usage:
+    python benchmarks/bench_backends.py --iterations 50 --items 100
+    python benchmarks/bench_backends.py --json results.json
+
+The proxy and kubectl backends are only measured when a kubectl binary is on PATH.
+"""
+import argparse
+import json
+import os
+import shutil
+import statistics
+import sys
+import time
+from typing import Callable, Dict, List
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from fake_apiserver import FakeAPIServer  # noqa: E402
+from k8s import HeadlessUI, K8sConfig, K8sOperations, generate_deployment_yaml  # noqa: E402
+
+
+def summarize(samples: List[float]) -> Dict[str, float]:
+    """Latency summary in milliseconds"""
+    ordered = sorted(samples)
+    return {
+        "count": len(ordered),
+        "mean_ms": round(statistics.mean(ordered) * 1000, 3),
+        "p50_ms": round(ordered[len(ordered) // 2] * 1000, 3),
+        "p95_ms": round(ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))] * 1000, 3),
+        "max_ms": round(ordered[-1] * 1000, 3),
+    }
+
+
+def measure(fn: Callable[[], object], iterations: int, warmup: int = 2) -> Dict[str, float]:
+    for _ in range(warmup):
+        fn()
+    samples = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - start)
+    return summarize(samples)
+
+
+def bench_backend(backend: str, iterations: int) -> Dict[str, Dict[str, float]]:
+    ops = K8sOperations(K8sConfig(backend=backend), HeadlessUI())
+    manifest = generate_deployment_yaml("bench", "nginx", replicas=1)
+    try:
+        return {
+            "list_resources": measure(lambda: ops.list_resources("pods", "default"), iterations),
+            "get_logs": measure(lambda: ops.get_logs("app0-pod", "default", 100), iterations),
+            "describe_resource": measure(lambda: ops.describe_resource("deployment", "app0-dep", "default"), iterations),
+            "scale_deployment": measure(lambda: ops.scale_deployment("app0-dep", 3, "default"), iterations),
+            "apply_yaml": measure(lambda: ops.apply_yaml(manifest), iterations),
+        }
+    finally:
+        ops.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark K8sOperations backends")
+    parser.add_argument("--iterations", type=int, default=30, help="Timed calls per operation")
+    parser.add_argument("--items", type=int, default=50, help="Objects of each kind in the fake cluster")
+    parser.add_argument("--json", dest="json_path", help="Write results to this file as JSON")
+    args = parser.parse_args()
+
+    backends = ["api"]
+    if shutil.which("kubectl"):
+        backends.extend(["proxy", "kubectl"])
+    else:
+        print("kubectl not found on PATH, skipping proxy and kubectl backends")
+
+    results = {"iterations": args.iterations, "items": args.items, "backends": {}}
+    with FakeAPIServer(items=args.items) as server:
+        os.environ["KUBECONFIG"] = server.write_kubeconfig()
+        for backend in backends:
+            results["backends"][backend] = bench_backend(backend, args.iterations)
+
+    print(f"{'backend':<10}{'operation':<20}{'p50 ms':>10}{'p95 ms':>10}{'mean ms':>10}")
+    for backend, operations in results["backends"].items():
+        for operation, stats in operations.items():
+            print(f"{backend:<10}{operation:<20}{stats['p50_ms']:>10}{stats['p95_ms']:>10}{stats['mean_ms']:>10}")
+
+    if args.json_path:
+        with open(args.json_path, "w") as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,113 @@
+"""
+Plans of the rule engine for known inputs, and planning latency.
+
+Every case lists the tool calls RulePlanner must produce, or None when
+the input has to be left to the plan cache and the LLM (joined clauses,
+verbs no rule implements, missing arguments). Rules run before the cache
+and the LLM and their plans go straight to the cluster, so a wrong plan
+here is a wrong change there. Exits non-zero when a plan differs or a
+rule or cache lookup exceeds its latency budget.
+
+Usage:
+    python benchmarks/bench_planner.py
+    python benchmarks/bench_planner.py --iterations 50000 --budget-us 100
+"""
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from k8s import PlanCache, PlannedCall, RulePlanner, normalize_prompt  # noqa: E402
+
+CASES = [
+    ("help", [("help", {})]),
+    ("h", [("help", {})]),
+    ("create deployment web with nginx", [("create_deployment", {"name": "web", "image": "nginx"})]),
+    ("Create a deployment named 'webapp' with nginx image and 3 replicas",
+     [("create_deployment", {"name": "webapp", "image": "nginx", "replicas": 3})]),
+    ("Create a deployment called 'api' using the 'node:18' image with 2 replicas",
+     [("create_deployment", {"name": "api", "image": "node:18", "replicas": 2})]),
+    # Tagged images: the tag is neither a replica count nor the name
+    ("create deployment nginx-web with image nginx:1.25 replicas 2",
+     [("create_deployment", {"name": "nginx-web", "image": "nginx:1.25", "replicas": 2})]),
+    ("create deployment web image nginx:1.25 replicas=2",
+     [("create_deployment", {"name": "web", "image": "nginx:1.25", "replicas": 2})]),
+    ("create a deployment named api using registry.local:5000/api:2.1 with 3 replicas",
+     [("create_deployment", {"name": "api", "image": "registry.local:5000/api:2.1", "replicas": 3})]),
+    ("create deployment web using nginx:1.25 with 2 replicas on port 8080",
+     [("create_deployment", {"name": "web", "image": "nginx:1.25", "replicas": 2, "port": 8080})]),
+    ("create a deployment named my-web-app with image nginx:1.25 and 3 replicas in the staging namespace and wait",
+     [("create_deployment", {"name": "my-web-app", "image": "nginx:1.25", "replicas": 3, "namespace": "staging",
+                             "wait": True})]),
+    ("Scale the 'webapp' deployment to 5 replicas", [("scale_deployment", {"name": "webapp", "replicas": 5})]),
+    ("scale deployment api-v2 to 4 replicas -n prod",
+     [("scale_deployment", {"name": "api-v2", "replicas": 4, "namespace": "prod"})]),
+    ("create a nodeport service for web-app port 8080 target port 80",
+     [("create_service", {"name": "web-app", "port": 8080, "target_port": 80, "service_type": "NodePort"})]),
+    ("list deployments in namespace production",
+     [("list_resources", {"resource_type": "deployments", "namespace": "production"})]),
+    ("Get the last 50 lines of logs from pod 'api-xxx'", [("get_logs", {"pod_name": "api-xxx", "lines": 50})]),
+    ("show logs for deployment web-app", [("get_logs", {"deployment": "web-app"})]),
+    # Left to the cache and the LLM
+    ("create deployment web with image nginx and then scale it to 10", None),
+    ("create deployment web with nginx; list pods", None),
+    ("delete the web deployment and list pods", None),
+    ("create a deployment please", None),
+]
+
+
+def check_cases() -> int:
+    rules, failures = RulePlanner(), 0
+    for text, expected in CASES:
+        plan = rules.plan(text)
+        got = None if plan is None else [(call.tool, call.args) for call in plan]
+        if got != expected:
+            failures += 1
+            print(f"WRONG PLAN  {text!r}\n  expected {expected}\n  got      {got}")
+    print(f"{len(CASES) - failures}/{len(CASES)} plans as expected")
+    return failures
+
+
+def per_call_us(fn, iterations: int) -> float:
+    start = time.perf_counter()
+    for _ in range(iterations):
+        fn()
+    return round((time.perf_counter() - start) / iterations * 1e6, 1)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Check rule plans and measure planning latency")
+    parser.add_argument("--iterations", type=int, default=20000, help="Lookups per latency measurement")
+    parser.add_argument("--budget-us", type=float, default=200, help="Largest acceptable microseconds per lookup")
+    args = parser.parse_args()
+
+    failures = check_cases()
+
+    rules, cache = RulePlanner(), PlanCache()
+    key, entities = normalize_prompt("bounce web 3 times")
+    cache.put(key, entities, [PlannedCall("restart", {"name": "web", "count": 3})])
+
+    def cache_lookup(text="bounce api-v2 7 times"):
+        return cache.get(*normalize_prompt(text))
+
+    if cache_lookup() is None:
+        failures += 1
+        print("CACHE MISS  a prompt of the same shape did not reuse the stored plan")
+
+    timings = {
+        "rule": per_call_us(lambda: rules.plan("scale deployment web-app to 3 replicas"), args.iterations),
+        "cache": per_call_us(cache_lookup, args.iterations),
+    }
+    for name, us in timings.items():
+        over = us > args.budget_us
+        failures += over
+        print(f"{name:<8}{us:>8} us per lookup{'  OVER BUDGET' if over else ''}")
+
+    if failures:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
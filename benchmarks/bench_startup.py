@@ -0,0 +1,114 @@
+"""
+Start-up time of the CLI and the web backend, checked against a budget.
+
+Each scenario runs in a fresh interpreter, so the wall time includes
+interpreter start-up and every import. A scenario fails when its median
+exceeds its budget or when it imports a module that must only load on
+first use (k8s.DEFERRED_MODULES; the agent scenario may load the
+kubernetes client, which the api backend needs for its kubeconfig).
+
+Usage:
+    python benchmarks/bench_startup.py --runs 5
+    python benchmarks/bench_startup.py --budget import=600 agent=900 --json startup.json
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+from typing import Dict, List
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from fake_apiserver import FakeAPIServer  # noqa: E402
+
+REPORT_DEFERRED = "import sys; print(','.join(m for m in k8s.DEFERRED_MODULES if m in sys.modules))"
+AGENT_DEFERRED = ("langchain_google_genai", "httpx", "rich.syntax", "rich.table", "rich.progress")
+
+# name: (working directory, interpreter arguments, modules it must not import, budget in ms)
+SCENARIOS = {
+    "import": (ROOT, ["-c", "import k8s; " + REPORT_DEFERRED], None, 900),
+    "cli_help": (ROOT, ["k8s.py", "--help"], (), 900),
+    "agent": (ROOT, ["-c", "import k8s; agent = k8s.K8sAgent(k8s.load_config(), k8s.HeadlessUI()); "
+                           "agent.k8s_ops.close(); " + REPORT_DEFERRED], AGENT_DEFERRED, 1200),
+    "backend_import": (os.path.join(ROOT, "backend"), ["-c", "import main"], (), 1500),
+}
+
+
+def run_scenario(cwd: str, args: List[str], runs: int) -> Dict[str, object]:
+    samples, deferred = [], set()
+    for _ in range(runs):
+        start = time.perf_counter()
+        result = subprocess.run([sys.executable] + args, cwd=cwd, capture_output=True, text=True, timeout=120)
+        samples.append(time.perf_counter() - start)
+        if result.returncode != 0:
+            raise RuntimeError(f"{' '.join(args)} failed: {result.stderr.strip()[-500:]}")
+        last_line = result.stdout.strip().splitlines()[-1:] or [""]
+        deferred.update(module for module in last_line[0].split(",") if module)
+    ordered = sorted(samples)
+    return {
+        "runs": runs,
+        "median_ms": round(statistics.median(ordered) * 1000, 1),
+        "min_ms": round(ordered[0] * 1000, 1),
+        "max_ms": round(ordered[-1] * 1000, 1),
+        "deferred_loaded": sorted(deferred),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure start-up time against a budget")
+    parser.add_argument("--runs", type=int, default=5, help="Fresh interpreters per scenario")
+    parser.add_argument("--budget", nargs="+", default=[], metavar="SCENARIO=MS",
+                        help=f"Override budgets; scenarios: {', '.join(SCENARIOS)}")
+    parser.add_argument("--only", nargs="+", choices=list(SCENARIOS), default=list(SCENARIOS))
+    parser.add_argument("--json", dest="json_path", help="Write results to this file as JSON")
+    args = parser.parse_args()
+
+    budgets = {name: scenario[3] for name, scenario in SCENARIOS.items()}
+    for override in args.budget:
+        name, _, ms = override.partition("=")
+        if name not in SCENARIOS:
+            parser.error(f"unknown scenario '{name}'")
+        budgets[name] = float(ms)
+
+    results, failures = {}, []
+    print(f"{'scenario':<16}{'median ms':>11}{'min ms':>9}{'max ms':>9}{'budget':>9}  status")
+    with FakeAPIServer(items=5) as api_server:
+        # The agent scenario connects to a local stand-in instead of a real cluster
+        env_backup = os.environ.get("KUBECONFIG")
+        os.environ["KUBECONFIG"] = api_server.write_kubeconfig()
+        try:
+            for name in args.only:
+                cwd, command, deferred, _ = SCENARIOS[name]
+                result = run_scenario(cwd, command, args.runs)
+                result["budget_ms"] = budgets[name]
+                problems = []
+                if result["median_ms"] > budgets[name]:
+                    problems.append("over budget")
+                loaded = [module for module in result["deferred_loaded"] if deferred is None or module in deferred]
+                if loaded:
+                    problems.append(f"imported {', '.join(loaded)}")
+                result["ok"] = not problems
+                results[name] = result
+                failures.extend(f"{name}: {problem}" for problem in problems)
+                print(f"{name:<16}{result['median_ms']:>11}{result['min_ms']:>9}{result['max_ms']:>9}"
+                      f"{budgets[name]:>9}  {'; '.join(problems) or 'ok'}")
+        finally:
+            if env_backup is None:
+                os.environ.pop("KUBECONFIG", None)
+            else:
+                os.environ["KUBECONFIG"] = env_backup
+
+    if args.json_path:
+        with open(args.json_path, "w") as f:
+            json.dump({"python": sys.version.split()[0], "results": results}, f, indent=2)
+    if failures:
+        print("FAILED: " + "; ".join(failures))
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,284 @@
+"""
+Latency and throughput of the hot paths at several concurrency levels.
+
+Runs offline against local stand-ins:
+
+- K8sOperations list_resources, apply_yaml and get_logs with the api
+  backend against FakeAPIServer and with the kubectl backend against a
+  fake kubectl replaying recorded responses (see fake_kubectl.py)
+- the FastAPI backend served by uvicorn on a loopback port: the /api/*
+  routes over HTTP and chat round-trips over /ws
+
+Results are written as JSON so runs can be diffed.
+
+Usage:
+    python benchmarks/bench_suite.py --concurrency 1 8 32 --requests 200 --json results.json
+    python benchmarks/bench_suite.py --only ops --backends api
+    python benchmarks/bench_suite.py --compare baseline.json results.json --threshold 0.2
+"""
+import argparse
+import asyncio
+import json
+import os
+import platform
+import socket
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from typing import Any, Awaitable, Callable, Dict, List
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.join(ROOT, "backend"))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from bench_backends import summarize  # noqa: E402
+from fake_apiserver import FakeAPIServer  # noqa: E402
+from fake_kubectl import install as install_fake_kubectl  # noqa: E402
+
+SUITES = ("ops", "routes", "ws")
+
+
+async def run_load(call: Callable[[], Awaitable[Any]], requests: int, concurrency: int) -> Dict[str, Any]:
+    """Issue requests calls from concurrency workers; report latency and throughput"""
+    samples: List[float] = []
+    errors = 0
+    remaining = requests
+
+    async def worker():
+        nonlocal remaining, errors
+        while remaining > 0:
+            remaining -= 1
+            start = time.perf_counter()
+            try:
+                await call()
+            except Exception:
+                errors += 1
+                continue
+            samples.append(time.perf_counter() - start)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - started
+    result = summarize(samples) if samples else {"count": 0}
+    result.update({
+        "errors": errors,
+        "elapsed_s": round(elapsed, 3),
+        "throughput_rps": round(len(samples) / elapsed, 2) if elapsed else 0.0,
+    })
+    return result
+
+
+def _record(results: List[Dict[str, Any]], suite: str, target: str, concurrency: int, stats: Dict[str, Any], **labels):
+    results.append({"suite": suite, "target": target, "concurrency": concurrency, **labels, **stats})
+    print(f"{suite:<8}{target:<28}{labels.get('backend', ''):<9}{concurrency:>5}"
+          f"{stats.get('p50_ms', '-'):>10}{stats.get('p95_ms', '-'):>10}{stats['throughput_rps']:>10}{stats['errors']:>7}")
+
+
+async def bench_ops(backend: str, levels: List[int], requests: int, results: List[Dict[str, Any]]):
+    from k8s import HeadlessUI, K8sConfig, K8sOperations, generate_deployment_yaml
+
+    ops = K8sOperations(K8sConfig(backend=backend), HeadlessUI())
+    manifest = generate_deployment_yaml("bench", "nginx", replicas=1)
+    targets = {
+        "list_resources": lambda: ops.alist_resources("pods", "default"),
+        "apply_yaml": lambda: ops.aapply_yaml(manifest),
+        "get_logs": lambda: ops.aget_logs("app0-pod", "default", 100),
+    }
+    try:
+        for target, call in targets.items():
+            await call()  # warm-up
+            for concurrency in levels:
+                stats = await run_load(call, requests, concurrency)
+                _record(results, "ops", target, concurrency, stats, backend=backend)
+    finally:
+        ops.close()
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+class BackendServer:
+    """The FastAPI app served by uvicorn on a background thread"""
+
+    def __init__(self):
+        import uvicorn
+        import main as backend_main
+
+        self.port = _free_port()
+        self.server = uvicorn.Server(uvicorn.Config(backend_main.app, host="127.0.0.1", port=self.port,
+                                                    log_level="warning"))
+        self.thread = threading.Thread(target=self.server.run, daemon=True)
+
+    def __enter__(self):
+        self.thread.start()
+        deadline = time.monotonic() + 30
+        while not self.server.started:
+            if time.monotonic() > deadline or not self.thread.is_alive():
+                raise RuntimeError("backend server did not start")
+            time.sleep(0.05)
+        return self
+
+    def __exit__(self, *exc):
+        self.server.should_exit = True
+        self.thread.join(10)
+
+
+async def bench_routes(base_url: str, levels: List[int], requests: int, results: List[Dict[str, Any]]):
+    import httpx
+
+    targets = {
+        "GET /api/status": ("GET", "/api/status", None),
+        "GET /api/resources/pods": ("GET", "/api/resources/pods", None),
+        "POST /api/logs": ("POST", "/api/logs", {"pod_name": "app0-pod", "lines": 100}),
+        "POST /api/scale": ("POST", "/api/scale", {"name": "app0-dep", "replicas": 2}),
+    }
+    for concurrency in levels:
+        limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+        async with httpx.AsyncClient(base_url=base_url, limits=limits, timeout=60) as client:
+            for target, (method, path, body) in targets.items():
+                async def call(method=method, path=path, body=body):
+                    response = await client.request(method, path, json=body)
+                    response.raise_for_status()
+
+                await call()  # warm-up
+                stats = await run_load(call, requests, concurrency)
+                _record(results, "routes", target, concurrency, stats)
+
+
+async def bench_ws_chat(ws_url: str, levels: List[int], requests: int, results: List[Dict[str, Any]],
+                        message: str = "list pods"):
+    import websockets
+
+    for concurrency in levels:
+        connections = [await websockets.connect(ws_url, max_size=None) for _ in range(concurrency)]
+        idle = asyncio.Queue()
+        for connection in connections:
+            idle.put_nowait(connection)
+
+        async def call():
+            # Each connection carries one round-trip at a time
+            connection = await idle.get()
+            try:
+                await connection.send(json.dumps({"type": "chat", "message": message}))
+                while json.loads(await connection.recv()).get("type") not in ("response", "error"):
+                    pass
+            finally:
+                idle.put_nowait(connection)
+
+        try:
+            await call()  # warm-up
+            stats = await run_load(call, requests, concurrency)
+            _record(results, "ws", "chat round-trip", concurrency, stats)
+        finally:
+            await asyncio.gather(*(connection.close() for connection in connections))
+
+
+def _git_revision() -> str:
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=ROOT, capture_output=True,
+                              text=True, timeout=10).stdout.strip()
+    except Exception:
+        return ""
+
+
+def compare(baseline_path: str, current_path: str, threshold: float) -> int:
+    """Print per-target changes; return 1 when p50 or throughput regressed beyond threshold"""
+    with open(baseline_path) as f:
+        baseline = json.load(f)
+    with open(current_path) as f:
+        current = json.load(f)
+
+    def key(result):
+        return result["suite"], result["target"], result.get("backend", ""), result["concurrency"]
+
+    before = {key(result): result for result in baseline["results"]}
+    regressions = 0
+    print(f"{'target':<40}{'conc':>5}{'p50 ms':>18}{'rps':>20}")
+    for result in current["results"]:
+        old = before.get(key(result))
+        if old is None or not old.get("count") or not result.get("count"):
+            continue
+        p50_change = result["p50_ms"] / old["p50_ms"] - 1 if old["p50_ms"] else 0.0
+        rps_change = result["throughput_rps"] / old["throughput_rps"] - 1 if old["throughput_rps"] else 0.0
+        regressed = p50_change > threshold or rps_change < -threshold
+        regressions += regressed
+        name = f"{result['suite']} {result['target']} {result.get('backend', '')}".strip()
+        print(f"{name:<40}{result['concurrency']:>5}{old['p50_ms']:>8} -> {result['p50_ms']:<8}"
+              f"{old['throughput_rps']:>9} -> {result['throughput_rps']:<9}{'  REGRESSED' if regressed else ''}")
+    return 1 if regressions else 0
+
+
+async def run_suite(args) -> Dict[str, Any]:
+    results: List[Dict[str, Any]] = []
+    print(f"{'suite':<8}{'target':<28}{'backend':<9}{'conc':>5}{'p50 ms':>10}{'p95 ms':>10}{'rps':>10}{'errors':>7}")
+    with FakeAPIServer(items=args.items) as api_server:
+        os.environ["KUBECONFIG"] = api_server.write_kubeconfig()
+        if "kubectl" in args.backends:
+            # The fake kubectl replays generated responses unless real recordings are given
+            fake_bin = tempfile.mkdtemp(prefix="fake-kubectl-")
+            install_fake_kubectl(fake_bin, args.recordings, args.items)
+            os.environ["PATH"] = fake_bin + os.pathsep + os.environ["PATH"]
+
+        if "ops" in args.only:
+            for backend in args.backends:
+                await bench_ops(backend, args.concurrency, args.requests, results)
+
+        if "routes" in args.only or "ws" in args.only:
+            os.environ.setdefault("K8S_BACKEND", "api")
+            with BackendServer() as server:
+                if "routes" in args.only:
+                    await bench_routes(f"http://127.0.0.1:{server.port}", args.concurrency, args.requests, results)
+                if "ws" in args.only:
+                    await bench_ws_chat(f"ws://127.0.0.1:{server.port}/ws", args.concurrency, args.requests, results)
+
+    return {
+        "environment": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "git_revision": _git_revision(),
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        },
+        "parameters": {
+            "requests": args.requests,
+            "concurrency": args.concurrency,
+            "items": args.items,
+            "backends": args.backends,
+            "suites": args.only,
+        },
+        "results": results,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark K8sOperations and the FastAPI backend offline")
+    parser.add_argument("--requests", type=int, default=100, help="Requests per target and concurrency level")
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 8, 32], help="Concurrency levels")
+    parser.add_argument("--items", type=int, default=50, help="Objects of each kind in the fake cluster")
+    parser.add_argument("--backends", nargs="+", default=["api", "kubectl"], choices=["api", "kubectl"],
+                        help="K8sOperations backends for the ops suite")
+    parser.add_argument("--only", nargs="+", default=list(SUITES), choices=SUITES, help="Suites to run")
+    parser.add_argument("--recordings", help="kubectl recordings for the fake kubectl (see fake_kubectl.py)")
+    parser.add_argument("--json", dest="json_path", help="Write results to this file as JSON")
+    parser.add_argument("--compare", nargs=2, metavar=("BASELINE", "CURRENT"),
+                        help="Compare two result files instead of running")
+    parser.add_argument("--threshold", type=float, default=0.2,
+                        help="Relative p50 or throughput change counted as a regression")
+    args = parser.parse_args()
+
+    if args.compare:
+        sys.exit(compare(args.compare[0], args.compare[1], args.threshold))
+
+    report = asyncio.run(run_suite(args))
+    if args.json_path:
+        with open(args.json_path, "w") as f:
+            json.dump(report, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,452 @@
+"""
+Local stand-in Kubernetes API server for offline benchmarks.
+
+Serves an in-memory object store over HTTP/1.1 with keep-alive, so both the
+native API backend and a real kubectl binary can be pointed at it through a
+generated kubeconfig.
+"""
+import copy
+import json
+import os
+import tempfile
+import threading
+import time
+from collections import deque
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, urlparse
+
+import yaml
+
+KINDS = {
+    "pods": ("v1", "Pod"),
+    "services": ("v1", "Service"),
+    "configmaps": ("v1", "ConfigMap"),
+    "secrets": ("v1", "Secret"),
+    "events": ("v1", "Event"),
+    "namespaces": ("v1", "Namespace"),
+    "deployments": ("apps/v1", "Deployment"),
+}
+
+LOG_LINE = "2024-01-01T00:00:00.000000000Z GET /healthz 200 0.42ms\n"
+
+
+def _now() -> str:
+    return datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+def _make_object(plural: str, namespace: str, name: str) -> Dict[str, Any]:
+    api_version, kind = KINDS[plural]
+    obj = {
+        "apiVersion": api_version,
+        "kind": kind,
+        "metadata": {
+            "name": name,
+            "namespace": namespace,
+            "uid": f"{plural}-{namespace}-{name}",
+            "resourceVersion": "1",
+            "creationTimestamp": _now(),
+            "labels": {"app": name.rsplit("-", 1)[0]},
+        },
+    }
+    if plural == "pods":
+        obj["spec"] = {"nodeName": "node-1", "containers": [{"name": "app", "image": "nginx"}]}
+        obj["status"] = {"phase": "Running", "containerStatuses": [{"name": "app", "ready": True, "restartCount": 0}]}
+    elif plural == "deployments":
+        obj["spec"] = {"replicas": 2, "selector": {"matchLabels": {"app": name.rsplit("-", 1)[0]}}}
+        obj["status"] = {"replicas": 2, "readyReplicas": 2, "updatedReplicas": 2, "availableReplicas": 2}
+    elif plural == "services":
+        obj["spec"] = {"type": "ClusterIP", "clusterIP": "10.0.0.1", "ports": [{"port": 80, "targetPort": 80}]}
+    elif plural == "namespaces":
+        obj["metadata"].pop("namespace")
+        obj["status"] = {"phase": "Active"}
+    return obj
+
+
+def _api_groups() -> List[Dict[str, Any]]:
+    """APIGroupList entries for the groups in KINDS"""
+    versions = sorted({api_version for api_version, _ in KINDS.values() if "/" in api_version})
+    return [{"name": gv.split("/")[0], "versions": [{"groupVersion": gv, "version": gv.split("/")[1]}],
+             "preferredVersion": {"groupVersion": gv, "version": gv.split("/")[1]}} for gv in versions]
+
+
+def _api_resource_list(group_version: str) -> Dict[str, Any]:
+    """APIResourceList for one group version, as served by discovery"""
+    resources = [
+        {"name": plural, "singularName": kind.lower(), "kind": kind, "namespaced": plural != "namespaces",
+         "verbs": ["get", "list", "watch", "create", "update", "patch", "delete"]}
+        for plural, (api_version, kind) in KINDS.items() if api_version == group_version
+    ]
+    if group_version == "v1":
+        resources.append({"name": "pods/log", "kind": "Pod", "namespaced": True, "verbs": ["get"]})
+    return {"kind": "APIResourceList", "groupVersion": group_version, "resources": resources}
+
+
+def _field(obj: Dict[str, Any], path: str) -> Optional[str]:
+    """Value of a dotted field path such as spec.nodeName, as a string"""
+    value: Any = obj
+    for part in path.split("."):
+        value = value.get(part) if isinstance(value, dict) else None
+    return None if value is None else str(value)
+
+
+class ObjectStore:
+    """Thread-safe store of objects keyed by (plural, namespace, name)"""
+
+    def __init__(self, history: int = 1000):
+        self.lock = threading.Lock()
+        self.changed = threading.Condition(self.lock)
+        self.objects: Dict[Tuple[str, str, str], Dict[str, Any]] = {}
+        self.resource_version = 1
+        # Watch history; resourceVersions older than compacted_rv get 410 Gone
+        self.events = deque(maxlen=history)
+        self.compacted_rv = 0
+
+    def _record(self, event_type: str, plural: str, namespace: str, obj: Dict[str, Any]):
+        if len(self.events) == self.events.maxlen:
+            self.compacted_rv = self.events[0][0]
+        self.events.append((self.resource_version, event_type, plural, namespace, obj))
+        self.changed.notify_all()
+
+    def compact(self):
+        """Drop the watch history, forcing watchers to relist"""
+        with self.lock:
+            self.events.clear()
+            self.compacted_rv = self.resource_version
+
+    def wait_events(self, plural: str, namespace: Optional[str], since: int, timeout: float):
+        """Block until there are events newer than since; return (events, latest_rv)"""
+        with self.changed:
+            self.changed.wait_for(lambda: self.resource_version > since, timeout)
+            if since < self.compacted_rv:
+                return None, self.resource_version
+            events = [
+                (rv, event_type, obj) for rv, event_type, p, ns, obj in self.events
+                if rv > since and p == plural and (namespace is None or ns == namespace)
+            ]
+            return events, self.resource_version
+
+    def start_rollout(self, namespace: str, name: str, step: float = 0.02):
+        """Act as the deployment controller: move status one replica per step towards spec"""
+        def reconcile():
+            while True:
+                time.sleep(step)
+                with self.lock:
+                    obj = copy.deepcopy(self.objects.get(("deployments", namespace, name)))
+                if obj is None:
+                    return
+                desired = obj.get("spec", {}).get("replicas", 1)
+                status = obj.setdefault("status", {})
+                current = status.get("readyReplicas", 0)
+                generation = obj["metadata"].get("generation", 1)
+                if current == desired and status.get("observedGeneration") == generation:
+                    return
+                current += (current < desired) - (current > desired)
+                status.update(replicas=current, updatedReplicas=current, readyReplicas=current,
+                              availableReplicas=current, observedGeneration=generation)
+                self.put("deployments", namespace, name, obj)
+        
+        threading.Thread(target=reconcile, daemon=True).start()
+
+    def seed(self, namespace: str = "default", items: int = 50):
+        with self.lock:
+            self.objects[("namespaces", "", namespace)] = _make_object("namespaces", "", namespace)
+            for i in range(items):
+                for plural in ("pods", "deployments", "services"):
+                    name = f"app{i}-{plural[:3]}"
+                    self.objects[(plural, namespace, name)] = _make_object(plural, namespace, name)
+
+    def list(self, plural: str, namespace: Optional[str], label_selector: str = None,
+             field_selector: str = None) -> List[Dict[str, Any]]:
+        """Objects of a collection; both selectors support equality terms only"""
+        terms = [term.replace("==", "=").split("=", 1) for term in (label_selector or "").split(",") if term]
+        fields = [term.replace("==", "=").split("=", 1) for term in (field_selector or "").split(",") if term]
+        with self.lock:
+            return [
+                obj for (p, ns, _), obj in sorted(self.objects.items())
+                if p == plural and (namespace is None or ns == namespace)
+                and all(obj["metadata"].get("labels", {}).get(key) == value for key, value in terms)
+                and all(_field(obj, path) == value for path, value in fields)
+            ]
+
+    def get(self, plural: str, namespace: str, name: str) -> Optional[Dict[str, Any]]:
+        with self.lock:
+            return self.objects.get((plural, namespace or "", name))
+
+    def put(self, plural: str, namespace: str, name: str, obj: Dict[str, Any]) -> bool:
+        with self.lock:
+            created = (plural, namespace or "", name) not in self.objects
+            self.resource_version += 1
+            obj.setdefault("metadata", {})["resourceVersion"] = str(self.resource_version)
+            obj["metadata"].setdefault("creationTimestamp", _now())
+            self.objects[(plural, namespace or "", name)] = obj
+            self._record("ADDED" if created else "MODIFIED", plural, namespace or "", obj)
+            return created
+
+    def delete(self, plural: str, namespace: str, name: str) -> Optional[Dict[str, Any]]:
+        with self.lock:
+            obj = self.objects.pop((plural, namespace or "", name), None)
+            if obj is not None:
+                self.resource_version += 1
+                self._record("DELETED", plural, namespace or "", obj)
+            return obj
+
+
+def _parse_path(path: str):
+    """Split an API path into (plural, namespace, name, subresource)"""
+    parts = [p for p in path.split("/") if p]
+    if parts[:1] == ["api"]:
+        parts = parts[2:]
+    elif parts[:1] == ["apis"]:
+        parts = parts[3:]
+    else:
+        return None
+    namespace = None
+    if len(parts) >= 2 and parts[0] == "namespaces" and len(parts) != 2:
+        namespace = parts[1]
+        parts = parts[2:]
+    if not parts or parts[0] not in KINDS:
+        return None
+    name = parts[1] if len(parts) > 1 else None
+    subresource = parts[2] if len(parts) > 2 else None
+    return parts[0], namespace, name, subresource
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    server_version = "fake-apiserver/1.0"
+    disable_nagle_algorithm = True
+
+    def log_message(self, format, *args):
+        pass
+
+    @property
+    def store(self) -> ObjectStore:
+        return self.server.store
+
+    def _send(self, status: int, body: Any, content_type: str = "application/json"):
+        data = body if isinstance(body, bytes) else (
+            body.encode() if isinstance(body, str) else json.dumps(body).encode()
+        )
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def _status(self, code: int, message: str):
+        self._send(code, {"kind": "Status", "apiVersion": "v1", "status": "Failure",
+                          "message": message, "code": code})
+
+    def _body(self) -> bytes:
+        length = int(self.headers.get("Content-Length") or 0)
+        return self.rfile.read(length) if length else b""
+
+    def do_GET(self):
+        url = urlparse(self.path)
+        if url.path == "/version":
+            return self._send(200, {"major": "1", "minor": "29", "gitVersion": "v1.29.0-fake"})
+        if url.path in ("/api", "/apis"):
+            return self._send(200, {"kind": "APIVersions", "versions": ["v1"]} if url.path == "/api"
+                              else {"kind": "APIGroupList", "groups": _api_groups()})
+        if url.path == "/api/v1" or url.path.startswith("/apis/") and url.path.count("/") == 3:
+            return self._send(200, _api_resource_list(url.path.split("/", 2)[2]))
+        parsed = _parse_path(url.path)
+        if not parsed:
+            return self._status(404, f"the server could not find the requested resource ({url.path})")
+        plural, namespace, name, subresource = parsed
+        query = parse_qs(url.query)
+        if name is None and query.get("watch", ["false"])[0] in ("true", "1"):
+            return self._watch(plural, namespace, query)
+        if name is None:
+            return self._list(plural, namespace, query)
+        obj = self.store.get(plural, namespace, name)
+        if obj is None:
+            return self._status(404, f'{plural} "{name}" not found')
+        if subresource == "log":
+            if obj.get("status", {}).get("phase") == "Pending":
+                return self._status(400, f'container "app" in pod "{name}" is waiting to start: ContainerCreating')
+            tail = int(query.get("tailLines", ["100"])[0])
+            if query.get("follow", ["false"])[0] in ("true", "1"):
+                return self._follow_log(tail)
+            return self._send(200, LOG_LINE * tail, "text/plain")
+        if subresource == "scale":
+            return self._send(200, {"kind": "Scale", "spec": {"replicas": obj.get("spec", {}).get("replicas", 0)}})
+        return self._send(200, obj)
+
+    def _write_chunk(self, data: bytes):
+        self.wfile.write(f"{len(data):x}\r\n".encode() + data + b"\r\n")
+        self.wfile.flush()
+
+    def _follow_log(self, tail: int, interval: float = 0.05):
+        """Stream the tail and then one new line per interval until the client goes away"""
+        self.send_response(200)
+        self.send_header("Content-Type", "text/plain")
+        self.send_header("Transfer-Encoding", "chunked")
+        self.end_headers()
+        try:
+            if tail:
+                self._write_chunk((LOG_LINE * tail).encode())
+            while True:
+                time.sleep(interval)
+                self._write_chunk(LOG_LINE.encode())
+        except (BrokenPipeError, ConnectionResetError):
+            self.close_connection = True
+
+    def _list(self, plural: str, namespace: Optional[str], query: Dict[str, List[str]]):
+        """Lists honour label/field selectors, limit/continue and the metadata and table views"""
+        api_version, kind = KINDS[plural]
+        items = self.store.list(plural, namespace, query.get("labelSelector", [None])[0],
+                                query.get("fieldSelector", [None])[0])
+        offset = int(query.get("continue", ["0"])[0] or 0)
+        limit = int(query.get("limit", ["0"])[0] or 0)
+        page = items[offset:offset + limit] if limit else items[offset:]
+        metadata = {"resourceVersion": str(self.store.resource_version)}
+        if limit and offset + limit < len(items):
+            metadata["continue"] = str(offset + limit)
+            metadata["remainingItemCount"] = len(items) - offset - limit
+
+        accept = self.headers.get("Accept", "")
+        if "as=Table" in accept:
+            return self._send(200, {
+                "apiVersion": "meta.k8s.io/v1",
+                "kind": "Table",
+                "metadata": metadata,
+                "columnDefinitions": [{"name": "Name", "type": "string"},
+                                      {"name": "Age", "type": "string"}],
+                "rows": [{"cells": [obj["metadata"]["name"], "1d"],
+                          "object": {"kind": "PartialObjectMetadata", "metadata": obj["metadata"]}}
+                         for obj in page],
+            })
+        if "as=PartialObjectMetadataList" in accept:
+            return self._send(200, {
+                "apiVersion": "meta.k8s.io/v1",
+                "kind": "PartialObjectMetadataList",
+                "metadata": metadata,
+                "items": [{"kind": "PartialObjectMetadata", "metadata": obj["metadata"]} for obj in page],
+            })
+        return self._send(200, {"apiVersion": api_version, "kind": f"{kind}List", "metadata": metadata, "items": page})
+
+    def _watch(self, plural: str, namespace: Optional[str], query: Dict[str, List[str]]):
+        """Stream watch events as newline-delimited JSON in a chunked response"""
+        since = int(query.get("resourceVersion", ["0"])[0] or 0)
+        deadline = time.monotonic() + float(query.get("timeoutSeconds", ["30"])[0])
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Transfer-Encoding", "chunked")
+        self.end_headers()
+        try:
+            if since == 0:
+                with self.store.lock:
+                    since = self.store.resource_version
+                for obj in self.store.list(plural, namespace):
+                    self._write_chunk(json.dumps({"type": "ADDED", "object": obj}).encode() + b"\n")
+            while True:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                events, latest = self.store.wait_events(plural, namespace, since, min(remaining, 1.0))
+                if events is None:
+                    gone = {"kind": "Status", "status": "Failure", "reason": "Expired", "code": 410,
+                            "message": f"too old resource version: {since}"}
+                    self._write_chunk(json.dumps({"type": "ERROR", "object": gone}).encode() + b"\n")
+                    break
+                for _, event_type, obj in events:
+                    self._write_chunk(json.dumps({"type": event_type, "object": obj}).encode() + b"\n")
+                since = latest
+            self.wfile.write(b"0\r\n\r\n")
+        except (BrokenPipeError, ConnectionResetError):
+            self.close_connection = True
+
+    def do_PATCH(self):
+        url = urlparse(self.path)
+        parsed = _parse_path(url.path)
+        if not parsed or parsed[2] is None:
+            return self._status(404, "not found")
+        plural, namespace, name, subresource = parsed
+        patch = yaml.safe_load(self._body()) or {}
+        if subresource == "scale":
+            obj = self.store.get(plural, namespace, name)
+            if obj is None:
+                return self._status(404, f'{plural} "{name}" not found')
+            obj = copy.deepcopy(obj)
+            obj.setdefault("spec", {})["replicas"] = patch.get("spec", {}).get("replicas", 0)
+            obj["metadata"]["generation"] = obj["metadata"].get("generation", 1) + 1
+            self.store.put(plural, namespace, name, obj)
+            if plural == "deployments":
+                self.store.start_rollout(namespace, name)
+            return self._send(200, {"kind": "Scale", "metadata": {
+                "name": name, "namespace": namespace, "resourceVersion": obj["metadata"]["resourceVersion"]
+            }, "spec": {"replicas": obj["spec"]["replicas"]}})
+        if "dryRun" in parse_qs(url.query):
+            return self._send(200, patch)
+        if namespace:
+            patch.setdefault("metadata", {})["namespace"] = namespace
+        created = self.store.put(plural, namespace, name, patch)
+        if plural == "deployments":
+            self.store.start_rollout(namespace, name)
+        self._send(201 if created else 200, patch)
+
+    def do_DELETE(self):
+        parsed = _parse_path(urlparse(self.path).path)
+        if not parsed or parsed[2] is None:
+            return self._status(404, "not found")
+        plural, namespace, name, _ = parsed
+        obj = self.store.delete(plural, namespace, name)
+        if obj is None:
+            return self._status(404, f'{plural} "{name}" not found')
+        self._send(200, obj)
+
+
+class _Server(ThreadingHTTPServer):
+    daemon_threads = True
+    request_queue_size = 256
+
+
+class FakeAPIServer:
+    """Stand-in API server running on a background thread"""
+
+    def __init__(self, items: int = 50, namespace: str = "default", port: int = 0):
+        self.store = ObjectStore()
+        self.store.seed(namespace, items)
+        self.httpd = _Server(("127.0.0.1", port), _Handler)
+        self.httpd.store = self.store
+        self.thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+        self.kubeconfig_path = None
+
+    @property
+    def url(self) -> str:
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def write_kubeconfig(self, path: str = None) -> str:
+        """Write a kubeconfig pointing at this server and return its path"""
+        if path is None:
+            fd, path = tempfile.mkstemp(prefix="fake-kubeconfig-", suffix=".yaml")
+            os.close(fd)
+        kubeconfig = {
+            "apiVersion": "v1",
+            "kind": "Config",
+            "clusters": [{"name": "fake", "cluster": {"server": self.url}}],
+            "users": [{"name": "bench", "user": {"token": "bench-token"}}],
+            "contexts": [{"name": "fake", "context": {"cluster": "fake", "user": "bench", "namespace": "default"}}],
+            "current-context": "fake",
+        }
+        with open(path, "w") as f:
+            yaml.safe_dump(kubeconfig, f)
+        self.kubeconfig_path = path
+        return path
+
+    def __enter__(self):
+        self.thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+        if self.kubeconfig_path:
+            try:
+                os.unlink(self.kubeconfig_path)
+            except OSError:
+                pass
@@ -0,0 +1,148 @@
+"""
+Fake kubectl that replays recorded responses, for offline benchmarks.
+
+A recording is a JSON list of {"args", "stdout", "stderr", "returncode"}
+entries. An invocation is answered by the entry with the longest args
+prefix matching its arguments; "*" in a recording matches any single
+argument. Without a recordings file, responses for a cluster seeded like
+FakeAPIServer are generated.
+
+Usage:
+    python benchmarks/fake_kubectl.py install /tmp/fake-bin [--recordings kubectl.json]
+    PATH=/tmp/fake-bin:$PATH python k8s.py
+
+    # Capture a response from the real kubectl into a recordings file
+    python benchmarks/fake_kubectl.py record kubectl.json -- get pods -o json -n default
+"""
+import argparse
+import json
+import os
+import shutil
+import stat
+import subprocess
+import sys
+from typing import Any, Dict, List, Optional
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from fake_apiserver import KINDS, LOG_LINE, _api_resource_list, _make_object  # noqa: E402
+
+RECORDINGS_ENV = "FAKE_KUBECTL_RECORDINGS"
+ITEMS_ENV = "FAKE_KUBECTL_ITEMS"
+
+
+def _entry(args: List[str], stdout: Any = "", stderr: str = "", returncode: int = 0) -> Dict[str, Any]:
+    if not isinstance(stdout, str):
+        stdout = json.dumps(stdout)
+    return {"args": args, "stdout": stdout, "stderr": stderr, "returncode": returncode}
+
+
+def default_recordings(items: int = 50, namespace: str = "default") -> List[Dict[str, Any]]:
+    """Responses for the commands K8sOperations issues, against a seeded cluster"""
+    recordings = [
+        _entry(["version", "--client"], {"clientVersion": {"gitVersion": "v1.29.0-fake"}}),
+        _entry(["version"], {"clientVersion": {"gitVersion": "v1.29.0-fake"},
+                             "serverVersion": {"gitVersion": "v1.29.0-fake"}}),
+        _entry(["api-resources"], "".join(
+            f"{r['name']}  {api_version}  {str(r['namespaced']).lower()}  {r['kind']}\n"
+            for api_version in sorted({v for v, _ in KINDS.values()})
+            for r in _api_resource_list(api_version)["resources"] if "/" not in r["name"]
+        )),
+        _entry(["logs"], LOG_LINE * 100),
+        _entry(["apply"], "deployment.apps/bench configured\n"),
+        _entry(["scale"], "deployment.apps/scaled\n"),
+        _entry(["delete"], "deleted\n"),
+        _entry(["describe"], "Name:         app0\nNamespace:    default\n"),
+        _entry(["rollout", "status"], 'deployment "bench" successfully rolled out\n'),
+    ]
+    for plural, (api_version, kind) in KINDS.items():
+        ns = "" if plural == "namespaces" else namespace
+        objects = [_make_object(plural, ns, f"app{i}-{plural[:3]}") for i in range(items)]
+        recordings.append(_entry(["get", plural, "-o", "json"], {"apiVersion": "v1", "kind": "List", "items": objects}))
+        recordings.append(_entry(["get", plural, "*", "-o", "json"], objects[0] if objects else {}))
+    return recordings
+
+
+def load_recordings() -> List[Dict[str, Any]]:
+    path = os.environ.get(RECORDINGS_ENV)
+    if path:
+        with open(path) as f:
+            return json.load(f)
+    return default_recordings(int(os.environ.get(ITEMS_ENV, "50")))
+
+
+def _matches(pattern: List[str], args: List[str]) -> bool:
+    return len(pattern) <= len(args) and all(p == "*" or p == a for p, a in zip(pattern, args))
+
+
+def find_response(recordings: List[Dict[str, Any]], args: List[str]) -> Optional[Dict[str, Any]]:
+    """Longest recording whose args are a prefix of the invocation"""
+    candidates = [entry for entry in recordings if _matches(entry["args"], args)]
+    return max(candidates, key=lambda entry: len(entry["args"]), default=None)
+
+
+def replay(args: List[str]) -> int:
+    if not sys.stdin.isatty():
+        sys.stdin.read()
+    response = find_response(load_recordings(), args)
+    if response is None:
+        sys.stderr.write(f"error: no recorded response for: kubectl {' '.join(args)}\n")
+        return 1
+    sys.stdout.write(response["stdout"])
+    sys.stderr.write(response.get("stderr", ""))
+    return response.get("returncode", 0)
+
+
+def install(directory: str, recordings: str = None, items: int = 50) -> str:
+    """Write a kubectl shim into directory and return its path"""
+    os.makedirs(directory, exist_ok=True)
+    path = os.path.join(directory, "kubectl")
+    env = f"{ITEMS_ENV}={items} "
+    if recordings:
+        env += f"{RECORDINGS_ENV}='{os.path.abspath(recordings)}' "
+    with open(path, "w") as f:
+        f.write(f"#!/bin/sh\n{env}exec '{sys.executable}' '{os.path.abspath(__file__)}' replay \"$@\"\n")
+    os.chmod(path, os.stat(path).st_mode | stat.S_IXUSR | stat.S_IXGRP | stat.S_IXOTH)
+    return path
+
+
+def record(path: str, args: List[str]):
+    """Run the real kubectl and append its response to a recordings file"""
+    kubectl = shutil.which("kubectl")
+    if kubectl is None:
+        raise SystemExit("kubectl not found on PATH")
+    result = subprocess.run([kubectl] + args, capture_output=True, text=True)
+    recordings = []
+    if os.path.exists(path):
+        with open(path) as f:
+            recordings = json.load(f)
+    recordings = [entry for entry in recordings if entry["args"] != args]
+    recordings.append(_entry(args, result.stdout, result.stderr, result.returncode))
+    with open(path, "w") as f:
+        json.dump(recordings, f, indent=2)
+
+
+def main():
+    if len(sys.argv) > 1 and sys.argv[1] == "replay":
+        sys.exit(replay(sys.argv[2:]))
+
+    parser = argparse.ArgumentParser(description="Fake kubectl replaying recorded responses")
+    commands = parser.add_subparsers(dest="command", required=True)
+    install_parser = commands.add_parser("install", help="Write a kubectl shim into a directory")
+    install_parser.add_argument("directory")
+    install_parser.add_argument("--recordings", help="Recordings file; generated responses when omitted")
+    install_parser.add_argument("--items", type=int, default=50, help="Objects of each kind in generated responses")
+    record_parser = commands.add_parser("record", help="Record a response from the real kubectl")
+    record_parser.add_argument("path")
+    record_parser.add_argument("kubectl_args", nargs=argparse.REMAINDER)
+    args = parser.parse_args()
+
+    if args.command == "install":
+        print(install(args.directory, args.recordings, args.items))
+    else:
+        kubectl_args = args.kubectl_args[1:] if args.kubectl_args[:1] == ["--"] else args.kubectl_args
+        record(args.path, kubectl_args)
+
+
+if __name__ == "__main__":
+    main()
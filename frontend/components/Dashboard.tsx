@@ -12,7 +12,7 @@ import {
   CheckCircleIcon,
   ClockIcon
 } from '@heroicons/react/24/outline'
-import { useWebSocket } from '@/contexts/WebSocketContext'
+import { useWebSocket, applyResourceMessage } from '@/contexts/WebSocketContext'
 
 interface ClusterStatus {
   agent_status: string
@@ -43,13 +43,33 @@ export default function Dashboard() {
     namespaces: 0
   })
   const [loading, setLoading] = useState(true)
-  const { isConnected } = useWebSocket()
+  const { isConnected, subscribe } = useWebSocket()
 
   useEffect(() => {
     fetchClusterStatus()
-    fetchResourceCounts()
   }, [])
 
+  useEffect(() => {
+    if (!isConnected) {
+      fetchResourceCounts()
+      return
+    }
+
+    // Keep counts current from resource subscriptions instead of polling
+    const types: (keyof ResourceCounts)[] = ['deployments', 'services', 'pods', 'namespaces']
+    const rows: Record<string, any[]> = {}
+    const unsubscribes = types.map(type => subscribe(type, undefined, (data) => {
+      if (data.type === 'error') {
+        fetchResourceCounts()
+        return
+      }
+      rows[type] = applyResourceMessage(rows[type] || [], data)
+      setResourceCounts(counts => ({ ...counts, [type]: rows[type].length }))
+      setLoading(false)
+    }))
+    return () => unsubscribes.forEach(unsubscribe => unsubscribe())
+  }, [isConnected, subscribe])
+
   const fetchClusterStatus = async () => {
     try {
       const response = await fetch('/api/status')
@@ -1,6 +1,6 @@
 'use client'
 
-import { useState, useEffect } from 'react'
+import { useState, useEffect, useRef } from 'react'
 import { motion } from 'framer-motion'
 import {
   ServerIcon,
@@ -13,6 +13,7 @@ import {
   PlusIcon
 } from '@heroicons/react/24/outline'
 import toast from 'react-hot-toast'
+import { useWebSocket, applyResourceMessage } from '@/contexts/WebSocketContext'
 
 interface Resource {
   name: string
@@ -29,6 +30,9 @@ interface ResourceType {
   bgColor: string
 }
 
+// Rows rendered per "Show more" step; large clusters can list tens of thousands of pods
+const ROWS_PER_STEP = 200
+
 const resourceTypes: ResourceType[] = [
   {
     id: 'deployments',
@@ -65,25 +69,79 @@ export default function Resources() {
   const [resources, setResources] = useState<Resource[]>([])
   const [loading, setLoading] = useState(false)
   const [refreshing, setRefreshing] = useState(false)
+  const [streaming, setStreaming] = useState(false)
+  const [visibleRows, setVisibleRows] = useState(ROWS_PER_STEP)
+  const latestRequest = useRef(0)
+  const { isConnected, subscribe } = useWebSocket()
 
   useEffect(() => {
-    fetchResources(selectedType)
-  }, [selectedType])
+    setVisibleRows(ROWS_PER_STEP)
+    if (!isConnected) {
+      fetchResources(selectedType)
+      return
+    }
 
+    // Live updates over the WebSocket; fall back to HTTP if the backend
+    // cannot serve subscriptions
+    setLoading(true)
+    return subscribe(selectedType, undefined, (data) => {
+      if (data.type === 'error') {
+        fetchResources(selectedType)
+        return
+      }
+      setResources(current => applyResourceMessage(current, data))
+      setLoading(false)
+    })
+  }, [selectedType, isConnected, subscribe])
+
+  // Streams the list as NDJSON pages so the first rows show up before the
+  // whole collection has been fetched
   const fetchResources = async (type: string) => {
+    const request = ++latestRequest.current
     setLoading(true)
+    setStreaming(true)
     try {
-      const response = await fetch(`/api/resources/${type}`)
-      if (!response.ok) {
+      const response = await fetch(`/api/resources/${type}?stream=true`)
+      if (!response.ok || !response.body) {
         throw new Error('Failed to fetch resources')
       }
-      const data = await response.json()
-      setResources(data.resources || [])
+      const reader = response.body.getReader()
+      const decoder = new TextDecoder()
+      let buffer = ''
+      let first = true
+      while (true) {
+        const { done, value } = await reader.read()
+        if (done) break
+        if (request !== latestRequest.current) {
+          // A newer fetch (another tab or a refresh) replaced this one
+          await reader.cancel()
+          return
+        }
+        buffer += decoder.decode(value, { stream: true })
+        const lines = buffer.split('\n')
+        buffer = lines.pop() || ''
+        for (const line of lines) {
+          if (!line) continue
+          const message = JSON.parse(line)
+          if (message.type === 'error') {
+            throw new Error(message.message)
+          }
+          if (message.type === 'resources') {
+            const items: Resource[] = message.items || []
+            setResources(current => first ? items : [...current, ...items])
+            first = false
+            setLoading(false)
+          }
+        }
+      }
     } catch (error) {
       console.error('Error fetching resources:', error)
       toast.error('Failed to fetch resources')
     } finally {
-      setLoading(false)
+      if (request === latestRequest.current) {
+        setLoading(false)
+        setStreaming(false)
+      }
     }
   }
 
@@ -174,7 +232,7 @@ export default function Resources() {
       <div className="card">
         <div className="flex items-center justify-between mb-4">
           <h3 className="text-lg font-medium text-gray-900">
-            {selectedResourceType?.name} ({resources.length})
+            {selectedResourceType?.name} ({resources.length}{streaming ? '+' : ''})
           </h3>
         </div>
 
@@ -217,12 +275,12 @@ export default function Resources() {
                 </tr>
               </thead>
               <tbody className="bg-white divide-y divide-gray-200">
-                {resources.map((resource, index) => (
+                {resources.slice(0, visibleRows).map((resource, index) => (
                   <motion.tr
-                    key={resource.name}
+                    key={`${resource.namespace}/${resource.name}`}
                     initial={{ opacity: 0, y: 20 }}
                     animate={{ opacity: 1, y: 0 }}
-                    transition={{ delay: index * 0.05 }}
+                    transition={{ delay: Math.min(index, 20) * 0.05 }}
                     className="hover:bg-gray-50"
                   >
                     <td className="px-6 py-4 whitespace-nowrap">
@@ -274,6 +332,16 @@ export default function Resources() {
                 ))}
               </tbody>
             </table>
+            {resources.length > visibleRows && (
+              <div className="flex justify-center py-4">
+                <button
+                  onClick={() => setVisibleRows(rows => rows + ROWS_PER_STEP)}
+                  className="btn btn-secondary"
+                >
+                  Show more ({resources.length - visibleRows} remaining)
+                </button>
+              </div>
+            )}
           </div>
         )}
       </div>
@@ -1,13 +1,16 @@
 'use client'
 
-import React, { createContext, useContext, useEffect, useState, useRef } from 'react'
+import React, { createContext, useContext, useEffect, useState, useRef, useCallback } from 'react'
 import { io, Socket } from 'socket.io-client'
 
+type MessageListener = (data: any) => void
+
 interface WebSocketContextType {
   socket: Socket | null
   isConnected: boolean
   sendMessage: (message: string) => void
   lastMessage: any
+  subscribe: (resource: string, namespace: string | undefined, listener: MessageListener) => () => void
 }
 
 const WebSocketContext = createContext<WebSocketContextType | undefined>(undefined)
@@ -17,50 +20,71 @@ export function WebSocketProvider({ children }: { children: React.ReactNode }) {
   const [isConnected, setIsConnected] = useState(false)
   const [lastMessage, setLastMessage] = useState<any>(null)
   const reconnectTimeoutRef = useRef<NodeJS.Timeout>()
+  const listenersRef = useRef<Set<MessageListener>>(new Set())
+  const wsRef = useRef<WebSocket | null>(null)
+  // Active subscriptions, re-sent whenever the connection opens
+  const subscriptionsRef = useRef<Map<string, { resource: string; namespace?: string; count: number }>>(new Map())
 
   useEffect(() => {
     const wsUrl = process.env.NEXT_PUBLIC_WS_URL || 'ws://localhost:8000'
+    let disposed = false
     
     // For WebSocket (not Socket.IO), we'll use native WebSocket
-    const ws = new WebSocket(`${wsUrl}/ws`)
-    
-    ws.onopen = () => {
-      console.log('WebSocket connected')
-      setIsConnected(true)
-    }
-    
-    ws.onmessage = (event) => {
-      try {
-        const data = JSON.parse(event.data)
-        setLastMessage(data)
-      } catch (error) {
-        console.error('Error parsing WebSocket message:', error)
+    const connect = () => {
+      const ws = new WebSocket(`${wsUrl}/ws`)
+      wsRef.current = ws
+      
+      ws.onopen = () => {
+        console.log('WebSocket connected')
+        setIsConnected(true)
+        // Each subscription starts over from a fresh snapshot
+        subscriptionsRef.current.forEach(({ resource, namespace }) => {
+          ws.send(JSON.stringify({ type: 'subscribe', resource, namespace }))
+        })
       }
-    }
-    
-    ws.onclose = () => {
-      console.log('WebSocket disconnected')
-      setIsConnected(false)
       
-      // Attempt to reconnect after 3 seconds
-      reconnectTimeoutRef.current = setTimeout(() => {
-        console.log('Attempting to reconnect...')
-        // The useEffect will run again and create a new connection
-      }, 3000)
-    }
-    
-    ws.onerror = (error) => {
-      console.error('WebSocket error:', error)
-      setIsConnected(false)
+      ws.onmessage = (event) => {
+        try {
+          const data = JSON.parse(event.data)
+          // Resource events can arrive in bursts, so deliver each one to
+          // listeners directly instead of relying on lastMessage state
+          listenersRef.current.forEach(listener => listener(data))
+          setLastMessage(data)
+        } catch (error) {
+          console.error('Error parsing WebSocket message:', error)
+        }
+      }
+      
+      ws.onclose = () => {
+        console.log('WebSocket disconnected')
+        setIsConnected(false)
+        if (disposed) {
+          return
+        }
+        
+        // Reconnect after 3 seconds; the server also closes clients that fall too far behind
+        reconnectTimeoutRef.current = setTimeout(() => {
+          console.log('Attempting to reconnect...')
+          connect()
+        }, 3000)
+      }
+      
+      ws.onerror = (error) => {
+        console.error('WebSocket error:', error)
+        setIsConnected(false)
+      }
+      
+      setSocket(ws as any) // Type assertion for compatibility
     }
     
-    setSocket(ws as any) // Type assertion for compatibility
+    connect()
     
     return () => {
+      disposed = true
       if (reconnectTimeoutRef.current) {
         clearTimeout(reconnectTimeoutRef.current)
       }
-      ws.close()
+      wsRef.current?.close()
     }
   }, [])
 
@@ -75,13 +99,69 @@ export function WebSocketProvider({ children }: { children: React.ReactNode }) {
     }
   }
 
+  // Subscribe to resource_snapshot/resource_event messages for one collection.
+  // Returns a function that cancels the subscription.
+  const subscribe = useCallback((resource: string, namespace: string | undefined, listener: MessageListener) => {
+    // Namespace the server resolved for this subscription (its default when none
+    // was given, null for cluster-scoped kinds); unknown until the snapshot arrives
+    let resolvedNamespace: string | null | undefined = undefined
+    const filtered: MessageListener = (data) => {
+      if (data.resource !== resource && data.type !== 'error') {
+        return
+      }
+      if (data.type === 'resource_snapshot' && (data.requested_namespace || undefined) === (namespace || undefined)) {
+        resolvedNamespace = data.namespace
+        listener(data)
+      } else if (data.type === 'resource_event' && resolvedNamespace !== undefined && data.namespace === resolvedNamespace) {
+        listener(data)
+      } else if (data.type === 'error' && data.message?.startsWith('Subscription failed')) {
+        listener(data)
+      }
+    }
+    listenersRef.current.add(filtered)
+
+    const key = `${resource}/${namespace || ''}`
+    const existing = subscriptionsRef.current.get(key)
+    subscriptionsRef.current.set(key, { resource, namespace, count: (existing?.count || 0) + 1 })
+    const ws = wsRef.current
+    if (ws && ws.readyState === WebSocket.OPEN) {
+      ws.send(JSON.stringify({ type: 'subscribe', resource, namespace }))
+    }
+
+    return () => {
+      listenersRef.current.delete(filtered)
+      const entry = subscriptionsRef.current.get(key)
+      if (entry && entry.count > 1) {
+        entry.count -= 1
+        return
+      }
+      subscriptionsRef.current.delete(key)
+      const ws = wsRef.current
+      if (ws && ws.readyState === WebSocket.OPEN) {
+        ws.send(JSON.stringify({ type: 'unsubscribe', resource, namespace }))
+      }
+    }
+  }, [])
+
   return (
-    <WebSocketContext.Provider value={{ socket, isConnected, sendMessage, lastMessage }}>
+    <WebSocketContext.Provider value={{ socket, isConnected, sendMessage, lastMessage, subscribe }}>
       {children}
     </WebSocketContext.Provider>
   )
 }
 
+// Apply a resource_snapshot or resource_event message to a list of rows
+export function applyResourceMessage<T extends { name: string; namespace: string }>(rows: T[], data: any): T[] {
+  if (data.type === 'resource_snapshot') {
+    return data.items
+  }
+  if (data.type !== 'resource_event') {
+    return rows
+  }
+  const others = rows.filter(row => row.name !== data.object.name || row.namespace !== data.object.namespace)
+  return data.event === 'DELETED' ? others : [...others, data.object].sort((a, b) => a.name.localeCompare(b.name))
+}
+
 export function useWebSocket() {
   const context = useContext(WebSocketContext)
   if (context === undefined) {
@@ -1,46 +1,648 @@
 import subprocess
-import tempfile
 import yaml
 import os
 import json
 import re
 import logging
 import sys
-from typing import Dict, List, Optional, Any, Union
+from typing import Callable, Dict, List, Optional, Any, Tuple, Union
 from datetime import datetime
 from pathlib import Path
+from urllib.parse import urlencode
 import argparse
+import asyncio
+import atexit
+import contextvars
+import functools
+import heapq
+import importlib
+import importlib.util
+import queue
+import threading
+import time
+import urllib.request
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from enum import Enum
 
 # Third-party imports
-from langchain.tools import BaseTool
-from langchain_google_genai import ChatGoogleGenerativeAI
+from langchain_core.tools import BaseTool
+
+
+# Heavy modules are imported on first use, so start-up only pays for what a
+# command needs (see --profile-startup)
+class LazyModule:
+    """Stand-in for a module that is imported on first attribute access"""
+
+    def __init__(self, name: str):
+        self._name = name
+        self._module = None
+
+    def __getattr__(self, attr: str):
+        if self._module is None:
+            self._module = importlib.import_module(self._name)
+        return getattr(self._module, attr)
+
+
+def module_available(name: str) -> bool:
+    """Whether a top-level module is installed, without importing it"""
+    return importlib.util.find_spec(name) is not None
+
 
 # UI/UX enhancements
-try:
-    from rich.console import Console
-    from rich.panel import Panel
-    from rich.text import Text
-    from rich.table import Table
-    from rich.progress import Progress, SpinnerColumn, TextColumn
-    from rich.prompt import Prompt, Confirm
-    from rich.syntax import Syntax
-    from rich.logging import RichHandler
-    from rich.tree import Tree
-    RICH_AVAILABLE = True
-except ImportError:
-    RICH_AVAILABLE = False
+RICH_AVAILABLE = module_available("rich")
+if not RICH_AVAILABLE:
     print("⚠️  Rich library not available. Install with: pip install rich")
     print("   Falling back to basic console output.")
 
+# Native Kubernetes API client (optional, kubectl is used when unavailable)
+URLLIB3_AVAILABLE = module_available("urllib3")
+urllib3 = LazyModule("urllib3")
+
+KUBERNETES_CLIENT_AVAILABLE = URLLIB3_AVAILABLE and module_available("kubernetes")
+k8s_client = LazyModule("kubernetes.client")
+k8s_client_config = LazyModule("kubernetes.config")
+
+HTTPX_AVAILABLE = module_available("httpx")
+httpx = LazyModule("httpx")
+
+# Prometheus metrics (optional, operations are not instrumented without it)
+try:
+    from prometheus_client import Counter, Histogram
+    PROMETHEUS_AVAILABLE = True
+except ImportError:
+    PROMETHEUS_AVAILABLE = False
+
 # Configure logging
+if RICH_AVAILABLE:
+    from rich.logging import RichHandler
+
 logging.basicConfig(
     level=logging.INFO,
     format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
     handlers=[RichHandler()] if RICH_AVAILABLE else [logging.StreamHandler()]
 )
 logger = logging.getLogger(__name__)
+logging.getLogger("httpx").setLevel(logging.WARNING)
+
+
+# Metrics
+LATENCY_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+if PROMETHEUS_AVAILABLE:
+    BACKEND_CALL_SECONDS = Histogram(
+        "k8s_agent_backend_call_duration_seconds",
+        "Latency of kubectl invocations and Kubernetes API requests",
+        ["backend", "verb", "resource"],
+        buckets=LATENCY_BUCKETS
+    )
+    BACKEND_CALL_ERRORS = Counter(
+        "k8s_agent_backend_call_errors_total",
+        "kubectl invocations and API requests that failed",
+        ["backend", "verb", "resource"]
+    )
+    TOOL_CALL_SECONDS = Histogram(
+        "k8s_agent_tool_duration_seconds",
+        "Latency of agent tool calls",
+        ["tool"],
+        buckets=LATENCY_BUCKETS
+    )
+    TOOL_CALL_ERRORS = Counter(
+        "k8s_agent_tool_errors_total",
+        "Agent tool calls that returned an error",
+        ["tool"]
+    )
+    PLANS_TOTAL = Counter(
+        "k8s_agent_plans_total",
+        "User inputs planned, by where the plan came from (rule, cache, llm or none)",
+        ["source"]
+    )
+
+# Tools report failures as strings starting with one of these
+TOOL_ERROR_PREFIXES = ("Error:", "Validation error:", "Security error:", "Resource error:")
+
+
+class observe_backend_call:
+    """Time, count and trace one kubectl invocation or API request.
+
+    Usable around blocking and awaited calls alike; the duration also
+    counts toward the "cluster" phase of the request. Set failed on the
+    returned object when the call completed but did not succeed, and add
+    attributes such as the exit code to its span.
+    """
+
+    def __init__(self, backend: str, verb: str, resource: str, attributes: Dict[str, Any] = None):
+        self.labels = (backend, verb, resource)
+        self.attributes = attributes
+        self.failed = False
+
+    def __enter__(self):
+        backend, verb, resource = self.labels
+        self.phase = timed_phase("cluster").__enter__()
+        self.scope = tracer.span(f"{backend} {verb}".strip(), kind="client")
+        self.span = self.scope.__enter__()
+        if self.span.sampled:
+            self.span.set_attributes({"k8s.backend": backend, "k8s.verb": verb, "k8s.resource": resource})
+            self.span.set_attributes(self.attributes or {})
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if PROMETHEUS_AVAILABLE:
+            BACKEND_CALL_SECONDS.labels(*self.labels).observe(time.perf_counter() - self.start)
+            if self.failed or exc_type is not None:
+                BACKEND_CALL_ERRORS.labels(*self.labels).inc()
+        if self.failed:
+            self.span.set_error(f"{self.labels[0]} {self.labels[1]} failed")
+        self.phase.__exit__(exc_type, exc, tb)
+        return self.scope.__exit__(exc_type, exc, tb)
+
+
+def kubectl_call_labels(cmd: List[str]) -> Tuple[str, str]:
+    """Verb and resource type of a kubectl argv, e.g. ("get", "pods")"""
+    args = [arg for arg in cmd[1:] if not arg.startswith("-")]
+    if not args:
+        return "", ""
+    verb = args[0]
+    if verb == "logs":
+        return verb, "pods"
+    if verb == "rollout" and len(args) > 2:
+        return f"rollout {args[1]}", args[2].split("/")[0]
+    if len(args) < 2 or verb in ("apply", "proxy", "version", "api-resources"):
+        return verb, ""
+    if args[1].startswith("/"):
+        return verb, api_call_labels("GET", args[1].split("?")[0])[1]
+    return verb, args[1].split("/")[0]
+
+
+def api_call_labels(method: str, path: str) -> Tuple[str, str]:
+    """Verb and resource type of an API request path, e.g. ("list", "pods")"""
+    parts = [part for part in path.split("/") if part]
+    # Drop /api/<version> or /apis/<group>/<version> and a namespaces/<name> scope
+    parts = parts[2:] if parts[:1] == ["api"] else parts[3:] if parts[:1] == ["apis"] else []
+    if len(parts) > 2 and parts[0] == "namespaces":
+        parts = parts[2:]
+    if not parts:
+        return method.lower(), ""
+    resource = parts[0] if len(parts) < 3 else f"{parts[0]}/{parts[2]}"
+    if method == "GET":
+        verb = "list" if len(parts) == 1 else "get"
+    else:
+        verb = {"POST": "create", "PUT": "update", "PATCH": "patch", "DELETE": "delete"}.get(method, method.lower())
+    return verb, resource
+
+
+def instrument_tool(method):
+    """Trace a tool's _run or _arun and record its latency and returned errors"""
+    def record(tool, span, start: float, result: Any):
+        failed = not isinstance(result, str) or result.startswith(TOOL_ERROR_PREFIXES)
+        if PROMETHEUS_AVAILABLE:
+            TOOL_CALL_SECONDS.labels(tool.name).observe(time.perf_counter() - start)
+            if failed:
+                TOOL_CALL_ERRORS.labels(tool.name).inc()
+        if failed and isinstance(result, str):
+            span.set_error(result)
+
+    if asyncio.iscoroutinefunction(method):
+        @functools.wraps(method)
+        async def arun(self, *args, **kwargs):
+            with tracer.span(f"tool {self.name}", {"tool.name": self.name}) as span:
+                start, result = time.perf_counter(), None
+                try:
+                    result = await method(self, *args, **kwargs)
+                    return result
+                finally:
+                    record(self, span, start, result)
+        return arun
+
+    @functools.wraps(method)
+    def run(self, *args, **kwargs):
+        with tracer.span(f"tool {self.name}", {"tool.name": self.name}) as span:
+            start, result = time.perf_counter(), None
+            try:
+                result = method(self, *args, **kwargs)
+                return result
+            finally:
+                record(self, span, start, result)
+    return run
+
+
+# Tracing
+TRACE_EXPORTERS = ("none", "file", "otlp")
+
+
+class Span:
+    """One timed operation of a trace, shaped after the OpenTelemetry data model"""
+
+    sampled = True
+
+    def __init__(self, name: str, trace_id: str, parent_id: Optional[str], kind: str = "internal",
+                 attributes: Dict[str, Any] = None):
+        self.name = name
+        self.trace_id = trace_id
+        self.span_id = os.urandom(8).hex()
+        self.parent_id = parent_id
+        self.kind = kind
+        self.attributes = {}
+        self.events: List[Dict[str, Any]] = []
+        self.status = "UNSET"
+        self.status_message = ""
+        self.start_ns = time.time_ns()
+        self.end_ns = None
+        if attributes:
+            self.set_attributes(attributes)
+
+    def set_attribute(self, key: str, value: Any):
+        if value is not None:
+            self.attributes[key] = value if isinstance(value, (str, bool, int, float)) else str(value)
+
+    def set_attributes(self, attributes: Dict[str, Any]):
+        for key, value in attributes.items():
+            self.set_attribute(key, value)
+
+    def set_error(self, message: str):
+        self.status = "ERROR"
+        self.status_message = message
+
+    def record_exception(self, exc: BaseException):
+        self.set_error(str(exc))
+        self.events.append({
+            "name": "exception",
+            "time_ns": time.time_ns(),
+            "attributes": {"exception.type": type(exc).__name__, "exception.message": str(exc)}
+        })
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "name": self.name,
+            "trace_id": self.trace_id,
+            "span_id": self.span_id,
+            "parent_span_id": self.parent_id,
+            "kind": self.kind,
+            "start_time_unix_nano": self.start_ns,
+            "end_time_unix_nano": self.end_ns,
+            "duration_ms": round((self.end_ns - self.start_ns) / 1e6, 3) if self.end_ns else None,
+            "attributes": self.attributes,
+            "status": {"code": self.status, "message": self.status_message},
+            "events": self.events
+        }
+
+
+class _NonRecordingSpan:
+    """Stands in for spans that are not sampled or while tracing is off"""
+
+    sampled = False
+    name = trace_id = span_id = ""
+
+    def set_attribute(self, key: str, value: Any):
+        pass
+
+    def set_attributes(self, attributes: Dict[str, Any]):
+        pass
+
+    def set_error(self, message: str):
+        pass
+
+    def record_exception(self, exc: BaseException):
+        pass
+
+
+NON_RECORDING_SPAN = _NonRecordingSpan()
+_current_span: contextvars.ContextVar = contextvars.ContextVar("k8s_agent_current_span", default=None)
+
+
+def current_span():
+    """The innermost open span of this task or thread"""
+    return _current_span.get() or NON_RECORDING_SPAN
+
+
+class _SpanScope:
+    def __init__(self, tracer: "Tracer", name: str, kind: str, attributes: Optional[Dict[str, Any]], parent):
+        self.tracer = tracer
+        self.args = (name, kind, attributes, parent)
+
+    def __enter__(self):
+        self.span = self.tracer.start_span(*self.args)
+        self.token = _current_span.set(self.span)
+        return self.span
+
+    def __exit__(self, exc_type, exc, tb):
+        _current_span.reset(self.token)
+        if exc is not None:
+            self.span.record_exception(exc)
+        self.tracer.end_span(self.span)
+        return False
+
+
+class _NoopScope:
+    def __enter__(self):
+        return NON_RECORDING_SPAN
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+
+_NOOP_SCOPE = _NoopScope()
+
+
+class FileSpanExporter:
+    """Appends finished spans to a file, one JSON object per line"""
+
+    def __init__(self, path: str):
+        self.path = path
+
+    def export(self, spans: List[Span]):
+        with open(self.path, "a") as f:
+            f.write("".join(json.dumps(span.to_dict()) + "\n" for span in spans))
+
+    def shutdown(self):
+        pass
+
+
+class OTLPSpanExporter:
+    """Posts spans to an OTLP/HTTP collector (e.g. http://localhost:4318/v1/traces) in the JSON encoding"""
+
+    KINDS = {"internal": 1, "server": 2, "client": 3}
+    STATUS_CODES = {"UNSET": 0, "OK": 1, "ERROR": 2}
+
+    def __init__(self, endpoint: str, service_name: str = "k8s-agent", timeout: float = 10.0):
+        self.endpoint = endpoint
+        self.service_name = service_name
+        self.timeout = timeout
+
+    @staticmethod
+    def _attributes(attributes: Dict[str, Any]) -> List[Dict[str, Any]]:
+        encoded = []
+        for key, value in attributes.items():
+            if isinstance(value, bool):
+                encoded.append({"key": key, "value": {"boolValue": value}})
+            elif isinstance(value, int):
+                encoded.append({"key": key, "value": {"intValue": str(value)}})
+            elif isinstance(value, float):
+                encoded.append({"key": key, "value": {"doubleValue": value}})
+            else:
+                encoded.append({"key": key, "value": {"stringValue": str(value)}})
+        return encoded
+
+    def _span(self, span: Span) -> Dict[str, Any]:
+        encoded = {
+            "traceId": span.trace_id,
+            "spanId": span.span_id,
+            "name": span.name,
+            "kind": self.KINDS.get(span.kind, 1),
+            "startTimeUnixNano": str(span.start_ns),
+            "endTimeUnixNano": str(span.end_ns),
+            "attributes": self._attributes(span.attributes),
+            "events": [{
+                "timeUnixNano": str(event["time_ns"]),
+                "name": event["name"],
+                "attributes": self._attributes(event["attributes"])
+            } for event in span.events],
+            "status": {"code": self.STATUS_CODES[span.status], "message": span.status_message}
+        }
+        if span.parent_id:
+            encoded["parentSpanId"] = span.parent_id
+        return encoded
+
+    def export(self, spans: List[Span]):
+        body = json.dumps({"resourceSpans": [{
+            "resource": {"attributes": self._attributes({"service.name": self.service_name})},
+            "scopeSpans": [{"scope": {"name": "k8s-agent"}, "spans": [self._span(span) for span in spans]}]
+        }]}).encode()
+        request = urllib.request.Request(self.endpoint, data=body, method="POST",
+                                         headers={"Content-Type": "application/json"})
+        with urllib.request.urlopen(request, timeout=self.timeout) as response:
+            response.read()
+
+    def shutdown(self):
+        pass
+
+
+class Tracer:
+    """Creates spans and hands finished ones to an exporter on a background thread.
+
+    Tracing is off until configure() installs an exporter; until then span()
+    returns a shared no-op scope. Root spans are sampled by trace id with
+    probability sample_ratio and children follow their parent's decision,
+    so a trace is either recorded whole or not at all. Spans are batched
+    and exported off the request path; when the queue is full new spans
+    are dropped rather than blocking.
+    """
+
+    def __init__(self):
+        self.exporter = None
+        self.sample_ratio = 1.0
+        self.dropped_spans = 0
+        self._queue: Optional[queue.Queue] = None
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def enabled(self) -> bool:
+        return self.exporter is not None
+
+    def configure(self, exporter, sample_ratio: float = 1.0, max_queue: int = 2048,
+                  batch_size: int = 256, flush_interval: float = 1.0):
+        self.shutdown()
+        self.sample_ratio = min(max(sample_ratio, 0.0), 1.0)
+        if exporter is None:
+            return
+        self._queue = queue.Queue(maxsize=max_queue)
+        self._thread = threading.Thread(target=self._export_loop, args=(exporter, self._queue, batch_size, flush_interval),
+                                        name="k8s-trace-export", daemon=True)
+        self._thread.start()
+        self.exporter = exporter
+
+    def span(self, name: str, attributes: Dict[str, Any] = None, kind: str = "internal", parent=None):
+        """Context manager opening a span as a child of the current one (or of parent)"""
+        if self.exporter is None:
+            return _NOOP_SCOPE
+        return _SpanScope(self, name, kind, attributes, parent)
+
+    def start_span(self, name: str, kind: str = "internal", attributes: Dict[str, Any] = None, parent=None):
+        """Open a span without making it current; parent may be a (trace_id, span_id, sampled) tuple"""
+        if self.exporter is None:
+            return NON_RECORDING_SPAN
+        parent = parent if parent is not None else _current_span.get()
+        if isinstance(parent, tuple):
+            trace_id, parent_id, sampled = parent
+        elif parent is not None:
+            trace_id, parent_id, sampled = parent.trace_id, parent.span_id, parent.sampled
+        else:
+            trace_id, parent_id = os.urandom(16).hex(), None
+            # Same rule as OpenTelemetry's TraceIdRatioBased sampler
+            sampled = int(trace_id[16:], 16) < self.sample_ratio * (1 << 64)
+        if not sampled:
+            return NON_RECORDING_SPAN
+        return Span(name, trace_id, parent_id, kind, attributes)
+
+    def end_span(self, span):
+        if not span.sampled or self._queue is None:
+            return
+        span.end_ns = time.time_ns()
+        try:
+            self._queue.put_nowait(span)
+        except queue.Full:
+            self.dropped_spans += 1
+
+    @staticmethod
+    def _export_loop(exporter, spans: queue.Queue, batch_size: int, flush_interval: float):
+        stopping = False
+        while not stopping:
+            batch = []
+            deadline = time.monotonic() + flush_interval
+            while len(batch) < batch_size:
+                try:
+                    span = spans.get(timeout=max(deadline - time.monotonic(), 0))
+                except queue.Empty:
+                    break
+                if span is None:
+                    stopping = True
+                    break
+                batch.append(span)
+            if batch:
+                try:
+                    exporter.export(batch)
+                except Exception as e:
+                    logger.warning(f"Failed to export {len(batch)} spans: {str(e)}")
+        exporter.shutdown()
+
+    def shutdown(self, timeout: float = 5.0):
+        """Export queued spans and stop the export thread"""
+        if self._thread is None:
+            return
+        self.exporter = None
+        self._queue.put(None)
+        self._thread.join(timeout)
+        self._thread = None
+        self._queue = None
+
+
+tracer = Tracer()
+atexit.register(tracer.shutdown)
+
+
+def configure_tracing(config: "K8sConfig"):
+    """Install the exporter selected by config.trace_exporter ("none", "file" or "otlp")"""
+    if config.trace_exporter not in TRACE_EXPORTERS:
+        raise ValidationError(f"Unknown trace exporter '{config.trace_exporter}'. Use one of: {', '.join(TRACE_EXPORTERS)}")
+    exporter = None
+    if config.trace_exporter == "file":
+        exporter = FileSpanExporter(config.trace_file)
+    elif config.trace_exporter == "otlp":
+        exporter = OTLPSpanExporter(config.trace_endpoint)
+    tracer.configure(exporter, config.trace_sample_ratio)
+
+
+def traced(name: str = None, attributes=None, result_attributes=None):
+    """Run the decorated function, sync or async, inside a span.
+
+    attributes is called with the function's arguments and
+    result_attributes with its return value; both return a dict of span
+    attributes and are skipped while the span is not recorded.
+    """
+    def decorate(fn):
+        span_name = name or fn.__qualname__
+
+        if asyncio.iscoroutinefunction(fn):
+            @functools.wraps(fn)
+            async def async_wrapper(*args, **kwargs):
+                with tracer.span(span_name) as span:
+                    if span.sampled and attributes is not None:
+                        span.set_attributes(attributes(*args, **kwargs))
+                    result = await fn(*args, **kwargs)
+                    if span.sampled and result_attributes is not None:
+                        span.set_attributes(result_attributes(result))
+                    return result
+            return async_wrapper
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            with tracer.span(span_name) as span:
+                if span.sampled and attributes is not None:
+                    span.set_attributes(attributes(*args, **kwargs))
+                result = fn(*args, **kwargs)
+                if span.sampled and result_attributes is not None:
+                    span.set_attributes(result_attributes(result))
+                return result
+        return wrapper
+    return decorate
+
+
+# Request Timings
+_phase_timings: contextvars.ContextVar = contextvars.ContextVar("k8s_agent_phase_timings", default=None)
+
+
+class PhaseTimings(dict):
+    """Seconds spent in each phase (validate, render, cluster, ui, ...) while handling one request"""
+
+    def __init__(self):
+        super().__init__()
+        self.active = set()
+
+
+class collect_timings:
+    """Collect the phase timings of everything run inside the block.
+
+    Blocks and functions marked with timed_phase add their duration to the
+    PhaseTimings returned here; outside such a block they cost one context
+    variable lookup. The timings follow the context into tasks and executor
+    threads started from the block.
+    """
+
+    def __enter__(self) -> PhaseTimings:
+        self.timings = PhaseTimings()
+        self.token = _phase_timings.set(self.timings)
+        return self.timings
+
+    def __exit__(self, exc_type, exc, tb):
+        _phase_timings.reset(self.token)
+        return False
+
+
+class timed_phase:
+    """Add the time spent in a block, or in each call of a decorated function, to a phase.
+
+    A phase already being timed is not timed again by nested or
+    overlapping calls, so each phase reports wall time rather than the sum
+    of concurrent calls.
+    """
+
+    def __init__(self, phase: str):
+        self.phase = phase
+
+    def __enter__(self):
+        self.timings = _phase_timings.get()
+        if self.timings is not None:
+            if self.phase in self.timings.active:
+                self.timings = None
+            else:
+                self.timings.active.add(self.phase)
+                self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if self.timings is not None:
+            self.timings.active.discard(self.phase)
+            self.timings[self.phase] = self.timings.get(self.phase, 0.0) + time.perf_counter() - self.start
+        return False
+
+    def __call__(self, fn):
+        phase = self.phase
+
+        if asyncio.iscoroutinefunction(fn):
+            @functools.wraps(fn)
+            async def async_wrapper(*args, **kwargs):
+                with timed_phase(phase):
+                    return await fn(*args, **kwargs)
+            return async_wrapper
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            with timed_phase(phase):
+                return fn(*args, **kwargs)
+        return wrapper
 
 
 # Configuration and Data Classes
@@ -56,6 +658,25 @@ class K8sConfig:
     max_replicas: int = 10
     allowed_images: List[str] = None
     forbidden_namespaces: List[str] = None
+    backend: str = "auto"  # "auto", "api", "proxy" or "kubectl"
+    connection_pool_size: int = 4
+    informer_cache: bool = False
+    watch_timeout: int = 300
+    log_max_line_bytes: int = 16384
+    log_concurrency: int = 8
+    scale_concurrency: int = 10
+    rollout_timeout: int = 300
+    apply_field_manager: str = "k8s-agent"
+    apply_force_conflicts: bool = True
+    apply_server_side: bool = False  # kubectl backend; the api backend always applies server-side
+    list_page_size: int = 500
+    discovery_interval: int = 300
+    trace_exporter: str = "none"  # "none", "file" or "otlp"
+    trace_file: str = "k8s-agent-traces.jsonl"
+    trace_endpoint: str = "http://localhost:4318/v1/traces"
+    trace_sample_ratio: float = 1.0
+    planner: str = "auto"  # "auto" (rules, plan cache, then the LLM) or "rules"
+    plan_cache_size: int = 1024
     
     def __post_init__(self):
         if self.allowed_images is None:
@@ -97,15 +718,63 @@ class ResourceError(K8sError):
     pass
 
 
-class K8sUI:
+class AgentUI(ABC):
+    """Output interface of the agent and its tools.
+
+    K8sUI renders to the terminal. Servers use HeadlessUI, which discards
+    everything, or EventUI, which hands each call to a callback as a
+    structured event instead of drawing it.
+    """
+    
+    @abstractmethod
+    def print_header(self, title: str, subtitle: str = ""):
+        ...
+    
+    @abstractmethod
+    def print_success(self, message: str):
+        ...
+    
+    @abstractmethod
+    def print_error(self, message: str):
+        ...
+    
+    @abstractmethod
+    def print_warning(self, message: str):
+        ...
+    
+    @abstractmethod
+    def print_info(self, message: str):
+        ...
+    
+    @abstractmethod
+    def show_yaml(self, yaml_content: str, title: str = "Generated YAML"):
+        ...
+    
+    @abstractmethod
+    def show_table(self, data: List[Dict], title: str = "Resources"):
+        ...
+    
+    @abstractmethod
+    def show_text(self, text: str):
+        """Display preformatted text such as log lines"""
+
+
+class K8sUI(AgentUI):
     """Enhanced UI/UX for Kubernetes operations"""
     
     def __init__(self):
-        self.console = Console() if RICH_AVAILABLE else None
+        if RICH_AVAILABLE:
+            from rich.console import Console
+            self.console = Console()
+        else:
+            self.console = None
     
+    @timed_phase("ui")
     def print_header(self, title: str, subtitle: str = ""):
         """Print a beautiful header"""
         if self.console:
+            from rich.panel import Panel
+            from rich.text import Text
             text = Text(title, style="bold blue")
             if subtitle:
                 text.append(f"\n{subtitle}", style="dim")
@@ -118,6 +787,7 @@ class K8sUI:
                 print(f"   {subtitle}")
             print(f"{'='*50}")
     
+    @timed_phase("ui")
     def print_success(self, message: str):
         """Print success message"""
         if self.console:
@@ -125,6 +795,7 @@ class K8sUI:
         else:
             print(f"✅ {message}")
     
+    @timed_phase("ui")
     def print_error(self, message: str):
         """Print error message"""
         if self.console:
@@ -132,6 +803,7 @@ class K8sUI:
         else:
             print(f"❌ {message}")
     
+    @timed_phase("ui")
     def print_warning(self, message: str):
         """Print warning message"""
         if self.console:
@@ -139,6 +811,7 @@ class K8sUI:
         else:
             print(f"⚠️  {message}")
     
+    @timed_phase("ui")
     def print_info(self, message: str):
         """Print info message"""
         if self.console:
@@ -146,9 +819,12 @@ class K8sUI:
         else:
             print(f"ℹ️  {message}")
     
+    @timed_phase("ui")
     def show_yaml(self, yaml_content: str, title: str = "Generated YAML"):
         """Display YAML content with syntax highlighting"""
         if self.console:
+            from rich.panel import Panel
+            from rich.syntax import Syntax
             syntax = Syntax(yaml_content, "yaml", theme="monokai", line_numbers=True)
             panel = Panel(syntax, title=title, border_style="green")
             self.console.print(panel)
@@ -157,9 +833,11 @@ class K8sUI:
             print("-" * len(title))
             print(yaml_content)
     
+    @timed_phase("ui")
     def show_table(self, data: List[Dict], title: str = "Resources"):
         """Display data in a table format"""
         if self.console and data:
+            from rich.table import Table
             table = Table(title=title)
             for key in data[0].keys():
                 table.add_column(key, style="cyan")
@@ -170,6 +848,75 @@ class K8sUI:
             print(f"\n{title}:")
             for item in data:
                 print(f"  {item}")
+    
+    @timed_phase("ui")
+    def show_text(self, text: str):
+        """Display preformatted text as is"""
+        print(text)
+
+
+class HeadlessUI(AgentUI):
+    """Discards all output; for servers that return results instead of drawing them"""
+    
+    def print_header(self, title: str, subtitle: str = ""):
+        pass
+    
+    def print_success(self, message: str):
+        pass
+    
+    def print_error(self, message: str):
+        pass
+    
+    def print_warning(self, message: str):
+        pass
+    
+    def print_info(self, message: str):
+        pass
+    
+    def show_yaml(self, yaml_content: str, title: str = "Generated YAML"):
+        pass
+    
+    def show_table(self, data: List[Dict], title: str = "Resources"):
+        pass
+    
+    def show_text(self, text: str):
+        pass
+
+
+class EventUI(AgentUI):
+    """Passes every output call to sink as a dict instead of rendering it.
+
+    Events have an "event" key (header, success, error, warning, info,
+    yaml, table or text) plus the call's arguments; YAML, rows and text are
+    passed by reference, not copied.
+    """
+    
+    def __init__(self, sink: Callable[[Dict[str, Any]], None]):
+        self.sink = sink
+    
+    def print_header(self, title: str, subtitle: str = ""):
+        self.sink({"event": "header", "title": title, "subtitle": subtitle})
+    
+    def print_success(self, message: str):
+        self.sink({"event": "success", "message": message})
+    
+    def print_error(self, message: str):
+        self.sink({"event": "error", "message": message})
+    
+    def print_warning(self, message: str):
+        self.sink({"event": "warning", "message": message})
+    
+    def print_info(self, message: str):
+        self.sink({"event": "info", "message": message})
+    
+    def show_yaml(self, yaml_content: str, title: str = "Generated YAML"):
+        self.sink({"event": "yaml", "title": title, "yaml": yaml_content})
+    
+    def show_table(self, data: List[Dict], title: str = "Resources"):
+        self.sink({"event": "table", "title": title, "rows": data})
+    
+    def show_text(self, text: str):
+        self.sink({"event": "text", "text": text})
 
 
 # Input Validation and Guardrails
@@ -179,6 +926,7 @@ class InputValidator:
     def __init__(self, config: K8sConfig):
         self.config = config
     
+    @timed_phase("validate")
     def validate_name(self, name: str) -> str:
         """Validate resource name"""
         if not name:
@@ -193,6 +941,7 @@ class InputValidator:
         
         return name.lower().strip()
     
+    @timed_phase("validate")
     def validate_image(self, image: str) -> str:
         """Validate container image"""
         if not image:
@@ -208,6 +957,7 @@ class InputValidator:
         
         return image.strip()
     
+    @timed_phase("validate")
     def validate_replicas(self, replicas: int) -> int:
         """Validate replica count"""
         if not isinstance(replicas, int) or replicas < 0:
@@ -218,6 +968,7 @@ class InputValidator:
         
         return replicas
     
+    @timed_phase("validate")
     def validate_namespace(self, namespace: str) -> str:
         """Validate namespace"""
         if not namespace:
@@ -228,6 +979,7 @@ class InputValidator:
         
         return self.validate_name(namespace)
     
+    @timed_phase("validate")
     def validate_port(self, port: int) -> int:
         """Validate port number"""
         if not isinstance(port, int) or port < 1 or port > 65535:
@@ -237,6 +989,8 @@ class InputValidator:
 
 
 # Enhanced YAML Generation Functions
+@traced(result_attributes=lambda content: {"yaml.bytes": len(content)})
+@timed_phase("render")
 def generate_deployment_yaml(name: str, image: str, replicas: int = 1, namespace: str = "default", port: int = 80, 
                            cpu_limit: str = "500m", memory_limit: str = "512Mi", env_vars: Dict[str, str] = None):
     """Generate a comprehensive deployment YAML with resource limits and environment variables"""
@@ -286,6 +1040,8 @@ def generate_deployment_yaml(name: str, image: str, replicas: int = 1, namespace
     return yaml.dump(deployment, default_flow_style=False, sort_keys=False)
 
 
+@traced(result_attributes=lambda content: {"yaml.bytes": len(content)})
+@timed_phase("render")
 def generate_service_yaml(name: str, port: int = 80, target_port: int = 80, namespace: str = "default", 
                          service_type: str = "ClusterIP"):
     """Generate a service YAML"""
@@ -306,6 +1062,8 @@ def generate_service_yaml(name: str, port: int = 80, target_port: int = 80, name
     return yaml.dump(service, default_flow_style=False, sort_keys=False)
 
 
+@traced(result_attributes=lambda content: {"yaml.bytes": len(content)})
+@timed_phase("render")
 def generate_configmap_yaml(name: str, data: Dict[str, str], namespace: str = "default"):
     """Generate a ConfigMap YAML"""
     configmap = {
@@ -321,6 +1079,8 @@ def generate_configmap_yaml(name: str, data: Dict[str, str], namespace: str = "d
     return yaml.dump(configmap, default_flow_style=False, sort_keys=False)
 
 
+@traced(result_attributes=lambda content: {"yaml.bytes": len(content)})
+@timed_phase("render")
 def generate_secret_yaml(name: str, data: Dict[str, str], namespace: str = "default"):
     """Generate a Secret YAML"""
     import base64
@@ -340,147 +1100,2426 @@ def generate_secret_yaml(name: str, data: Dict[str, str], namespace: str = "defa
     return yaml.dump(secret, default_flow_style=False, sort_keys=False)
 
 
-# Enhanced kubectl Operations with Error Handling
-class K8sOperations:
-    """Handles all Kubernetes operations with comprehensive error handling"""
-    
-    def __init__(self, config: K8sConfig, ui: K8sUI):
-        self.config = config
-        self.ui = ui
-        self.validator = InputValidator(config)
-    
-    def _run_kubectl(self, cmd: List[str], timeout: int = None) -> Dict[str, Any]:
-        """Run kubectl command with error handling"""
+# Resource Type Registry
+@dataclass(frozen=True)
+class ResourceKind:
+    """API coordinates of a Kubernetes resource type"""
+    kind: str
+    plural: str
+    api_version: str = "v1"
+    namespaced: bool = True
+
+    @property
+    def group(self) -> str:
+        return self.api_version.split("/")[0] if "/" in self.api_version else ""
+
+    @property
+    def qualified_name(self) -> str:
+        """Name as printed by kubectl, e.g. 'deployment.apps'"""
+        return f"{self.kind.lower()}.{self.group}" if self.group else self.kind.lower()
+
+    def path(self, namespace: str = None, name: str = None, subresource: str = None) -> str:
+        """Build the REST path for a collection, an object or a subresource"""
+        path = f"/apis/{self.api_version}" if self.group else f"/api/{self.api_version}"
+        if self.namespaced and namespace:
+            path += f"/namespaces/{namespace}"
+        path += f"/{self.plural}"
+        if name:
+            path += f"/{name}"
+            if subresource:
+                path += f"/{subresource}"
+        return path
+
+
+RESOURCE_KINDS: Dict[str, ResourceKind] = {kind.plural: kind for kind in [
+    ResourceKind("Pod", "pods"),
+    ResourceKind("Service", "services"),
+    ResourceKind("ConfigMap", "configmaps"),
+    ResourceKind("Secret", "secrets"),
+    ResourceKind("ServiceAccount", "serviceaccounts"),
+    ResourceKind("Endpoints", "endpoints"),
+    ResourceKind("Event", "events"),
+    ResourceKind("PersistentVolumeClaim", "persistentvolumeclaims"),
+    ResourceKind("PersistentVolume", "persistentvolumes", namespaced=False),
+    ResourceKind("Namespace", "namespaces", namespaced=False),
+    ResourceKind("Node", "nodes", namespaced=False),
+    ResourceKind("Deployment", "deployments", "apps/v1"),
+    ResourceKind("ReplicaSet", "replicasets", "apps/v1"),
+    ResourceKind("StatefulSet", "statefulsets", "apps/v1"),
+    ResourceKind("DaemonSet", "daemonsets", "apps/v1"),
+    ResourceKind("Job", "jobs", "batch/v1"),
+    ResourceKind("CronJob", "cronjobs", "batch/v1"),
+    ResourceKind("Ingress", "ingresses", "networking.k8s.io/v1"),
+    ResourceKind("HorizontalPodAutoscaler", "horizontalpodautoscalers", "autoscaling/v2"),
+]}
+
+RESOURCE_ALIASES = {
+    "po": "pods", "svc": "services", "cm": "configmaps", "sa": "serviceaccounts",
+    "ep": "endpoints", "ev": "events", "pvc": "persistentvolumeclaims",
+    "pv": "persistentvolumes", "ns": "namespaces", "no": "nodes",
+    "deploy": "deployments", "rs": "replicasets", "sts": "statefulsets",
+    "ds": "daemonsets", "cj": "cronjobs", "ing": "ingresses", "hpa": "horizontalpodautoscalers",
+}
+
+
+def resolve_resource_kind(resource_type: str) -> Optional[ResourceKind]:
+    """Resolve a plural, singular, short or kind name to a known resource type"""
+    key = (resource_type or "").strip().lower()
+    key = RESOURCE_ALIASES.get(key, key)
+    if key in RESOURCE_KINDS:
+        return RESOURCE_KINDS[key]
+    for kind in RESOURCE_KINDS.values():
+        if key == kind.kind.lower():
+            return kind
+    return None
+
+
+def resource_kind_for_object(obj: Dict[str, Any]) -> Optional[ResourceKind]:
+    """Find the resource type of a manifest from its apiVersion and kind"""
+    for kind in RESOURCE_KINDS.values():
+        if kind.kind == obj.get("kind") and kind.api_version == obj.get("apiVersion"):
+            return kind
+    return None
+
+
+def label_selector_from(selector: Dict[str, Any]) -> str:
+    """Render a LabelSelector (matchLabels/matchExpressions) as a selector string"""
+    terms = [f"{key}={value}" for key, value in (selector or {}).get("matchLabels", {}).items()]
+    for expression in (selector or {}).get("matchExpressions", []):
+        key, operator = expression["key"], expression["operator"]
+        values = ",".join(expression.get("values", []))
+        if operator == "In":
+            terms.append(f"{key} in ({values})")
+        elif operator == "NotIn":
+            terms.append(f"{key} notin ({values})")
+        elif operator == "Exists":
+            terms.append(key)
+        elif operator == "DoesNotExist":
+            terms.append(f"!{key}")
+    return ",".join(terms)
+
+
+# Namespace argument that lists a namespaced collection across every namespace
+ALL_NAMESPACES = "*"
+
+
+# Accept headers for the LIST response shapes; the API server answers plain
+# JSON when it cannot produce the requested one
+LIST_VIEWS = {
+    "full": "application/json",
+    "metadata": "application/json;as=PartialObjectMetadataList;g=meta.k8s.io;v=v1,application/json",
+    "table": "application/json;as=Table;g=meta.k8s.io;v=v1,application/json",
+}
+
+
+# Kinds that other objects depend on are applied first; unknown kinds go last
+APPLY_ORDER = [
+    "Namespace", "ResourceQuota", "LimitRange", "ServiceAccount", "Secret", "ConfigMap",
+    "PersistentVolumeClaim", "Role", "RoleBinding", "Service", "Deployment", "StatefulSet",
+    "DaemonSet", "Job", "CronJob", "Ingress", "HorizontalPodAutoscaler",
+]
+
+
+def sort_for_apply(documents: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Order manifests so dependencies exist before the objects that use them"""
+    rank = {kind: i for i, kind in enumerate(APPLY_ORDER)}
+    return sorted(documents, key=lambda doc: rank.get(doc.get("kind"), len(APPLY_ORDER)))
+
+
+# Operations Backends
+def http_pool_size(config: K8sConfig) -> int:
+    """Keep-alive connections kept by the HTTP backends.
+
+    At least as many as the bulk scale and log aggregation fan-outs use,
+    so their parallel requests reuse connections instead of having them
+    discarded by a full pool.
+    """
+    return max(config.connection_pool_size, config.scale_concurrency, config.log_concurrency)
+
+
+async def iter_lines(chunks, max_line_bytes: int = 16384):
+    """Split an async stream of byte chunks into decoded lines.
+
+    Lines longer than max_line_bytes are cut at the limit and the rest of
+    the line is discarded, so a stream never buffers more than one chunk
+    plus one line.
+    """
+    buffer = b""
+    discarding = False
+    async for chunk in chunks:
+        buffer += chunk
+        while True:
+            newline = buffer.find(b"\n")
+            if newline == -1:
+                if len(buffer) > max_line_bytes:
+                    if not discarding:
+                        yield buffer[:max_line_bytes].decode("utf-8", errors="replace")
+                    discarding = True
+                    buffer = b""
+                break
+            line, buffer = buffer[:newline], buffer[newline + 1:]
+            if not discarding:
+                yield line[:max_line_bytes].decode("utf-8", errors="replace")
+            discarding = False
+    if buffer and not discarding:
+        yield buffer[:max_line_bytes].decode("utf-8", errors="replace")
+
+
+@dataclass
+class KubectlRequest:
+    """A kubectl invocation whose stdin receives input"""
+    cmd: List[str]
+    input: str = None
+
+
+@dataclass
+class APIRequest:
+    """A single HTTP request to the Kubernetes API server"""
+    method: str
+    path: str
+    query: Dict[str, Any] = None
+    body: str = None
+    content_type: str = "application/json"
+    accept: str = "application/json"
+
+
+@dataclass
+class APIResponse:
+    """Transport-independent view of an API server response"""
+    status: int
+    data: bytes
+    reason: str = ""
+
+
+@dataclass
+class FallbackCall:
+    """Delegates an operation to the fallback backend"""
+    method: str
+    args: tuple
+
+
+class OperationsBackend(ABC):
+    """Executes Kubernetes operations for K8sOperations.
+
+    Each operation is written once as a generator that yields requests
+    (a kubectl argv or an APIRequest) and receives their results, so the
+    same code drives both the blocking methods and their asyncio
+    counterparts (prefixed with 'a'). Backends raise ResourceError on
+    failure; mutating operations return a kubectl-style result dict with
+    success, stdout, stderr and returncode keys.
+    """
+
+    name = "base"
+    # Capabilities callers check before using watch() or astream_logs()
+    supports_watch = False
+    supports_log_stream = False
+    # Requests that can share the backend's connection pool at once; None is unbounded
+    max_parallel_requests: Optional[int] = None
+
+    @abstractmethod
+    def _execute(self, request: Any) -> Any:
+        """Perform one request yielded by an operation and return its result"""
+
+    @abstractmethod
+    async def _aexecute(self, request: Any) -> Any:
+        """Perform one request on the event loop"""
+
+    def _drive(self, operation):
+        """Run an operation generator with blocking I/O.
+
+        Errors raised while executing a request are thrown back into the
+        generator at its yield, so an operation can handle them per request.
+        """
         try:
-            timeout = timeout or self.config.timeout
-            result = subprocess.run(
-                cmd, 
-                capture_output=True, 
-                text=True, 
-                timeout=timeout,
-                check=False
-            )
-            
-            return {
-                "success": result.returncode == 0,
-                "stdout": result.stdout,
-                "stderr": result.stderr,
-                "returncode": result.returncode
+            request = next(operation)
+            while True:
+                try:
+                    result = self._execute(request)
+                except Exception as e:
+                    request = operation.throw(e)
+                    continue
+                request = operation.send(result)
+        except StopIteration as done:
+            return done.value
+        finally:
+            operation.close()
+
+    async def _adrive(self, operation):
+        """Run an operation generator on the event loop"""
+        try:
+            request = next(operation)
+            while True:
+                try:
+                    result = await self._aexecute(request)
+                except Exception as e:
+                    request = operation.throw(e)
+                    continue
+                request = operation.send(result)
+        except StopIteration as done:
+            return done.value
+        finally:
+            operation.close()
+
+    def list_objects(self, resource_type: str, namespace: str = None, label_selector: str = None,
+                     field_selector: str = None, limit: int = None, continue_token: str = None,
+                     view: str = "full") -> Dict[str, Any]:
+        """Return the List object for a resource type.
+
+        view is one of LIST_VIEWS; "metadata" and "table" ask the API server
+        for PartialObjectMetadataList or Table responses instead of full
+        objects. With limit, metadata.continue holds the next page token.
+        """
+        return self._drive(self._list_objects(resource_type, namespace, label_selector, field_selector,
+                                              limit, continue_token, view))
+
+    async def alist_objects(self, resource_type: str, namespace: str = None, label_selector: str = None,
+                            field_selector: str = None, limit: int = None, continue_token: str = None,
+                            view: str = "full") -> Dict[str, Any]:
+        return await self._adrive(self._list_objects(resource_type, namespace, label_selector, field_selector,
+                                                     limit, continue_token, view))
+
+    def get_object(self, resource_type: str, name: str, namespace: str = None) -> Dict[str, Any]:
+        """Return a single object"""
+        return self._drive(self._get_object(resource_type, name, namespace))
+
+    async def aget_object(self, resource_type: str, name: str, namespace: str = None) -> Dict[str, Any]:
+        return await self._adrive(self._get_object(resource_type, name, namespace))
+
+    def get_logs(self, pod_name: str, namespace: str = None, lines: int = 100, container: str = None,
+                 timestamps: bool = False) -> str:
+        return self._drive(self._get_logs(pod_name, namespace, lines, container, timestamps))
+
+    async def aget_logs(self, pod_name: str, namespace: str = None, lines: int = 100, container: str = None,
+                        timestamps: bool = False) -> str:
+        return await self._adrive(self._get_logs(pod_name, namespace, lines, container, timestamps))
+
+    def describe(self, resource_type: str, name: str, namespace: str = None) -> str:
+        return self._drive(self._describe(resource_type, name, namespace))
+
+    async def adescribe(self, resource_type: str, name: str, namespace: str = None) -> str:
+        return await self._adrive(self._describe(resource_type, name, namespace))
+
+    def scale(self, name: str, replicas: int, namespace: str = None) -> Dict[str, Any]:
+        return self._drive(self._scale(name, replicas, namespace))
+
+    async def ascale(self, name: str, replicas: int, namespace: str = None) -> Dict[str, Any]:
+        return await self._adrive(self._scale(name, replicas, namespace))
+
+    def delete(self, resource_type: str, name: str, namespace: str = None) -> Dict[str, Any]:
+        return self._drive(self._delete(resource_type, name, namespace))
+
+    async def adelete(self, resource_type: str, name: str, namespace: str = None) -> Dict[str, Any]:
+        return await self._adrive(self._delete(resource_type, name, namespace))
+
+    def apply(self, yaml_content: str, dry_run: bool = False, field_manager: str = None,
+              force_conflicts: bool = None) -> Dict[str, Any]:
+        return self._drive(self._apply(yaml_content, dry_run, field_manager, force_conflicts))
+
+    async def aapply(self, yaml_content: str, dry_run: bool = False, field_manager: str = None,
+                     force_conflicts: bool = None) -> Dict[str, Any]:
+        return await self._adrive(self._apply(yaml_content, dry_run, field_manager, force_conflicts))
+
+    def apply_objects(self, documents: List[Dict[str, Any]], dry_run: bool = False, field_manager: str = None,
+                      force_conflicts: bool = None) -> List[Dict[str, Any]]:
+        """Apply objects in the given order and report the outcome of each.
+
+        A failing object does not stop the batch; its result carries the
+        error instead.
+        """
+        return self._drive(self._apply_objects(documents, dry_run, field_manager, force_conflicts))
+
+    async def aapply_objects(self, documents: List[Dict[str, Any]], dry_run: bool = False, field_manager: str = None,
+                             force_conflicts: bool = None) -> List[Dict[str, Any]]:
+        return await self._adrive(self._apply_objects(documents, dry_run, field_manager, force_conflicts))
+
+    @staticmethod
+    def _object_result(doc: Dict[str, Any], success: bool, action: str = "", error: str = "") -> Dict[str, Any]:
+        metadata = doc.get("metadata", {})
+        return {
+            "kind": doc.get("kind", ""),
+            "name": metadata.get("name", ""),
+            "namespace": metadata.get("namespace", ""),
+            "success": success,
+            "action": action,
+            "error": error
+        }
+
+    def _apply_options(self, field_manager: str = None, force_conflicts: bool = None):
+        """Field manager and force-conflicts, defaulting to the configured values"""
+        field_manager = field_manager or self.config.apply_field_manager
+        force_conflicts = self.config.apply_force_conflicts if force_conflicts is None else force_conflicts
+        return field_manager, force_conflicts
+
+    def discover(self) -> Dict[str, Any]:
+        """Return the server version and the API resources the cluster serves.
+
+        Each resource is a dict with name, singular, kind, api_version,
+        namespaced and short_names. Raises ResourceError when the cluster
+        cannot be reached.
+        """
+        return self._drive(self._discover())
+
+    async def adiscover(self) -> Dict[str, Any]:
+        return await self._adrive(self._discover())
+
+    @staticmethod
+    def _resource_entry(name: str, api_version: str, kind: str, namespaced: bool,
+                        short_names: List[str] = None, singular: str = "") -> Dict[str, Any]:
+        return {
+            "name": name,
+            "singular": singular or kind.lower(),
+            "kind": kind,
+            "api_version": api_version,
+            "namespaced": namespaced,
+            "short_names": short_names or []
+        }
+
+    def watch(self, resource_type: str, namespace: str = None, resource_version: str = None,
+              timeout_seconds: int = 300):
+        """Yield watch events ({'type': ..., 'object': ...}) for a collection; check supports_watch first"""
+        raise ResourceError(f"{self.name} backend does not support watch")
+
+    async def astream_logs(self, pod_name: str, namespace: str = None, container: str = None,
+                           follow: bool = False, since_seconds: int = None, timestamps: bool = False,
+                           tail_lines: int = None, max_line_bytes: int = 16384):
+        """Yield log lines of a pod as they are read, optionally following new output"""
+        raise ResourceError(f"{self.name} backend does not support log streaming")
+        yield
+
+    def close(self):
+        """Interrupt open watch streams"""
+        pass
+
+    def shutdown(self):
+        """Release helper processes; the backend is not used afterwards"""
+        pass
+
+
+class KubectlBackend(OperationsBackend):
+    """Backend that runs one kubectl subprocess per operation"""
+
+    name = "kubectl"
+    supports_log_stream = True
+
+    def __init__(self, config: K8sConfig):
+        self.config = config
+
+    def run(self, cmd: List[str], timeout: int = None, input: str = None) -> Dict[str, Any]:
+        """Run kubectl command with error handling"""
+        try:
+            timeout = timeout or self.config.timeout
+            with observe_backend_call(self.name, *kubectl_call_labels(cmd), {"process.command": " ".join(cmd)}) as call:
+                result = subprocess.run(
+                    cmd, 
+                    input=input,
+                    capture_output=True, 
+                    text=True, 
+                    timeout=timeout,
+                    check=False
+                )
+                call.failed = result.returncode != 0
+                call.span.set_attributes({
+                    "process.exit_code": result.returncode,
+                    "process.stdout_bytes": len(result.stdout),
+                    "process.stderr_bytes": len(result.stderr)
+                })
+            
+            return {
+                "success": result.returncode == 0,
+                "stdout": result.stdout,
+                "stderr": result.stderr,
+                "returncode": result.returncode
             }
         except subprocess.TimeoutExpired:
             raise ResourceError(f"kubectl command timed out after {timeout} seconds")
         except FileNotFoundError:
             raise ResourceError("kubectl not found. Please install kubectl and ensure it's in PATH")
         except Exception as e:
-            raise ResourceError(f"Failed to run kubectl command: {str(e)}")
+            raise ResourceError(f"Failed to run kubectl command: {str(e)}")
+
+    async def arun(self, cmd: List[str], timeout: int = None, input: str = None) -> Dict[str, Any]:
+        """Run kubectl command on the event loop.
+
+        The subprocess is killed when the timeout expires or the calling
+        task is cancelled, so no orphaned kubectl processes are left behind.
+        """
+        timeout = timeout or self.config.timeout
+        with observe_backend_call(self.name, *kubectl_call_labels(cmd), {"process.command": " ".join(cmd)}) as call:
+            try:
+                process = await asyncio.create_subprocess_exec(
+                    *cmd,
+                    stdin=asyncio.subprocess.PIPE if input is not None else None,
+                    stdout=asyncio.subprocess.PIPE,
+                    stderr=asyncio.subprocess.PIPE
+                )
+            except FileNotFoundError:
+                raise ResourceError("kubectl not found. Please install kubectl and ensure it's in PATH")
+            except Exception as e:
+                raise ResourceError(f"Failed to run kubectl command: {str(e)}")
+            
+            try:
+                stdout, stderr = await asyncio.wait_for(
+                    process.communicate(input.encode() if input is not None else None), timeout
+                )
+            except asyncio.TimeoutError:
+                await self._terminate(process)
+                raise ResourceError(f"kubectl command timed out after {timeout} seconds")
+            except asyncio.CancelledError:
+                await asyncio.shield(self._terminate(process))
+                raise
+            call.failed = process.returncode != 0
+            call.span.set_attributes({
+                "process.exit_code": process.returncode,
+                "process.stdout_bytes": len(stdout),
+                "process.stderr_bytes": len(stderr)
+            })
+        
+        return {
+            "success": process.returncode == 0,
+            "stdout": stdout.decode("utf-8", errors="replace"),
+            "stderr": stderr.decode("utf-8", errors="replace"),
+            "returncode": process.returncode
+        }
+
+    @staticmethod
+    async def _terminate(process):
+        if process.returncode is None:
+            try:
+                process.kill()
+            except ProcessLookupError:
+                pass
+            await process.wait()
+
+    async def astream_logs(self, pod_name: str, namespace: str = None, container: str = None,
+                           follow: bool = False, since_seconds: int = None, timestamps: bool = False,
+                           tail_lines: int = None, max_line_bytes: int = 16384):
+        cmd = ["kubectl", "logs", pod_name]
+        if container:
+            cmd.extend(["-c", container])
+        if follow:
+            cmd.append("--follow")
+        if since_seconds:
+            cmd.append(f"--since={since_seconds}s")
+        if timestamps:
+            cmd.append("--timestamps")
+        if tail_lines is not None:
+            cmd.append(f"--tail={tail_lines}")
+        cmd = self._namespaced(cmd, namespace)
+        
+        try:
+            process = await asyncio.create_subprocess_exec(
+                *cmd,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE
+            )
+        except FileNotFoundError:
+            raise ResourceError("kubectl not found. Please install kubectl and ensure it's in PATH")
+        
+        async def chunks():
+            while True:
+                chunk = await process.stdout.read(65536)
+                if not chunk:
+                    return
+                yield chunk
+        
+        stderr = bytearray()
+        
+        async def drain_stderr():
+            # Read stderr as it arrives so a chatty kubectl cannot fill the pipe and stall stdout;
+            # only the last 64 KiB are kept for the error message
+            while True:
+                chunk = await process.stderr.read(65536)
+                if not chunk:
+                    return
+                stderr.extend(chunk)
+                del stderr[:-65536]
+        
+        drainer = asyncio.create_task(drain_stderr())
+        try:
+            async for line in iter_lines(chunks(), max_line_bytes):
+                yield line
+            if await process.wait() != 0:
+                await drainer
+                raise ResourceError(f"Failed to stream logs for {pod_name}: "
+                                    f"{stderr.decode('utf-8', errors='replace')}")
+        finally:
+            await asyncio.shield(self._terminate(process))
+            drainer.cancel()
+            await asyncio.gather(drainer, return_exceptions=True)
+
+    def _execute(self, request: Union[List[str], KubectlRequest]) -> Dict[str, Any]:
+        if isinstance(request, KubectlRequest):
+            return self.run(request.cmd, input=request.input)
+        return self.run(request)
+
+    async def _aexecute(self, request: Union[List[str], KubectlRequest]) -> Dict[str, Any]:
+        if isinstance(request, KubectlRequest):
+            return await self.arun(request.cmd, input=request.input)
+        return await self.arun(request)
+
+    @staticmethod
+    def _namespaced(cmd: List[str], namespace: str = None) -> List[str]:
+        if namespace == ALL_NAMESPACES:
+            return cmd + ["--all-namespaces"]
+        return cmd + ["-n", namespace] if namespace else cmd
+
+    def _list_objects(self, resource_type: str, namespace: str = None, label_selector: str = None,
+                      field_selector: str = None, limit: int = None, continue_token: str = None,
+                      view: str = "full"):
+        # kubectl get --raw cannot set the Accept header the metadata and table views need
+        if view and view != "full":
+            raise ResourceError(f"The kubectl backend does not support view='{view}' lists")
+        kind = resolve_resource_kind(resource_type)
+        if (limit or continue_token) and kind is None:
+            raise ResourceError(f"The kubectl backend cannot page '{resource_type}': no API path is known for it")
+        if limit or continue_token:
+            # kubectl get cannot resume from a continue token, so request the page directly
+            query = {"labelSelector": label_selector, "fieldSelector": field_selector,
+                     "limit": limit, "continue": continue_token}
+            query = urlencode({k: v for k, v in query.items() if v})
+            if namespace == ALL_NAMESPACES or not kind.namespaced:
+                namespace = None
+            else:
+                namespace = namespace or self.config.namespace
+            path = kind.path(namespace)
+            cmd = ["kubectl", "get", "--raw", f"{path}?{query}"]
+        else:
+            cmd = ["kubectl", "get", resource_type, "-o", "json"]
+            if label_selector:
+                cmd.extend(["-l", label_selector])
+            if field_selector:
+                cmd.append(f"--field-selector={field_selector}")
+            cmd = self._namespaced(cmd, namespace)
+        result = yield cmd
+        
+        if not result["success"]:
+            raise ResourceError(f"Failed to list {resource_type}: {result['stderr']}")
+        
+        return json.loads(result["stdout"])
+
+    def _discover(self):
+        result = yield ["kubectl", "version", "-o", "json"]
+        if not result["success"]:
+            raise ResourceError(f"Cluster discovery failed: {result['stderr']}")
+        server_version = json.loads(result["stdout"]).get("serverVersion", {}).get("gitVersion")
+        
+        result = yield ["kubectl", "api-resources", "--no-headers"]
+        if not result["success"]:
+            raise ResourceError(f"Cluster discovery failed: {result['stderr']}")
+        
+        # Columns are NAME [SHORTNAMES] APIVERSION NAMESPACED KIND; only SHORTNAMES may be empty
+        resources = []
+        for line in result["stdout"].splitlines():
+            fields = line.split()
+            if len(fields) < 4:
+                continue
+            short_names = fields[1].split(",") if len(fields) > 4 else []
+            resources.append(self._resource_entry(fields[0], fields[-3], fields[-1], fields[-2] == "true", short_names))
+        return {"server_version": server_version, "resources": resources}
+
+    def _get_object(self, resource_type: str, name: str, namespace: str = None):
+        result = yield self._namespaced(["kubectl", "get", resource_type, name, "-o", "json"], namespace)
+        
+        if not result["success"]:
+            raise ResourceError(f"Failed to get {resource_type} {name}: {result['stderr']}")
+        
+        return json.loads(result["stdout"])
+
+    def _get_logs(self, pod_name: str, namespace: str = None, lines: int = 100, container: str = None,
+                  timestamps: bool = False):
+        cmd = ["kubectl", "logs", pod_name, f"--tail={lines}"]
+        if container:
+            cmd.extend(["-c", container])
+        if timestamps:
+            cmd.append("--timestamps")
+        result = yield self._namespaced(cmd, namespace)
+        
+        if not result["success"]:
+            raise ResourceError(f"Failed to get logs for {pod_name}: {result['stderr']}")
+        
+        return result["stdout"]
+
+    def _describe(self, resource_type: str, name: str, namespace: str = None):
+        result = yield self._namespaced(["kubectl", "describe", resource_type, name], namespace)
+        
+        if not result["success"]:
+            raise ResourceError(f"Failed to describe {resource_type} {name}: {result['stderr']}")
+        
+        return result["stdout"]
+
+    def _scale(self, name: str, replicas: int, namespace: str = None):
+        result = yield self._namespaced(["kubectl", "scale", "deployment", name, f"--replicas={replicas}"], namespace)
+        
+        if not result["success"]:
+            raise ResourceError(f"Failed to scale deployment {name}: {result['stderr']}")
+        
+        return result
+
+    def _delete(self, resource_type: str, name: str, namespace: str = None):
+        result = yield self._namespaced(["kubectl", "delete", resource_type, name], namespace)
+        
+        if not result["success"]:
+            raise ResourceError(f"Failed to delete {resource_type} {name}: {result['stderr']}")
+        
+        return result
+
+    def _apply_command(self, dry_run: bool = False, field_manager: str = None,
+                       force_conflicts: bool = None) -> List[str]:
+        field_manager, force_conflicts = self._apply_options(field_manager, force_conflicts)
+        cmd = ["kubectl", "apply", "-f", "-", f"--field-manager={field_manager}"]
+        if self.config.apply_server_side:
+            cmd.append("--server-side")
+            if force_conflicts:
+                cmd.append("--force-conflicts")
+        if dry_run:
+            cmd.append("--dry-run=server" if self.config.apply_server_side else "--dry-run=client")
+        return cmd
+
+    def _apply(self, yaml_content: str, dry_run: bool = False, field_manager: str = None,
+               force_conflicts: bool = None):
+        """Pipe the manifest to kubectl apply on stdin"""
+        result = yield KubectlRequest(self._apply_command(dry_run, field_manager, force_conflicts), yaml_content)
+        
+        if not result["success"]:
+            raise ResourceError(f"Failed to apply YAML: {result['stderr']}")
+        
+        return result
+
+    def _apply_objects(self, documents: List[Dict[str, Any]], dry_run: bool = False, field_manager: str = None,
+                       force_conflicts: bool = None):
+        """Apply the whole batch with one kubectl process and match its output to each object"""
+        result = yield KubectlRequest(
+            self._apply_command(dry_run, field_manager, force_conflicts),
+            yaml.dump_all(documents, default_flow_style=False, sort_keys=False)
+        )
+        
+        # kubectl prints one "<resource>[.<group>]/<name> <action>" line per applied object
+        actions = {}
+        for line in result["stdout"].splitlines():
+            reference, _, action = line.partition(" ")
+            resource, _, name = reference.partition("/")
+            actions[(resource.split(".")[0], name)] = action
+        
+        results = []
+        for doc in documents:
+            action = actions.get((doc.get("kind", "").lower(), doc.get("metadata", {}).get("name")))
+            if action is not None:
+                results.append(self._object_result(doc, True, action))
+            else:
+                results.append(self._object_result(doc, False, error=result["stderr"].strip() or "not applied"))
+        return results
+
+
+class KubernetesAPIBackend(OperationsBackend):
+    """Backend that talks to the API server over one pooled keep-alive connection.
+
+    Kubeconfig and credentials are loaded once; every request reuses the
+    urllib3 pool of the official client, so there is no per-call process
+    start-up or TLS handshake. The asyncio path uses an httpx.AsyncClient
+    with the same TLS settings when httpx is installed. Resource types
+    outside RESOURCE_KINDS are delegated to the fallback backend.
+    """
+
+    name = "api"
+    supports_watch = True
+
+    @property
+    def supports_log_stream(self) -> bool:
+        # Streaming needs httpx; without it the kubectl fallback streams instead
+        return HTTPX_AVAILABLE or (self.fallback is not None and self.fallback.supports_log_stream)
+
+    def __init__(self, config: K8sConfig, fallback: OperationsBackend = None):
+        if not KUBERNETES_CLIENT_AVAILABLE:
+            raise ResourceError("kubernetes client not installed. Install with: pip install kubernetes")
+        
+        self.config = config
+        self.fallback = fallback
+        self.client_config = self._load_client_configuration()
+        self.max_parallel_requests = http_pool_size(config)
+        self.client_config.connection_pool_maxsize = self.max_parallel_requests
+        self.api_client = k8s_client.ApiClient(self.client_config)
+        self.pool = self.api_client.rest_client.pool_manager
+        # Long-running watches get their own pool so they never hold the
+        # keep-alive connections used by regular requests
+        self.watch_pool = urllib3.PoolManager(**{**self.pool.connection_pool_kw, "maxsize": 32})
+        self.host = self.client_config.host.rstrip("/")
+        self._watch_responses = set()
+        self._watch_lock = threading.Lock()
+        self._async_client = None
+        self._async_client_loop = None
+        self._async_client_closer = None
+
+    @staticmethod
+    def _load_client_configuration():
+        """Load kubeconfig, falling back to the in-cluster service account"""
+        client_config = k8s_client.Configuration()
+        try:
+            k8s_client_config.load_kube_config(
+                config_file=os.environ.get("KUBECONFIG"),
+                client_configuration=client_config
+            )
+        except Exception as kubeconfig_error:
+            try:
+                k8s_client_config.load_incluster_config(client_configuration=client_config)
+            except Exception:
+                raise ResourceError(f"Failed to load Kubernetes configuration: {str(kubeconfig_error)}")
+        return client_config
+
+    def _headers(self, accept: str = "application/json", content_type: str = None) -> Dict[str, str]:
+        headers = dict(self.api_client.default_headers)
+        headers["Accept"] = accept
+        if content_type:
+            headers["Content-Type"] = content_type
+        for auth in self.client_config.auth_settings().values():
+            if auth.get("in") == "header" and auth.get("value"):
+                headers[auth["key"]] = auth["value"]
+        return headers
+
+    def _url(self, path: str, query: Dict[str, Any] = None) -> str:
+        url = self.host + path
+        params = {k: v for k, v in (query or {}).items() if v is not None}
+        if params:
+            url += "?" + urlencode(params)
+        return url
+
+    def request(self, method: str, path: str, query: Dict[str, Any] = None, body: str = None,
+                content_type: str = "application/json", accept: str = "application/json",
+                timeout: float = None, preload_content: bool = True):
+        """Send a request to the API server and return the urllib3 response"""
+        try:
+            with observe_backend_call(self.name, *api_call_labels(method, path),
+                                      {"http.request.method": method, "url.path": path}) as call:
+                response = self.pool.request(
+                    method,
+                    self._url(path, query),
+                    headers=self._headers(accept, content_type if body is not None else None),
+                    body=body,
+                    preload_content=preload_content,
+                    timeout=timeout or self.config.timeout,
+                    retries=False
+                )
+                call.failed = response.status >= 400
+                call.span.set_attribute("http.response.status_code", response.status)
+                if preload_content:
+                    call.span.set_attribute("http.response.body.size", len(response.data))
+            return response
+        except urllib3.exceptions.HTTPError as e:
+            raise ResourceError(f"Kubernetes API request failed: {str(e)}")
+
+    def watch(self, resource_type: str, namespace: str = None, resource_version: str = None,
+              timeout_seconds: int = 300):
+        """Stream watch events for a collection over a chunked response.
+
+        An expired resourceVersion surfaces as an ERROR event whose object
+        is a Status with code 410; callers are expected to relist.
+        """
+        kind = resolve_resource_kind(resource_type)
+        if kind is None:
+            raise ResourceError(f"Failed to watch {resource_type}: unsupported resource type '{resource_type}'")
+        
+        query = {
+            "watch": "true",
+            "allowWatchBookmarks": "true",
+            "resourceVersion": resource_version,
+            "timeoutSeconds": timeout_seconds
+        }
+        try:
+            response = self.watch_pool.request(
+                "GET",
+                self._url(kind.path(self._namespace(kind, namespace)), query),
+                headers=self._headers(),
+                preload_content=False,
+                timeout=urllib3.Timeout(connect=self.config.timeout, read=timeout_seconds + 30),
+                retries=False
+            )
+        except urllib3.exceptions.HTTPError as e:
+            raise ResourceError(f"Kubernetes API request failed: {str(e)}")
+        
+        if response.status >= 400:
+            data = response.read()
+            response.release_conn()
+            raise ResourceError(
+                f"Failed to watch {resource_type}: {self._error_message(APIResponse(response.status, data, response.reason))}"
+            )
+        
+        with self._watch_lock:
+            self._watch_responses.add(response)
+        try:
+            buffer = b""
+            for chunk in response.stream(65536, decode_content=True):
+                buffer += chunk
+                while b"\n" in buffer:
+                    line, buffer = buffer.split(b"\n", 1)
+                    if line.strip():
+                        yield json.loads(line)
+        except (urllib3.exceptions.HTTPError, OSError, ValueError) as e:
+            raise ResourceError(f"Watch on {resource_type} interrupted: {str(e)}")
+        finally:
+            with self._watch_lock:
+                self._watch_responses.discard(response)
+            response.release_conn()
+
+    def close(self):
+        """Interrupt open watch streams and close the async client"""
+        with self._watch_lock:
+            responses = list(self._watch_responses)
+        for response in responses:
+            try:
+                response.shutdown() if hasattr(response, "shutdown") else response.close()
+            except Exception:
+                pass
+        self._release_async_client()
+
+    def shutdown(self):
+        self.close()
+
+    def _get_async_client(self):
+        """Return the httpx client bound to the running event loop.
+
+        A client's connections belong to its loop, so each client is closed
+        on that loop by a task that waits until it is cancelled: by
+        asyncio.run on the way out, by close(), or when a later call comes
+        from another loop and replaces the client.
+        """
+        loop = asyncio.get_running_loop()
+        if self._async_client is None or self._async_client_loop is not loop:
+            self._release_async_client()
+            client = httpx.AsyncClient(
+                **self._tls_options(),
+                timeout=self.config.timeout,
+                limits=httpx.Limits(max_keepalive_connections=http_pool_size(self.config))
+            )
+            self._async_client, self._async_client_loop = client, loop
+            self._async_client_closer = loop.create_task(self._close_with_loop(client))
+        return self._async_client
+
+    @staticmethod
+    async def _close_with_loop(client):
+        try:
+            await asyncio.get_running_loop().create_future()
+        finally:
+            await client.aclose()
+
+    def _release_async_client(self):
+        closer, loop = self._async_client_closer, self._async_client_loop
+        self._async_client = self._async_client_loop = self._async_client_closer = None
+        if closer is not None and not loop.is_closed():
+            loop.call_soon_threadsafe(closer.cancel)
+
+    def _tls_options(self) -> Dict[str, Any]:
+        """httpx verify/cert settings matching the kubeconfig"""
+        cfg = self.client_config
+        return {
+            "verify": (cfg.ssl_ca_cert or True) if cfg.verify_ssl else False,
+            "cert": (cfg.cert_file, cfg.key_file) if cfg.cert_file else None
+        }
+
+    async def astream_logs(self, pod_name: str, namespace: str = None, container: str = None,
+                           follow: bool = False, since_seconds: int = None, timestamps: bool = False,
+                           tail_lines: int = None, max_line_bytes: int = 16384):
+        if not HTTPX_AVAILABLE:
+            if self.fallback is None:
+                raise ResourceError("Log streaming with the api backend requires httpx. Install with: pip install httpx")
+            async for line in self.fallback.astream_logs(pod_name, namespace, container, follow, since_seconds,
+                                                         timestamps, tail_lines, max_line_bytes):
+                yield line
+            return
+        
+        query = {
+            "container": container,
+            "follow": "true" if follow else None,
+            "sinceSeconds": since_seconds,
+            "timestamps": "true" if timestamps else None,
+            "tailLines": tail_lines
+        }
+        path = RESOURCE_KINDS["pods"].path(namespace or self.config.namespace, pod_name, "log")
+        try:
+            async with self._get_async_client().stream(
+                "GET",
+                self._url(path, query),
+                headers=self._headers("text/plain"),
+                timeout=httpx.Timeout(self.config.timeout, read=None if follow else self.config.timeout)
+            ) as response:
+                if response.status_code >= 400:
+                    data = await response.aread()
+                    message = self._error_message(APIResponse(response.status_code, data, response.reason_phrase))
+                    raise ResourceError(f"Failed to stream logs for {pod_name}: {message}")
+                async for line in iter_lines(response.aiter_bytes(), max_line_bytes):
+                    yield line
+        except httpx.HTTPError as e:
+            raise ResourceError(f"Failed to stream logs for {pod_name}: {str(e)}")
+
+    async def arequest(self, method: str, path: str, query: Dict[str, Any] = None, body: str = None,
+                       content_type: str = "application/json", accept: str = "application/json",
+                       timeout: float = None) -> APIResponse:
+        """Send a request to the API server without blocking the event loop"""
+        request = APIRequest(method, path, query, body, content_type, accept)
+        if not HTTPX_AVAILABLE:
+            return await asyncio.to_thread(self._execute, request)
+        
+        try:
+            with observe_backend_call(self.name, *api_call_labels(method, path),
+                                      {"http.request.method": method, "url.path": path}) as call:
+                response = await self._get_async_client().request(
+                    method,
+                    self._url(path, query),
+                    headers=self._headers(accept, content_type if body is not None else None),
+                    content=body,
+                    timeout=timeout or self.config.timeout
+                )
+                call.failed = response.status_code >= 400
+                call.span.set_attributes({
+                    "http.response.status_code": response.status_code,
+                    "http.response.body.size": len(response.content)
+                })
+        except httpx.HTTPError as e:
+            raise ResourceError(f"Kubernetes API request failed: {str(e)}")
+        return APIResponse(response.status_code, response.content, response.reason_phrase)
+
+    def _execute(self, request: Any) -> Any:
+        if isinstance(request, FallbackCall):
+            return getattr(self.fallback, request.method)(*request.args)
+        
+        response = self.request(request.method, request.path, request.query, request.body,
+                                request.content_type, request.accept)
+        return APIResponse(response.status, response.data, response.reason)
+
+    async def _aexecute(self, request: Any) -> Any:
+        if isinstance(request, FallbackCall):
+            return await getattr(self.fallback, "a" + request.method)(*request.args)
+        
+        return await self.arequest(request.method, request.path, request.query, request.body,
+                                   request.content_type, request.accept)
+
+    @staticmethod
+    def _error_message(response: APIResponse) -> str:
+        """Extract the message from a Status response body"""
+        try:
+            return json.loads(response.data).get("message") or response.reason
+        except (ValueError, AttributeError):
+            return response.data.decode("utf-8", errors="replace") or response.reason
+
+    def _json(self, response: APIResponse, error: str) -> Dict[str, Any]:
+        if response.status >= 400:
+            raise ResourceError(f"{error}: {self._error_message(response)}")
+        return json.loads(response.data)
+
+    def _namespace(self, kind: ResourceKind, namespace: str = None) -> Optional[str]:
+        if namespace == ALL_NAMESPACES or not kind.namespaced:
+            return None
+        return namespace or self.config.namespace
+
+    def _fallback(self, method: str, error: str, *args) -> FallbackCall:
+        if self.fallback is None:
+            raise ResourceError(f"{error}: unsupported resource type '{args[0]}'")
+        return FallbackCall(method, args)
+
+    def _list_objects(self, resource_type: str, namespace: str = None, label_selector: str = None,
+                      field_selector: str = None, limit: int = None, continue_token: str = None,
+                      view: str = "full"):
+        error = f"Failed to list {resource_type}"
+        kind = resolve_resource_kind(resource_type)
+        if kind is None:
+            return (yield self._fallback("list_objects", error, resource_type, namespace, label_selector,
+                                         field_selector, limit, continue_token, view))
+        
+        query = {"labelSelector": label_selector, "fieldSelector": field_selector,
+                 "limit": limit, "continue": continue_token}
+        response = yield APIRequest("GET", kind.path(self._namespace(kind, namespace)), query=query,
+                                    accept=LIST_VIEWS.get(view, LIST_VIEWS["full"]))
+        return self._json(response, error)
+
+    def _api_resources(self, listing: Dict[str, Any], api_version: str) -> List[Dict[str, Any]]:
+        return [
+            self._resource_entry(item["name"], api_version, item.get("kind", ""), item.get("namespaced", False),
+                                 item.get("shortNames"), item.get("singularName", ""))
+            for item in listing.get("resources", [])
+            if "/" not in item["name"]  # subresources such as pods/log
+        ]
+
+    def _discover(self):
+        error = "Cluster discovery failed"
+        version = self._json((yield APIRequest("GET", "/version")), error)
+        resources = self._api_resources(self._json((yield APIRequest("GET", "/api/v1")), error), "v1")
+        
+        groups = self._json((yield APIRequest("GET", "/apis")), error)
+        for group in groups.get("groups", []):
+            group_version = (group.get("preferredVersion") or {}).get("groupVersion")
+            if not group_version:
+                continue
+            try:
+                listing = self._json((yield APIRequest("GET", f"/apis/{group_version}")), error)
+            except ResourceError as e:
+                # An unavailable aggregated API (e.g. metrics.k8s.io) should not hide the rest
+                logger.warning(f"Skipping API group {group_version}: {str(e)}")
+                continue
+            resources.extend(self._api_resources(listing, group_version))
+        return {"server_version": version.get("gitVersion"), "resources": resources}
+
+    def _get_object(self, resource_type: str, name: str, namespace: str = None):
+        error = f"Failed to get {resource_type} {name}"
+        kind = resolve_resource_kind(resource_type)
+        if kind is None:
+            return (yield self._fallback("get_object", error, resource_type, name, namespace))
+        
+        return self._json((yield APIRequest("GET", kind.path(self._namespace(kind, namespace), name))), error)
+
+    def _get_logs(self, pod_name: str, namespace: str = None, lines: int = 100, container: str = None,
+                  timestamps: bool = False):
+        path = RESOURCE_KINDS["pods"].path(namespace or self.config.namespace, pod_name, "log")
+        query = {"tailLines": lines, "container": container, "timestamps": "true" if timestamps else None}
+        response = yield APIRequest("GET", path, query=query, accept="text/plain")
+        if response.status >= 400:
+            raise ResourceError(f"Failed to get logs for {pod_name}: {self._error_message(response)}")
+        return response.data.decode("utf-8", errors="replace")
+
+    def _describe(self, resource_type: str, name: str, namespace: str = None):
+        error = f"Failed to describe {resource_type} {name}"
+        kind = resolve_resource_kind(resource_type)
+        if kind is None:
+            return (yield self._fallback("describe", error, resource_type, name, namespace))
+        
+        namespace = self._namespace(kind, namespace)
+        obj = self._json((yield APIRequest("GET", kind.path(namespace, name))), error)
+        obj.get("metadata", {}).pop("managedFields", None)
+        
+        events = self._json((yield APIRequest(
+            "GET",
+            RESOURCE_KINDS["events"].path(namespace or self.config.namespace),
+            query={"fieldSelector": f"involvedObject.name={name},involvedObject.kind={kind.kind}"}
+        )), error)
+        
+        lines = [yaml.dump(obj, default_flow_style=False, sort_keys=False), "Events:"]
+        event_items = events.get("items", [])
+        for event in event_items:
+            lines.append(
+                f"  {event.get('type', '')}\t{event.get('reason', '')}\t"
+                f"{event.get('lastTimestamp') or event.get('eventTime') or ''}\t{event.get('message', '')}"
+            )
+        if not event_items:
+            lines.append("  <none>")
+        return "\n".join(lines) + "\n"
+
+    def _scale(self, name: str, replicas: int, namespace: str = None):
+        kind = RESOURCE_KINDS["deployments"]
+        response = yield APIRequest(
+            "PATCH",
+            kind.path(namespace or self.config.namespace, name, "scale"),
+            body=json.dumps({"spec": {"replicas": replicas}}),
+            content_type="application/merge-patch+json"
+        )
+        scale = self._json(response, f"Failed to scale deployment {name}")
+        return {"success": True, "stdout": f"{kind.qualified_name}/{name} scaled\n", "stderr": "", "returncode": 0,
+                "resource_version": scale.get("metadata", {}).get("resourceVersion")}
+
+    def _delete(self, resource_type: str, name: str, namespace: str = None):
+        error = f"Failed to delete {resource_type} {name}"
+        kind = resolve_resource_kind(resource_type)
+        if kind is None:
+            return (yield self._fallback("delete", error, resource_type, name, namespace))
+        
+        self._json((yield APIRequest("DELETE", kind.path(self._namespace(kind, namespace), name))), error)
+        return {"success": True, "stdout": f'{kind.qualified_name} "{name}" deleted\n', "stderr": "", "returncode": 0}
+
+    def _apply(self, yaml_content: str, dry_run: bool = False, field_manager: str = None,
+               force_conflicts: bool = None):
+        """Apply every document of a manifest with a server-side apply PATCH"""
+        try:
+            documents = [doc for doc in yaml.safe_load_all(yaml_content) if doc]
+        except yaml.YAMLError as e:
+            raise ResourceError(f"Failed to apply YAML: {str(e)}")
+        
+        unsupported = [doc.get("kind") for doc in documents if resource_kind_for_object(doc) is None]
+        if unsupported:
+            if self.fallback is None:
+                raise ResourceError(f"Failed to apply YAML: unsupported kind '{unsupported[0]}'")
+            return (yield FallbackCall("apply", (yaml_content, dry_run, field_manager, force_conflicts)))
+        
+        output, versions = [], {}
+        for doc in documents:
+            kind = resource_kind_for_object(doc)
+            response = yield self._apply_request(kind, doc, dry_run, field_manager, force_conflicts)
+            applied = self._json(response, "Failed to apply YAML")
+            output.append(f"{kind.qualified_name}/{doc['metadata']['name']} {self._apply_action(response, dry_run)}\n")
+            versions[f"{kind.plural}/{doc['metadata']['name']}"] = applied.get("metadata", {}).get("resourceVersion")
+        
+        # resource_versions lets a rollout wait ignore cached objects from before the apply
+        return {"success": True, "stdout": "".join(output), "stderr": "", "returncode": 0,
+                "resource_versions": versions}
+
+    def _apply_request(self, kind: ResourceKind, doc: Dict[str, Any], dry_run: bool = False,
+                       field_manager: str = None, force_conflicts: bool = None) -> APIRequest:
+        """Server-side apply PATCH for one object"""
+        field_manager, force_conflicts = self._apply_options(field_manager, force_conflicts)
+        metadata = doc.get("metadata", {})
+        return APIRequest(
+            "PATCH",
+            kind.path(self._namespace(kind, metadata.get("namespace")), metadata.get("name")),
+            query={
+                "fieldManager": field_manager,
+                "force": "true" if force_conflicts else None,
+                "dryRun": "All" if dry_run else None
+            },
+            body=json.dumps(doc),
+            content_type="application/apply-patch+yaml"
+        )
+
+    @staticmethod
+    def _apply_action(response: APIResponse, dry_run: bool = False) -> str:
+        action = "created" if response.status == 201 else "configured"
+        return f"{action} (server dry run)" if dry_run else action
+
+    def _apply_objects(self, documents: List[Dict[str, Any]], dry_run: bool = False, field_manager: str = None,
+                       force_conflicts: bool = None):
+        """Apply each object over the shared connection; unknown kinds go to the fallback one by one"""
+        results = []
+        for doc in documents:
+            kind = resource_kind_for_object(doc)
+            try:
+                if kind is None:
+                    if self.fallback is None:
+                        raise ResourceError(f"unsupported kind '{doc.get('kind')}'")
+                    result = yield FallbackCall("apply_objects", ([doc], dry_run, field_manager, force_conflicts))
+                    results.extend(result)
+                    continue
+                response = yield self._apply_request(kind, doc, dry_run, field_manager, force_conflicts)
+                self._json(response, "Failed to apply YAML")
+                results.append(self._object_result(doc, True, self._apply_action(response, dry_run)))
+            except ResourceError as e:
+                results.append(self._object_result(doc, False, error=str(e)))
+        return results
+
+
+class KubectlProxyBackend(KubernetesAPIBackend):
+    """API backend that reaches the cluster through a long-lived `kubectl proxy`.
+
+    For environments that must authenticate through the kubectl binary
+    (exec credential plugins, kubeconfig features the Python client lacks).
+    One proxy process is started on a loopback port and every operation is
+    a plain HTTP request over pooled keep-alive connections, so kubectl's
+    start-up and kubeconfig and certificate loading are paid once instead
+    of per command. The proxy is restarted if it exits.
+    """
+
+    name = "proxy"
+
+    def __init__(self, config: K8sConfig, fallback: OperationsBackend = None):
+        if not URLLIB3_AVAILABLE:
+            raise ResourceError("urllib3 not installed. Install with: pip install urllib3")
+        
+        self.config = config
+        self.fallback = fallback
+        self.process: Optional[subprocess.Popen] = None
+        self._process_lock = threading.Lock()
+        self.max_parallel_requests = http_pool_size(config)
+        self.pool = urllib3.PoolManager(maxsize=self.max_parallel_requests)
+        self.watch_pool = urllib3.PoolManager(maxsize=32)
+        self.host = ""
+        self._watch_responses = set()
+        self._watch_lock = threading.Lock()
+        self._async_client = None
+        self._async_client_loop = None
+        self._async_client_closer = None
+        self._start_proxy()
+        atexit.register(self.shutdown)
+
+    def _start_proxy(self):
+        try:
+            process = subprocess.Popen(
+                ["kubectl", "proxy", "--port=0", "--address=127.0.0.1"],
+                stdout=subprocess.PIPE,
+                stderr=subprocess.STDOUT,
+                text=True
+            )
+        except FileNotFoundError:
+            raise ResourceError("kubectl not found. Please install kubectl and ensure it's in PATH")
+        
+        # kubectl prints "Starting to serve on 127.0.0.1:<port>" once it listens;
+        # later output is drained so the pipe never fills up
+        lines: queue.Queue = queue.Queue()
+        started = threading.Event()
+        
+        def read_output():
+            for line in process.stdout:
+                if not started.is_set():
+                    lines.put(line)
+                logger.debug(f"kubectl proxy: {line.rstrip()}")
+            lines.put("")
+        
+        threading.Thread(target=read_output, name="kubectl-proxy-output", daemon=True).start()
+        output = []
+        match = None
+        deadline = time.monotonic() + self.config.timeout
+        while match is None:
+            try:
+                line = lines.get(timeout=max(deadline - time.monotonic(), 0))
+            except queue.Empty:
+                break
+            if not line:
+                break
+            output.append(line.strip())
+            match = re.search(r"serve on ([\w.\-]+:\d+)", line)
+        if match is None:
+            process.kill()
+            raise ResourceError(f"kubectl proxy did not start: {' '.join(output) or 'timed out'}")
+        started.set()
+        
+        self.process = process
+        self.host = f"http://{match.group(1)}"
+        logger.info(f"kubectl proxy listening on {self.host}")
+
+    def _ensure_proxy(self):
+        """Restart the proxy if it has exited"""
+        if self.process is not None and self.process.poll() is None:
+            return
+        with self._process_lock:
+            if self.process is None or self.process.poll() is not None:
+                logger.warning("kubectl proxy exited, restarting")
+                self._start_proxy()
+
+    def _headers(self, accept: str = "application/json", content_type: str = None) -> Dict[str, str]:
+        # The proxy adds the credentials
+        headers = {"Accept": accept}
+        if content_type:
+            headers["Content-Type"] = content_type
+        return headers
+
+    def _tls_options(self) -> Dict[str, Any]:
+        return {}
+
+    def _url(self, path: str, query: Dict[str, Any] = None) -> str:
+        self._ensure_proxy()
+        return super()._url(path, query)
+
+    def shutdown(self):
+        super().shutdown()
+        process, self.process = self.process, None
+        if process is not None and process.poll() is None:
+            process.terminate()
+            try:
+                process.wait(timeout=5)
+            except subprocess.TimeoutExpired:
+                process.kill()
+
+
+def create_operations_backend(config: K8sConfig) -> OperationsBackend:
+    """Create the operations backend selected by config.backend"""
+    kubectl = KubectlBackend(config)
+    if config.backend == "kubectl":
+        return kubectl
+    if config.backend == "proxy":
+        return KubectlProxyBackend(config, fallback=kubectl)
+    
+    try:
+        return KubernetesAPIBackend(config, fallback=kubectl)
+    except ResourceError as e:
+        if config.backend == "api":
+            raise
+        logger.info(f"Native Kubernetes API backend unavailable, using kubectl: {str(e)}")
+        return kubectl
+
+
+# Informer Cache
+class WatchExpired(ResourceError):
+    """Raised when a watch resourceVersion is too old (410 Gone)"""
+    pass
+
+
+class ResourceInformer:
+    """Keeps an in-memory copy of one resource collection current.
+
+    Does one LIST, then follows a WATCH from the returned resourceVersion.
+    Bookmarks advance the resourceVersion, a 410 Gone triggers a relist,
+    and other failures are retried with exponential backoff. Reads are
+    served from memory. Handlers are called as handler(event_type, obj)
+    on the informer thread for every change, including the differences
+    found by a relist.
+    """
+
+    def __init__(self, backend: OperationsBackend, resource_type: str, namespace: str = None,
+                 watch_timeout: int = 300):
+        self.backend = backend
+        self.resource_type = resource_type
+        self.namespace = namespace
+        self.watch_timeout = watch_timeout
+        self.resource_version: Optional[str] = None
+        self.last_error: Optional[str] = None
+        self.synced = threading.Event()
+        self._items: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+        self._handlers: List[Any] = []
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    @staticmethod
+    def _key(obj: Dict[str, Any]) -> str:
+        metadata = obj.get("metadata", {})
+        return f"{metadata.get('namespace', '')}/{metadata.get('name', '')}"
+
+    def start(self) -> "ResourceInformer":
+        if self._thread is None:
+            self._thread = threading.Thread(
+                target=self._run,
+                name=f"informer-{self.resource_type}-{self.namespace or 'default'}",
+                daemon=True
+            )
+            self._thread.start()
+        return self
+
+    def stop(self):
+        self._stop.set()
+
+    def wait_for_sync(self, timeout: float = None) -> bool:
+        return self.synced.wait(timeout)
+
+    def list(self) -> List[Dict[str, Any]]:
+        """Snapshot of the cached objects, ordered like the API server"""
+        with self._lock:
+            return [self._items[key] for key in sorted(self._items)]
+
+    def get(self, name: str, namespace: str = None) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            return self._items.get(f"{namespace or ''}/{name}")
+
+    def add_handler(self, handler):
+        with self._lock:
+            self._handlers.append(handler)
+
+    def remove_handler(self, handler):
+        with self._lock:
+            if handler in self._handlers:
+                self._handlers.remove(handler)
+
+    def _notify(self, event_type: str, obj: Dict[str, Any]):
+        with self._lock:
+            handlers = list(self._handlers)
+        for handler in handlers:
+            try:
+                handler(event_type, obj)
+            except Exception as e:
+                logger.error(f"Informer handler for {self.resource_type} failed: {str(e)}")
+
+    def _relist(self):
+        data = self.backend.list_objects(self.resource_type, self.namespace)
+        items = {self._key(item): item for item in data.get("items", [])}
+        
+        with self._lock:
+            previous = self._items
+            self._items = items
+        self.resource_version = data.get("metadata", {}).get("resourceVersion")
+        self.synced.set()
+        
+        for key, item in items.items():
+            if key not in previous:
+                self._notify("ADDED", item)
+            elif previous[key].get("metadata", {}).get("resourceVersion") != item.get("metadata", {}).get("resourceVersion"):
+                self._notify("MODIFIED", item)
+        for key, item in previous.items():
+            if key not in items:
+                self._notify("DELETED", item)
+
+    def _watch(self):
+        for event in self.backend.watch(self.resource_type, self.namespace, self.resource_version,
+                                        self.watch_timeout):
+            if self._stop.is_set():
+                return
+            
+            event_type = event.get("type")
+            obj = event.get("object", {})
+            if event_type == "ERROR":
+                if obj.get("code") == 410:
+                    raise WatchExpired(obj.get("message", "resourceVersion too old"))
+                raise ResourceError(f"Watch on {self.resource_type} failed: {obj.get('message', '')}")
+            
+            self.resource_version = obj.get("metadata", {}).get("resourceVersion", self.resource_version)
+            if event_type == "BOOKMARK":
+                continue
+            
+            with self._lock:
+                if event_type == "DELETED":
+                    self._items.pop(self._key(obj), None)
+                else:
+                    self._items[self._key(obj)] = obj
+            self._notify(event_type, obj)
+
+    def _run(self):
+        backoff = 1.0
+        while not self._stop.is_set():
+            try:
+                if self.resource_version is None:
+                    self._relist()
+                self._watch()
+                backoff = 1.0
+                self.last_error = None
+            except WatchExpired:
+                logger.debug(f"Watch on {self.resource_type} expired, relisting")
+                self.resource_version = None
+            except Exception as e:
+                if self._stop.is_set():
+                    break
+                self.last_error = str(e)
+                logger.warning(f"Informer for {self.resource_type} failed, retrying in {backoff:.0f}s: {str(e)}")
+                self._stop.wait(backoff)
+                backoff = min(backoff * 2, 30.0)
+
+
+class InformerCache:
+    """Shares one informer per resource type and namespace"""
+
+    def __init__(self, backend: OperationsBackend, config: K8sConfig):
+        self.backend = backend
+        self.config = config
+        self._informers: Dict[tuple, ResourceInformer] = {}
+        self._lock = threading.Lock()
+
+    def supports(self, resource_type: str) -> bool:
+        return self.backend.supports_watch and resolve_resource_kind(resource_type) is not None
+
+    def informer(self, resource_type: str, namespace: str = None) -> ResourceInformer:
+        """Return the running informer for a collection, starting it on first use"""
+        kind = resolve_resource_kind(resource_type)
+        namespace = (namespace or self.config.namespace) if kind.namespaced else None
+        key = (kind.plural, namespace)
+        with self._lock:
+            informer = self._informers.get(key)
+            if informer is None:
+                informer = ResourceInformer(self.backend, kind.plural, namespace, self.config.watch_timeout)
+                self._informers[key] = informer.start()
+        return informer
+
+    def list(self, resource_type: str, namespace: str = None) -> Dict[str, Any]:
+        """Return a List object served from memory"""
+        informer = self.informer(resource_type, namespace)
+        if not informer.wait_for_sync(self.config.timeout):
+            raise ResourceError(
+                f"Failed to list {resource_type}: cache not synced ({informer.last_error or 'timed out'})"
+            )
+        return {"items": informer.list(), "metadata": {"resourceVersion": informer.resource_version}}
+
+    async def alist(self, resource_type: str, namespace: str = None) -> Dict[str, Any]:
+        informer = self.informer(resource_type, namespace)
+        if not informer.synced.is_set():
+            await asyncio.to_thread(informer.wait_for_sync, self.config.timeout)
+        return self.list(resource_type, namespace)
+
+    def stop(self):
+        with self._lock:
+            informers = list(self._informers.values())
+            self._informers.clear()
+        for informer in informers:
+            informer.stop()
+        self.backend.close()
+
+
+# Rollout Tracking
+def resource_version_at_least(obj: Dict[str, Any], resource_version: Optional[str]) -> bool:
+    """Whether obj is at or past resource_version; versions that are not integers count as current"""
+    if not resource_version:
+        return True
+    try:
+        return int(obj.get("metadata", {}).get("resourceVersion", "")) >= int(resource_version)
+    except ValueError:
+        return True
+
+
+def rollout_status(obj: Dict[str, Any], deleted: bool = False, min_resource_version: str = None) -> Dict[str, Any]:
+    """Summarize a Deployment's rollout the way kubectl rollout status judges it.
+
+    An object older than min_resource_version (a cached copy from before
+    the change being waited for) is still progressing whatever it says.
+    """
+    metadata, spec, status = obj.get("metadata", {}), obj.get("spec", {}), obj.get("status", {})
+    desired = spec.get("replicas", 1)
+    updated = status.get("updatedReplicas", 0)
+    available = status.get("availableReplicas", 0)
+    current = resource_version_at_least(obj, min_resource_version)
+    observed = current and status.get("observedGeneration", 0) >= metadata.get("generation", 0)
+    stalled = current and any(
+        condition.get("type") == "Progressing" and condition.get("reason") == "ProgressDeadlineExceeded"
+        for condition in status.get("conditions", [])
+    )
+    
+    if deleted:
+        state = "deleted"
+    elif stalled:
+        state = "failed"
+    elif observed and updated == desired and status.get("replicas", 0) == updated and available == updated:
+        state = "complete"
+    else:
+        state = "progressing"
+    
+    return {
+        "name": metadata.get("name", ""),
+        "namespace": metadata.get("namespace", ""),
+        "state": state,
+        "desired": desired,
+        "updated": updated,
+        "ready": status.get("readyReplicas", 0),
+        "available": available
+    }
+
+
+def format_rollout(status: Dict[str, Any]) -> str:
+    """One-line description of a rollout status"""
+    counts = f"{status['ready']}/{status['desired'] if status['desired'] is not None else '?'} ready"
+    return f"Rollout {status['state']}: {counts}, {status['updated']} updated, {status['available']} available"
+
+
+class RolloutTracker:
+    """Waits for deployment rollouts on the shared deployments informer.
+
+    There is one informer per namespace, so any number of concurrent waits
+    share a single watch connection. A wait ends when the rollout
+    completes, fails, the deployment is deleted or the deadline passes;
+    every change in replica counts is reported to the progress callback.
+    """
+
+    def __init__(self, informers: InformerCache, config: K8sConfig):
+        self.informers = informers
+        self.config = config
+        self._waiters: Dict[tuple, List[Any]] = {}
+        self._handlers: Dict[str, Any] = {}
+        self._lock = threading.Lock()
+
+    def _register(self, name: str, namespace: str, deliver) -> ResourceInformer:
+        informer = self.informers.informer("deployments", namespace)
+        with self._lock:
+            if namespace not in self._handlers:
+                handler = lambda event_type, obj, ns=namespace: self._dispatch(ns, event_type, obj)
+                self._handlers[namespace] = handler
+                informer.add_handler(handler)
+            self._waiters.setdefault((namespace, name), []).append(deliver)
+        return informer
+
+    def _unregister(self, name: str, namespace: str, deliver):
+        with self._lock:
+            waiters = self._waiters.get((namespace, name), [])
+            if deliver in waiters:
+                waiters.remove(deliver)
+            if not waiters:
+                self._waiters.pop((namespace, name), None)
+
+    def _dispatch(self, namespace: str, event_type: str, obj: Dict[str, Any]):
+        with self._lock:
+            waiters = list(self._waiters.get((namespace, obj.get("metadata", {}).get("name")), []))
+        for deliver in waiters:
+            deliver(event_type, obj)
+
+    @staticmethod
+    def _pending(name: str, namespace: str, state: str = "progressing") -> Dict[str, Any]:
+        return {"name": name, "namespace": namespace, "state": state,
+                "desired": None, "updated": 0, "ready": 0, "available": 0}
+
+    def _live_version(self, name: str, namespace: str) -> Optional[str]:
+        """resourceVersion the API server has now, so a cache that lags behind a finished write is not trusted"""
+        try:
+            obj = self.informers.backend.get_object("deployments", name, namespace)
+        except ResourceError:
+            return None
+        return obj.get("metadata", {}).get("resourceVersion")
+
+    async def _alive_version(self, name: str, namespace: str) -> Optional[str]:
+        try:
+            obj = await self.informers.backend.aget_object("deployments", name, namespace)
+        except ResourceError:
+            return None
+        return obj.get("metadata", {}).get("resourceVersion")
+
+    @staticmethod
+    def _changed(previous: Optional[Dict[str, Any]], status: Dict[str, Any]) -> bool:
+        keys = ("state", "desired", "updated", "ready", "available")
+        return previous is None or any(previous[key] != status[key] for key in keys)
+
+    async def await_rollout(self, name: str, namespace: str = None, timeout: float = None,
+                            progress=None, min_resource_version: str = None) -> Dict[str, Any]:
+        """Wait for a rollout; progress, when given, is awaited with each new status.
+
+        min_resource_version is the version a preceding scale or apply
+        returned; without it the deployment is read from the API server once.
+        """
+        namespace = namespace or self.config.namespace
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + (timeout or self.config.rollout_timeout)
+        events: asyncio.Queue = asyncio.Queue()
+        deliver = lambda event_type, obj: loop.call_soon_threadsafe(events.put_nowait, (event_type, obj))
+        informer = self._register(name, namespace, deliver)
+        try:
+            if min_resource_version is None:
+                min_resource_version = await self._alive_version(name, namespace)
+            if not informer.synced.is_set():
+                await asyncio.to_thread(informer.wait_for_sync, self.config.timeout)
+            obj = informer.get(name, namespace)
+            event_type = "ADDED"
+            status = None
+            while True:
+                if obj is not None:
+                    current = rollout_status(obj, event_type == "DELETED", min_resource_version)
+                    if progress and self._changed(status, current):
+                        await progress(current)
+                    status = current
+                    if status["state"] != "progressing":
+                        return status
+                try:
+                    event_type, obj = await asyncio.wait_for(events.get(), max(0.0, deadline - loop.time()))
+                except asyncio.TimeoutError:
+                    return {**(status or self._pending(name, namespace)), "state": "timeout"}
+        finally:
+            self._unregister(name, namespace, deliver)
+
+    def wait_for_rollout(self, name: str, namespace: str = None, timeout: float = None,
+                         progress=None, min_resource_version: str = None) -> Dict[str, Any]:
+        """Blocking variant of await_rollout; progress is called with each new status"""
+        namespace = namespace or self.config.namespace
+        deadline = time.monotonic() + (timeout or self.config.rollout_timeout)
+        events = queue.Queue()
+        deliver = lambda event_type, obj: events.put((event_type, obj))
+        informer = self._register(name, namespace, deliver)
+        try:
+            if min_resource_version is None:
+                min_resource_version = self._live_version(name, namespace)
+            informer.wait_for_sync(self.config.timeout)
+            obj = informer.get(name, namespace)
+            event_type = "ADDED"
+            status = None
+            while True:
+                if obj is not None:
+                    current = rollout_status(obj, event_type == "DELETED", min_resource_version)
+                    if progress and self._changed(status, current):
+                        progress(current)
+                    status = current
+                    if status["state"] != "progressing":
+                        return status
+                try:
+                    event_type, obj = events.get(timeout=max(0.0, deadline - time.monotonic()))
+                except queue.Empty:
+                    return {**(status or self._pending(name, namespace)), "state": "timeout"}
+        finally:
+            self._unregister(name, namespace, deliver)
+
+
+# Cluster Discovery
+class ClusterDiscovery:
+    """Client and cluster capabilities, probed once and refreshed in the background.
+
+    Holds the kubectl client version, the server version, whether the
+    cluster is reachable and the API resources it serves. Readers get the
+    last probe from memory, so status checks never spawn kubectl or reach
+    the API server. After start(), refresh() runs on a daemon thread every
+    discovery_interval seconds; while the cluster is unreachable the last
+    known resource list is kept.
+    """
+
+    def __init__(self, backend: OperationsBackend, kubectl: "KubectlBackend", config: K8sConfig):
+        self.backend = backend
+        self.kubectl = kubectl
+        self.config = config
+        self._lock = threading.Lock()
+        self._ready = threading.Event()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._state: Dict[str, Any] = {
+            "kubectl_available": False,
+            "client_version": None,
+            "server_version": None,
+            "reachable": False,
+            "error": None,
+            "discovered_at": None
+        }
+        self._resources: List[Dict[str, Any]] = []
+        self._names: Optional[set] = None
+
+    def start(self):
+        """Probe now and keep refreshing on a daemon thread"""
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._loop, name="k8s-discovery", daemon=True)
+            self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+
+    def _loop(self):
+        while not self._stop.is_set():
+            self.refresh()
+            if self.config.discovery_interval <= 0:
+                return
+            self._stop.wait(self.config.discovery_interval)
+
+    def refresh(self) -> Dict[str, Any]:
+        """Probe kubectl and the cluster and replace the cached state"""
+        state = dict(self._state, kubectl_available=False, client_version=None, reachable=False, error=None)
+        try:
+            result = self.kubectl.run(["kubectl", "version", "--client", "-o", "json"])
+            state["kubectl_available"] = result["success"]
+            if result["success"]:
+                state["client_version"] = json.loads(result["stdout"]).get("clientVersion", {}).get("gitVersion")
+        except (ResourceError, ValueError) as e:
+            logger.debug(f"kubectl probe failed: {str(e)}")
+        
+        resources = None
+        try:
+            found = self.backend.discover()
+            state["server_version"] = found["server_version"]
+            state["reachable"] = True
+            resources = found["resources"]
+        except Exception as e:
+            state["error"] = str(e)
+            logger.warning(f"Cluster discovery failed: {str(e)}")
+        state["discovered_at"] = datetime.now().isoformat()
+        
+        with self._lock:
+            self._state = state
+            if resources is not None:
+                self._resources = resources
+                self._names = self._index(resources)
+        self._ready.set()
+        return self.snapshot()
+
+    @staticmethod
+    def _index(resources: List[Dict[str, Any]]) -> set:
+        """Every name kubectl accepts for the discovered resources"""
+        names = set()
+        for resource in resources:
+            group = resource["api_version"].split("/")[0] if "/" in resource["api_version"] else ""
+            names.update([resource["name"], resource["singular"], resource["kind"].lower()])
+            names.update(name.lower() for name in resource["short_names"])
+            if group:
+                names.update([f"{resource['name']}.{group}", f"{resource['singular']}.{group}"])
+        names.discard("")
+        return names
+
+    def wait_ready(self, timeout: float = None) -> bool:
+        """Wait for the first probe to finish"""
+        return self._ready.wait(timeout)
+
+    def supports(self, resource_type: str) -> Optional[bool]:
+        """Whether the cluster serves a resource type; None until resources were discovered"""
+        with self._lock:
+            names = self._names
+        if names is None:
+            return None
+        key = (resource_type or "").strip().lower()
+        kind = resolve_resource_kind(key)
+        return key in names or (kind is not None and kind.plural in names)
+
+    def snapshot(self, include_resources: bool = False) -> Dict[str, Any]:
+        with self._lock:
+            state = dict(self._state)
+            resources = list(self._resources)
+        state["resource_count"] = len(resources)
+        state["api_groups"] = sorted({r["api_version"] for r in resources})
+        if include_resources:
+            state["resources"] = resources
+        return state
+
+
+# Enhanced kubectl Operations with Error Handling
+class K8sOperations:
+    """Handles all Kubernetes operations with comprehensive error handling.
+
+    Every operation has an asyncio counterpart prefixed with 'a' that runs
+    on the event loop without a thread per call.
+    """
     
-    def apply_yaml(self, yaml_content: str, dry_run: bool = False) -> Dict[str, Any]:
-        """Apply YAML content to Kubernetes cluster"""
+    def __init__(self, config: K8sConfig, ui: AgentUI, backend: OperationsBackend = None):
+        self.config = config
+        self.ui = ui
+        self.validator = InputValidator(config)
+        self.backend = backend or create_operations_backend(config)
+        self.kubectl = self.backend if isinstance(self.backend, KubectlBackend) else KubectlBackend(config)
+        self.informers = InformerCache(self.backend, config) \
+            if config.informer_cache and self.backend.supports_watch else None
+        self._rollouts: Optional[RolloutTracker] = None
+        self.discovery = ClusterDiscovery(self.backend, self.kubectl, config)
+    
+    def close(self):
+        """Stop background informers and discovery and release helper processes"""
+        self.discovery.stop()
+        if self.informers:
+            self.informers.stop()
+        if self._rollouts and self._rollouts.informers is not self.informers:
+            self._rollouts.informers.stop()
+        self.backend.shutdown()
+    
+    def _rollout_tracker(self) -> Optional[RolloutTracker]:
+        """Tracker sharing the informer cache; None when the backend cannot watch"""
+        if self._rollouts is None and self.backend.supports_watch:
+            self._rollouts = RolloutTracker(self.informers or InformerCache(self.backend, self.config), self.config)
+        return self._rollouts
+    
+    def _rollout_command(self, name: str, namespace: str = None, timeout: float = None) -> List[str]:
+        timeout = int(timeout or self.config.rollout_timeout)
+        return KubectlBackend._namespaced(
+            ["kubectl", "rollout", "status", f"deployment/{name}", f"--timeout={timeout}s"], namespace
+        )
+    
+    @staticmethod
+    def _rollout_result(name: str, namespace: str, result: Dict[str, Any]) -> Dict[str, Any]:
+        status = RolloutTracker._pending(name, namespace or "")
+        if result["success"]:
+            status["state"] = "complete"
+        else:
+            status["state"] = "timeout" if "timed out" in result["stderr"] else "failed"
+            status["error"] = result["stderr"].strip()
+        return status
+    
+    def wait_for_rollout(self, name: str, namespace: str = None, timeout: float = None,
+                         progress=None, min_resource_version: str = None) -> Dict[str, Any]:
+        """Block until a deployment finishes rolling out, fails, or the deadline passes.
+
+        With a watch-capable backend the deployments informer is used; the
+        kubectl backend falls back to 'kubectl rollout status'. Pass the
+        resource_version a scale or apply returned as min_resource_version
+        so the cached pre-change object is not mistaken for the result.
+        """
         try:
-            with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
-                f.write(yaml_content)
-                temp_file = f.name
+            tracker = self._rollout_tracker()
+            if tracker:
+                return tracker.wait_for_rollout(name, namespace, timeout, progress, min_resource_version)
             
-            cmd = ["kubectl", "apply", "-f", temp_file]
-            if dry_run:
-                cmd.append("--dry-run=client")
+            timeout = timeout or self.config.rollout_timeout
+            result = self._run_kubectl(self._rollout_command(name, namespace, timeout), timeout + 5)
+            return self._rollout_result(name, namespace, result)
             
-            result = self._run_kubectl(cmd)
+        except Exception as e:
+            logger.error(f"Error waiting for rollout: {str(e)}")
+            raise
+    
+    async def await_rollout(self, name: str, namespace: str = None, timeout: float = None,
+                            progress=None, min_resource_version: str = None) -> Dict[str, Any]:
+        """Wait for a deployment rollout without blocking the event loop"""
+        try:
+            tracker = self._rollout_tracker()
+            if tracker:
+                return await tracker.await_rollout(name, namespace, timeout, progress, min_resource_version)
             
-            # Clean up temp file
-            try:
-                os.unlink(temp_file)
-            except OSError:
-                pass
+            timeout = timeout or self.config.rollout_timeout
+            result = await self._arun_kubectl(self._rollout_command(name, namespace, timeout), timeout + 5)
+            return self._rollout_result(name, namespace, result)
             
-            if not result["success"]:
-                raise ResourceError(f"Failed to apply YAML: {result['stderr']}")
+        except Exception as e:
+            logger.error(f"Error waiting for rollout: {str(e)}")
+            raise
+    
+    def _list_objects(self, resource_type: str, namespace: str = None, label_selector: str = None,
+                      *options) -> Dict[str, Any]:
+        # Filtered, paged or reshaped lists go to the API server; the informer holds whole collections
+        if not label_selector and not any(options) and self.informers and self.informers.supports(resource_type):
+            return self.informers.list(resource_type, namespace)
+        return self.backend.list_objects(resource_type, namespace, label_selector, *options)
+    
+    async def _alist_objects(self, resource_type: str, namespace: str = None, label_selector: str = None,
+                             *options) -> Dict[str, Any]:
+        if not label_selector and not any(options) and self.informers and self.informers.supports(resource_type):
+            return await self.informers.alist(resource_type, namespace)
+        return await self.backend.alist_objects(resource_type, namespace, label_selector, *options)
+    
+    def _run_kubectl(self, cmd: List[str], timeout: int = None) -> Dict[str, Any]:
+        """Run kubectl command with error handling"""
+        return self.kubectl.run(cmd, timeout)
+    
+    async def _arun_kubectl(self, cmd: List[str], timeout: int = None) -> Dict[str, Any]:
+        """Run kubectl command on the event loop"""
+        return await self.kubectl.arun(cmd, timeout)
+    
+    def apply_yaml(self, yaml_content: str, dry_run: bool = False, field_manager: str = None,
+                   force_conflicts: bool = None) -> Dict[str, Any]:
+        """Apply YAML content to Kubernetes cluster.
+
+        The manifest never touches disk: kubectl reads it from stdin and the
+        api backend sends it as a server-side apply PATCH.
+        """
+        try:
+            return self.backend.apply(yaml_content, dry_run, field_manager, force_conflicts)
             
-            return result
+        except Exception as e:
+            logger.error(f"Error applying YAML: {str(e)}")
+            raise
+    
+    async def aapply_yaml(self, yaml_content: str, dry_run: bool = False, field_manager: str = None,
+                          force_conflicts: bool = None) -> Dict[str, Any]:
+        """Apply YAML content to Kubernetes cluster"""
+        try:
+            return await self.backend.aapply(yaml_content, dry_run, field_manager, force_conflicts)
             
         except Exception as e:
             logger.error(f"Error applying YAML: {str(e)}")
             raise
     
-    def delete_resource(self, resource_type: str, name: str, namespace: str = None) -> Dict[str, Any]:
-        """Delete a Kubernetes resource"""
+    def render_batch(self, specs: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Validate resource specs and render them as manifests in dependency order.
+
+        A spec is either {"kind": "deployment" | "service" | "configmap" |
+        "secret", ...generator arguments} or {"manifest": <dict or YAML>}.
+        """
+        documents = []
+        for spec in specs:
+            kind = (spec.get("kind") or "").lower()
+            if "manifest" in spec:
+                manifest = spec["manifest"]
+                try:
+                    rendered = list(yaml.safe_load_all(manifest)) if isinstance(manifest, str) else [manifest]
+                except yaml.YAMLError as e:
+                    raise ValidationError(f"Invalid manifest: {str(e)}")
+            else:
+                namespace = self.validator.validate_namespace(spec.get("namespace", "default"))
+                name = self.validator.validate_name(spec.get("name"))
+                if kind == "deployment":
+                    rendered = generate_deployment_yaml(
+                        name,
+                        self.validator.validate_image(spec.get("image")),
+                        self.validator.validate_replicas(spec.get("replicas", 1)),
+                        namespace,
+                        self.validator.validate_port(spec.get("port", 80)),
+                        spec.get("cpu_limit", "500m"),
+                        spec.get("memory_limit", "512Mi"),
+                        spec.get("env_vars", {})
+                    )
+                elif kind == "service":
+                    rendered = generate_service_yaml(
+                        name,
+                        self.validator.validate_port(spec.get("port", 80)),
+                        self.validator.validate_port(spec.get("target_port", 80)),
+                        namespace,
+                        spec.get("service_type", "ClusterIP")
+                    )
+                elif kind == "configmap":
+                    rendered = generate_configmap_yaml(name, spec.get("data", {}), namespace)
+                elif kind == "secret":
+                    rendered = generate_secret_yaml(name, spec.get("data", {}), namespace)
+                else:
+                    raise ValidationError(f"Unsupported resource kind in batch: '{spec.get('kind')}'")
+                rendered = [yaml.safe_load(rendered)]
+            
+            for doc in rendered:
+                if not doc:
+                    continue
+                if not isinstance(doc, dict) or not doc.get("kind") or not doc.get("metadata", {}).get("name"):
+                    raise ValidationError("Manifests need kind and metadata.name")
+                if doc["metadata"].get("namespace"):
+                    self.validator.validate_namespace(doc["metadata"]["namespace"])
+                documents.append(doc)
+        
+        return sort_for_apply(documents)
+    
+    def apply_batch(self, specs: List[Dict[str, Any]], dry_run: bool = False, field_manager: str = None,
+                    force_conflicts: bool = None) -> List[Dict[str, Any]]:
+        """Apply a whole stack in one call and return a result per object"""
         try:
-            cmd = ["kubectl", "delete", resource_type, name]
-            if namespace:
-                cmd.extend(["-n", namespace])
+            documents = self.render_batch(specs)
+            return self.backend.apply_objects(documents, dry_run, field_manager, force_conflicts)
             
-            result = self._run_kubectl(cmd)
+        except Exception as e:
+            logger.error(f"Error applying batch: {str(e)}")
+            raise
+    
+    async def aapply_batch(self, specs: List[Dict[str, Any]], dry_run: bool = False, field_manager: str = None,
+                           force_conflicts: bool = None) -> List[Dict[str, Any]]:
+        """Apply a whole stack in one call and return a result per object"""
+        try:
+            documents = self.render_batch(specs)
+            return await self.backend.aapply_objects(documents, dry_run, field_manager, force_conflicts)
             
-            if not result["success"]:
-                raise ResourceError(f"Failed to delete {resource_type} {name}: {result['stderr']}")
+        except Exception as e:
+            logger.error(f"Error applying batch: {str(e)}")
+            raise
+    
+    def delete_resource(self, resource_type: str, name: str, namespace: str = None) -> Dict[str, Any]:
+        """Delete a Kubernetes resource"""
+        try:
+            return self.backend.delete(resource_type, name, namespace)
             
-            return result
+        except Exception as e:
+            logger.error(f"Error deleting resource: {str(e)}")
+            raise
+    
+    async def adelete_resource(self, resource_type: str, name: str, namespace: str = None) -> Dict[str, Any]:
+        """Delete a Kubernetes resource"""
+        try:
+            return await self.backend.adelete(resource_type, name, namespace)
             
         except Exception as e:
             logger.error(f"Error deleting resource: {str(e)}")
             raise
     
-    def list_resources(self, resource_type: str, namespace: str = None) -> List[Dict[str, str]]:
+    @staticmethod
+    def project_object(item: Dict[str, Any], resource_type: str = None) -> Dict[str, Any]:
+        """Typed row for one object.
+
+        Every row has name, namespace, age and status. Deployments add
+        replica counts, services their type, cluster IP and ports, and pods
+        their node, readiness and restart count.
+        """
+        metadata, spec, status = item.get("metadata", {}), item.get("spec", {}), item.get("status", {})
+        kind = resolve_resource_kind(resource_type or item.get("kind", ""))
+        row = {
+            "name": metadata.get("name", ""),
+            "namespace": metadata.get("namespace", ""),
+            "age": metadata.get("creationTimestamp", ""),
+            "status": status.get("phase", "")
+        }
+        plural = kind.plural if kind else None
+        
+        if plural == "pods":
+            statuses = status.get("containerStatuses", [])
+            waiting = [s["state"]["waiting"].get("reason") for s in statuses if s.get("state", {}).get("waiting")]
+            row.update({
+                "status": "Terminating" if metadata.get("deletionTimestamp") else (waiting[0] if waiting else row["status"]),
+                "node": spec.get("nodeName", ""),
+                "ready": f"{sum(1 for s in statuses if s.get('ready'))}/{len(spec.get('containers', [])) or len(statuses)}",
+                "restarts": sum(s.get("restartCount", 0) for s in statuses)
+            })
+        elif plural == "deployments":
+            desired = spec.get("replicas", 1)
+            available = status.get("availableReplicas", 0)
+            row.update({
+                "status": "Available" if available >= desired else "Progressing",
+                "replicas": desired,
+                "ready_replicas": status.get("readyReplicas", 0),
+                "updated_replicas": status.get("updatedReplicas", 0),
+                "available_replicas": available
+            })
+        elif plural == "services":
+            ingress = status.get("loadBalancer", {}).get("ingress", [])
+            external = [i.get("ip") or i.get("hostname") for i in ingress] or spec.get("externalIPs", [])
+            row.update({
+                "status": "Pending" if spec.get("type") == "LoadBalancer" and not external else "Active",
+                "type": spec.get("type", "ClusterIP"),
+                "cluster_ip": spec.get("clusterIP", ""),
+                "external_ip": ",".join(external),
+                "ports": ",".join(f"{p.get('port')}/{p.get('protocol', 'TCP')}" for p in spec.get("ports", []))
+            })
+        return row
+    
+    @staticmethod
+    def _table_rows(table: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Rows of a meta.k8s.io Table, keyed by snake-cased column name"""
+        columns = [c["name"].lower().replace(" ", "_").replace("-", "_") for c in table.get("columnDefinitions", [])]
+        rows = []
+        for table_row in table.get("rows", []):
+            metadata = (table_row.get("object") or {}).get("metadata", {})
+            row = dict(zip(columns, table_row.get("cells", [])))
+            row.update({
+                "name": metadata.get("name", row.get("name", "")),
+                "namespace": metadata.get("namespace", ""),
+                "age": metadata.get("creationTimestamp", row.get("age", "")),
+                "status": row.get("status", "")
+            })
+            rows.append(row)
+        return rows
+    
+    @classmethod
+    def summarize_items(cls, data: Dict[str, Any], resource_type: str = None) -> List[Dict[str, Any]]:
+        """Reduce a List or Table object to typed rows"""
+        if data.get("kind") == "Table":
+            return cls._table_rows(data)
+        return [cls.project_object(item, resource_type) for item in data.get("items", [])]
+    
+    @classmethod
+    def _page(cls, resource_type: str, data: Dict[str, Any], view: str) -> Dict[str, Any]:
+        metadata = data.get("metadata", {})
+        if view == "metadata":
+            items = [{
+                "name": item["metadata"].get("name", ""),
+                "namespace": item["metadata"].get("namespace", ""),
+                "age": item["metadata"].get("creationTimestamp", ""),
+                "labels": item["metadata"].get("labels", {}),
+                "resource_version": item["metadata"].get("resourceVersion", "")
+            } for item in data.get("items", [])]
+        else:
+            items = cls.summarize_items(data, resource_type)
+        return {
+            "items": items,
+            "continue": metadata.get("continue") or None,
+            "remaining": metadata.get("remainingItemCount"),
+            "resource_version": metadata.get("resourceVersion")
+        }
+    
+    def _check_resource_type(self, resource_type: str):
+        """Reject resource types the cluster does not serve, once discovery knows its resources"""
+        if self.discovery.supports(resource_type) is False:
+            raise ValidationError(f"Unknown resource type '{resource_type}'")
+    
+    def list_resources(self, resource_type: str, namespace: str = None) -> List[Dict[str, Any]]:
         """List Kubernetes resources"""
         try:
-            cmd = ["kubectl", "get", resource_type, "-o", "json"]
-            if namespace:
-                cmd.extend(["-n", namespace])
-            
-            result = self._run_kubectl(cmd)
+            self._check_resource_type(resource_type)
+            return self.summarize_items(self._list_objects(resource_type, namespace), resource_type)
             
-            if not result["success"]:
-                raise ResourceError(f"Failed to list {resource_type}: {result['stderr']}")
-            
-            data = json.loads(result["stdout"])
-            resources = []
+        except Exception as e:
+            logger.error(f"Error listing resources: {str(e)}")
+            raise
+    
+    async def alist_resources(self, resource_type: str, namespace: str = None) -> List[Dict[str, Any]]:
+        """List Kubernetes resources"""
+        try:
+            self._check_resource_type(resource_type)
+            return self.summarize_items(await self._alist_objects(resource_type, namespace), resource_type)
             
-            for item in data.get("items", []):
-                metadata = item.get("metadata", {})
-                resources.append({
-                    "name": metadata.get("name", ""),
-                    "namespace": metadata.get("namespace", ""),
-                    "age": metadata.get("creationTimestamp", ""),
-                    "status": item.get("status", {}).get("phase", "")
-                })
+        except Exception as e:
+            logger.error(f"Error listing resources: {str(e)}")
+            raise
+    
+    def list_page(self, resource_type: str, namespace: str = None, label_selector: str = None,
+                  field_selector: str = None, limit: int = None, continue_token: str = None,
+                  view: str = "full") -> Dict[str, Any]:
+        """List one page of typed rows with server-side selectors.
+
+        Returns items, the continue token for the next page (None on the
+        last one), and the remaining item count when the server knows it.
+        view="metadata" transfers only object metadata and view="table"
+        returns the columns the API server prints for kubectl get.
+        """
+        try:
+            if view not in LIST_VIEWS:
+                raise ValidationError(f"view must be one of {list(LIST_VIEWS)}")
+            self._check_resource_type(resource_type)
+            data = self._list_objects(resource_type, namespace, label_selector, field_selector,
+                                      limit, continue_token, view if view != "full" else None)
+            return self._page(resource_type, data, view)
             
-            return resources
+        except Exception as e:
+            logger.error(f"Error listing resources: {str(e)}")
+            raise
+    
+    async def alist_page(self, resource_type: str, namespace: str = None, label_selector: str = None,
+                         field_selector: str = None, limit: int = None, continue_token: str = None,
+                         view: str = "full") -> Dict[str, Any]:
+        """List one page of typed rows with server-side selectors"""
+        try:
+            if view not in LIST_VIEWS:
+                raise ValidationError(f"view must be one of {list(LIST_VIEWS)}")
+            self._check_resource_type(resource_type)
+            data = await self._alist_objects(resource_type, namespace, label_selector, field_selector,
+                                             limit, continue_token, view if view != "full" else None)
+            return self._page(resource_type, data, view)
             
         except Exception as e:
             logger.error(f"Error listing resources: {str(e)}")
             raise
     
+    def _cached_pages(self, resource_type: str, objects: Dict[str, Any], page_size: int):
+        rows = self.summarize_items(objects, resource_type)
+        # An empty collection is still one (empty) page
+        for start in range(0, max(len(rows), 1), page_size):
+            yield {"items": rows[start:start + page_size], "continue": None, "remaining": None,
+                   "resource_version": objects.get("metadata", {}).get("resourceVersion")}
+    
+    def iter_pages(self, resource_type: str, namespace: str = None, label_selector: str = None,
+                   field_selector: str = None, page_size: int = None, view: str = "full",
+                   continue_token: str = None):
+        """Yield list_page results, following continue tokens until the list is exhausted.
+
+        Only one page of page_size items (default K8S_LIST_PAGE_SIZE) is held
+        at a time. A continue_token resumes an earlier list. Unfiltered lists
+        of an informer-cached type are sliced from the cache instead.
+        """
+        page_size = page_size or self.config.list_page_size
+        if not (label_selector or field_selector or continue_token) and view == "full" \
+                and self.informers and self.informers.supports(resource_type):
+            yield from self._cached_pages(resource_type, self.informers.list(resource_type, namespace), page_size)
+            return
+        while True:
+            page = self.list_page(resource_type, namespace, label_selector, field_selector,
+                                  page_size, continue_token, view)
+            yield page
+            continue_token = page["continue"]
+            if not continue_token:
+                return
+    
+    async def aiter_pages(self, resource_type: str, namespace: str = None, label_selector: str = None,
+                          field_selector: str = None, page_size: int = None, view: str = "full",
+                          continue_token: str = None):
+        """Yield list_page results, following continue tokens until the list is exhausted"""
+        page_size = page_size or self.config.list_page_size
+        if not (label_selector or field_selector or continue_token) and view == "full" \
+                and self.informers and self.informers.supports(resource_type):
+            objects = await self.informers.alist(resource_type, namespace)
+            for page in self._cached_pages(resource_type, objects, page_size):
+                yield page
+            return
+        while True:
+            page = await self.alist_page(resource_type, namespace, label_selector, field_selector,
+                                         page_size, continue_token, view)
+            yield page
+            continue_token = page["continue"]
+            if not continue_token:
+                return
+    
     def get_logs(self, pod_name: str, namespace: str = None, lines: int = 100) -> str:
         """Get logs from a pod"""
         try:
-            cmd = ["kubectl", "logs", pod_name, f"--tail={lines}"]
-            if namespace:
-                cmd.extend(["-n", namespace])
+            return self.backend.get_logs(pod_name, namespace, lines)
+            
+        except Exception as e:
+            logger.error(f"Error getting logs: {str(e)}")
+            raise
+    
+    async def aget_logs(self, pod_name: str, namespace: str = None, lines: int = 100) -> str:
+        """Get logs from a pod"""
+        try:
+            return await self.backend.aget_logs(pod_name, namespace, lines)
             
-            result = self._run_kubectl(cmd)
+        except Exception as e:
+            logger.error(f"Error getting logs: {str(e)}")
+            raise
+    
+    def _pod_selector(self, deployment: str = None, label_selector: str = None, namespace: str = None) -> str:
+        if label_selector:
+            return label_selector
+        if not deployment:
+            raise ValidationError("deployment or label_selector is required")
+        obj = self.backend.get_object("deployments", deployment, namespace)
+        return label_selector_from(obj.get("spec", {}).get("selector"))
+    
+    async def _apod_selector(self, deployment: str = None, label_selector: str = None, namespace: str = None) -> str:
+        if label_selector:
+            return label_selector
+        if not deployment:
+            raise ValidationError("deployment or label_selector is required")
+        obj = await self.backend.aget_object("deployments", deployment, namespace)
+        return label_selector_from(obj.get("spec", {}).get("selector"))
+    
+    def _fan_out(self, requested: int) -> int:
+        """Concurrency of a fan-out, capped at what the backend's connection pool keeps alive"""
+        limit = self.backend.max_parallel_requests
+        return max(1, min(requested, limit) if limit else requested)
+    
+    @staticmethod
+    def _log_targets(pods: Dict[str, Any], container: str = None) -> List[tuple]:
+        """(pod, container) pairs to fetch; every container unless one is named"""
+        targets = []
+        for pod in pods.get("items", []):
+            pod_name = pod.get("metadata", {}).get("name")
+            containers = [c.get("name") for c in pod.get("spec", {}).get("containers", [])] or [None]
+            for pod_container in containers:
+                if container is None or pod_container == container:
+                    targets.append((pod_name, pod_container))
+        return targets
+    
+    @staticmethod
+    def _timestamp_key(timestamp: str) -> str:
+        """Sort key for RFC 3339 timestamps whose fraction may be trimmed"""
+        head, _, fraction = timestamp.rstrip("Z").partition(".")
+        return f"{head}.{fraction.ljust(9, '0')}"
+    
+    @classmethod
+    def merge_logs(cls, logs: List[tuple]) -> List[Dict[str, str]]:
+        """Merge timestamped logs of several (pod, container, text) into one timeline.
+
+        Each log is already in time order, so a k-way merge is enough. Lines
+        without a timestamp (wrapped output) keep the one before them.
+        """
+        def entries(pod, container, text):
+            key, timestamp = "", ""
+            for line in text.splitlines():
+                prefix, _, message = line.partition(" ")
+                if prefix[:1].isdigit() and "T" in prefix:
+                    key, timestamp = cls._timestamp_key(prefix), prefix
+                else:
+                    message = line
+                yield key, {"timestamp": timestamp, "pod": pod, "container": container or "", "line": message}
+        
+        merged = heapq.merge(*(entries(*log) for log in logs), key=lambda entry: entry[0])
+        return [entry for _, entry in merged]
+    
+    @classmethod
+    def _merge_fetched(cls, targets: List[tuple], results: List[Any]) -> Dict[str, Any]:
+        """Merge the logs that arrived; a failed fetch becomes an entry in errors"""
+        logs, errors = [], []
+        for (pod, pod_container), result in zip(targets, results):
+            if isinstance(result, BaseException):
+                logger.warning(f"Error getting logs of {pod}: {str(result)}")
+                errors.append({"pod": pod, "container": pod_container or "", "error": str(result)})
+            else:
+                logs.append((pod, pod_container, result))
+        return {"entries": cls.merge_logs(logs), "errors": errors}
+    
+    def aggregate_logs(self, deployment: str = None, label_selector: str = None, namespace: str = None,
+                       lines: int = 100, container: str = None) -> Dict[str, Any]:
+        """Fetch logs of every pod matching a deployment or label selector and merge them by time.
+
+        At most config.log_concurrency logs are fetched at once. A pod
+        whose logs cannot be read (still starting, or deleted since it was
+        listed) does not fail the others: it is reported in "errors" and
+        the remaining logs are merged into "entries".
+        """
+        try:
+            selector = self._pod_selector(deployment, label_selector, namespace)
+            targets = self._log_targets(self._list_objects("pods", namespace, selector), container)
             
-            if not result["success"]:
-                raise ResourceError(f"Failed to get logs for {pod_name}: {result['stderr']}")
+            def fetch(target):
+                pod, pod_container = target
+                try:
+                    return self.backend.get_logs(pod, namespace, lines, pod_container, True)
+                except Exception as e:
+                    return e
             
-            return result["stdout"]
+            with ThreadPoolExecutor(max_workers=max(1, min(self._fan_out(self.config.log_concurrency), len(targets)))) as pool:
+                return self._merge_fetched(targets, list(pool.map(fetch, targets)))
             
         except Exception as e:
-            logger.error(f"Error getting logs: {str(e)}")
+            logger.error(f"Error aggregating logs: {str(e)}")
             raise
     
-    def describe_resource(self, resource_type: str, name: str, namespace: str = None) -> str:
-        """Describe a Kubernetes resource"""
+    async def aaggregate_logs(self, deployment: str = None, label_selector: str = None, namespace: str = None,
+                              lines: int = 100, container: str = None) -> Dict[str, Any]:
+        """Fetch logs of every pod matching a deployment or label selector and merge them by time.
+
+        Returns {"entries": [...], "errors": [...]} like aggregate_logs.
+        """
         try:
-            cmd = ["kubectl", "describe", resource_type, name]
-            if namespace:
-                cmd.extend(["-n", namespace])
+            selector = await self._apod_selector(deployment, label_selector, namespace)
+            targets = self._log_targets(await self._alist_objects("pods", namespace, selector), container)
+            limit = asyncio.Semaphore(self._fan_out(self.config.log_concurrency))
             
-            result = self._run_kubectl(cmd)
+            async def fetch(pod, pod_container):
+                async with limit:
+                    return await self.backend.aget_logs(pod, namespace, lines, pod_container, True)
             
-            if not result["success"]:
-                raise ResourceError(f"Failed to describe {resource_type} {name}: {result['stderr']}")
+            results = await asyncio.gather(*(fetch(*target) for target in targets), return_exceptions=True)
+            for result in results:
+                if isinstance(result, asyncio.CancelledError):
+                    raise result
+            return self._merge_fetched(targets, results)
+            
+        except Exception as e:
+            logger.error(f"Error aggregating logs: {str(e)}")
+            raise
+    
+    async def astream_logs(self, pod_name: str, namespace: str = None, container: str = None,
+                           follow: bool = False, since_seconds: int = None, timestamps: bool = False,
+                           tail_lines: int = None):
+        """Stream log lines from a pod without buffering the whole output.
+
+        Lines are produced as the consumer asks for them, so a slow
+        consumer stops reads from the API server or kubectl.
+        """
+        try:
+            if not self.backend.supports_log_stream:
+                raise ResourceError(f"Log streaming is not available with the {self.backend.name} backend")
+            async for line in self.backend.astream_logs(
+                pod_name, namespace, container, follow, since_seconds, timestamps, tail_lines,
+                self.config.log_max_line_bytes
+            ):
+                yield line
+                
+        except Exception as e:
+            logger.error(f"Error streaming logs: {str(e)}")
+            raise
+    
+    def describe_resource(self, resource_type: str, name: str, namespace: str = None) -> str:
+        """Describe a Kubernetes resource"""
+        try:
+            return self.backend.describe(resource_type, name, namespace)
             
-            return result["stdout"]
+        except Exception as e:
+            logger.error(f"Error describing resource: {str(e)}")
+            raise
+    
+    async def adescribe_resource(self, resource_type: str, name: str, namespace: str = None) -> str:
+        """Describe a Kubernetes resource"""
+        try:
+            return await self.backend.adescribe(resource_type, name, namespace)
             
         except Exception as e:
             logger.error(f"Error describing resource: {str(e)}")
@@ -491,20 +3530,148 @@ class K8sOperations:
         try:
             replicas = self.validator.validate_replicas(replicas)
             
-            cmd = ["kubectl", "scale", "deployment", name, f"--replicas={replicas}"]
-            if namespace:
-                cmd.extend(["-n", namespace])
+            return self.backend.scale(name, replicas, namespace)
             
-            result = self._run_kubectl(cmd)
-            
-            if not result["success"]:
-                raise ResourceError(f"Failed to scale deployment {name}: {result['stderr']}")
+        except Exception as e:
+            logger.error(f"Error scaling deployment: {str(e)}")
+            raise
+    
+    async def ascale_deployment(self, name: str, replicas: int, namespace: str = None) -> Dict[str, Any]:
+        """Scale a deployment"""
+        try:
+            replicas = self.validator.validate_replicas(replicas)
             
-            return result
+            return await self.backend.ascale(name, replicas, namespace)
             
         except Exception as e:
             logger.error(f"Error scaling deployment: {str(e)}")
             raise
+    
+    def _bulk_scale_targets(self, deployments: Dict[str, Any], names: List[str] = None):
+        """Rows for the deployments to scale, remembering their current replica count"""
+        found = {item["metadata"]["name"]: item for item in deployments.get("items", [])}
+        rows = []
+        for name in (names if names is not None else sorted(found)):
+            item = found.get(name)
+            rows.append({
+                "name": name,
+                "namespace": item["metadata"].get("namespace", "") if item else "",
+                "previous": item.get("spec", {}).get("replicas") if item else None,
+                "replicas": None,
+                "success": False,
+                "error": "" if item else f'deployment "{name}" not found',
+                "rolled_back": False,
+                "rollback_error": ""
+            })
+        return rows
+    
+    @staticmethod
+    def _record_bulk_scale(row: Dict[str, Any], target: int, phase: str, error: Exception = None):
+        """Record one scale call on its row.
+
+        A failed rollback leaves the scale result alone (the deployment is
+        still at the new count) and is reported in rollback_error.
+        """
+        if phase == "rollback":
+            if error is None:
+                row["replicas"], row["rolled_back"] = target, True
+            else:
+                row["rollback_error"] = str(error)
+        elif error is None:
+            row["replicas"], row["success"], row["error"] = target, True, ""
+        else:
+            row["success"], row["error"] = False, str(error)
+    
+    @staticmethod
+    def _bulk_scale_summary(rows: List[Dict[str, Any]], rollback: bool) -> Dict[str, Any]:
+        """rolled_back is true only when every deployment that was scaled is back at its previous count"""
+        failed = any(not row["success"] for row in rows)
+        rolled_back = failed and rollback and all(row["rolled_back"] for row in rows if row["success"])
+        return {"results": rows, "failed": failed, "rolled_back": rolled_back}
+    
+    def _bulk_scale_selection(self, names: List[str] = None, label_selector: str = None, namespace: str = None):
+        if not names and not label_selector and not namespace:
+            raise ValidationError("names, label_selector or namespace is required")
+        return self.validator.validate_namespace(namespace), label_selector if not names else None
+    
+    async def abulk_scale(self, replicas: int, names: List[str] = None, label_selector: str = None,
+                          namespace: str = None, rollback_on_failure: bool = False, max_concurrency: int = None,
+                          progress=None) -> Dict[str, Any]:
+        """Scale many deployments at once, chosen by name, label selector or namespace.
+
+        At most max_concurrency (default config.scale_concurrency) scale
+        requests run at a time, and no more than the backend's connection
+        pool keeps alive. progress, when given, is awaited with an
+        event for every finished deployment. With rollback_on_failure, a
+        single failure scales every deployment that succeeded back to its
+        previous replica count; rows whose rollback failed carry
+        rollback_error, and rolled_back is only true when all came back.
+        """
+        try:
+            replicas = self.validator.validate_replicas(replicas)
+            namespace, label_selector = self._bulk_scale_selection(names, label_selector, namespace)
+            rows = self._bulk_scale_targets(await self._alist_objects("deployments", namespace, label_selector), names)
+            limit = asyncio.Semaphore(self._fan_out(max_concurrency or self.config.scale_concurrency))
+            done, total = 0, 0
+            
+            async def scale(row, target, phase):
+                nonlocal done
+                async with limit:
+                    try:
+                        await self.backend.ascale(row["name"], target, row["namespace"] or namespace)
+                        self._record_bulk_scale(row, target, phase)
+                    except Exception as e:
+                        self._record_bulk_scale(row, target, phase, e)
+                done += 1
+                if progress:
+                    await progress({"phase": phase, "completed": done, "total": total, **row})
+            
+            pending = [row for row in rows if not row["error"]]
+            total = len(pending)
+            await asyncio.gather(*(scale(row, replicas, "scale") for row in pending))
+            
+            failed = any(not row["success"] for row in rows)
+            if failed and rollback_on_failure:
+                scaled = [row for row in rows if row["success"] and row["previous"] is not None]
+                done, total = 0, len(scaled)
+                await asyncio.gather(*(scale(row, row["previous"], "rollback") for row in scaled))
+            
+            return self._bulk_scale_summary(rows, rollback_on_failure)
+            
+        except Exception as e:
+            logger.error(f"Error bulk scaling deployments: {str(e)}")
+            raise
+    
+    def bulk_scale(self, replicas: int, names: List[str] = None, label_selector: str = None,
+                   namespace: str = None, rollback_on_failure: bool = False,
+                   max_concurrency: int = None) -> Dict[str, Any]:
+        """Scale many deployments at once on a bounded thread pool"""
+        try:
+            replicas = self.validator.validate_replicas(replicas)
+            namespace, label_selector = self._bulk_scale_selection(names, label_selector, namespace)
+            rows = self._bulk_scale_targets(self._list_objects("deployments", namespace, label_selector), names)
+            
+            def scale(row, target, phase):
+                try:
+                    self.backend.scale(row["name"], target, row["namespace"] or namespace)
+                    self._record_bulk_scale(row, target, phase)
+                except Exception as e:
+                    self._record_bulk_scale(row, target, phase, e)
+            
+            workers = self._fan_out(max_concurrency or self.config.scale_concurrency)
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                list(pool.map(lambda row: scale(row, replicas, "scale"), [r for r in rows if not r["error"]]))
+                
+                failed = any(not row["success"] for row in rows)
+                if failed and rollback_on_failure:
+                    scaled = [row for row in rows if row["success"] and row["previous"] is not None]
+                    list(pool.map(lambda row: scale(row, row["previous"], "rollback"), scaled))
+            
+            return self._bulk_scale_summary(rows, rollback_on_failure)
+            
+        except Exception as e:
+            logger.error(f"Error bulk scaling deployments: {str(e)}")
+            raise
 
 
 # Enhanced LangChain Tools
@@ -513,59 +3680,98 @@ class CreateDeploymentTool(BaseTool):
     description: str = """Create a Kubernetes deployment with comprehensive configuration.
     Input format: JSON with keys: name (str), image (str), replicas (int, default 1), 
     namespace (str, default 'default'), port (int, default 80), cpu_limit (str, default '500m'),
-    memory_limit (str, default '512Mi'), env_vars (dict, optional)"""
+    memory_limit (str, default '512Mi'), env_vars (dict, optional),
+    wait (bool, default false) to wait until the rollout completes, wait_timeout (int seconds, optional)"""
     
     k8s_ops: K8sOperations
-    ui: K8sUI
+    ui: AgentUI
 
-    def __init__(self, k8s_ops: K8sOperations, ui: K8sUI):
+    def __init__(self, k8s_ops: K8sOperations, ui: AgentUI):
         super().__init__(k8s_ops=k8s_ops, ui=ui)
 
+    def _prepare(self, tool_input: str):
+        """Validate the input and render the deployment YAML"""
+        data = json.loads(tool_input)
+        
+        # Validate and sanitize inputs
+        name = self.k8s_ops.validator.validate_name(data.get('name'))
+        image = self.k8s_ops.validator.validate_image(data.get('image'))
+        replicas = self.k8s_ops.validator.validate_replicas(data.get('replicas', 1))
+        namespace = self.k8s_ops.validator.validate_namespace(data.get('namespace', 'default'))
+        port = self.k8s_ops.validator.validate_port(data.get('port', 80))
+        cpu_limit = data.get('cpu_limit', '500m')
+        memory_limit = data.get('memory_limit', '512Mi')
+        env_vars = data.get('env_vars', {})
+        wait = (bool(data.get('wait', False)), data.get('wait_timeout'))
+        
+        # Generate YAML
+        yaml_content = generate_deployment_yaml(
+            name, image, replicas, namespace, port, cpu_limit, memory_limit, env_vars
+        )
+        
+        # Show generated YAML
+        self.ui.show_yaml(yaml_content, f"Deployment YAML for {name}")
+        
+        return name, namespace, yaml_content, wait
+
+    def _finish(self, name: str, namespace: str, result: Dict[str, Any], rollout: Dict[str, Any] = None) -> str:
+        self.ui.print_success(f"Deployment '{name}' created successfully in namespace '{namespace}'")
+        if rollout is None:
+            return f"Deployment created: {result['stdout']}"
+        if rollout["state"] == "complete":
+            self.ui.print_success(format_rollout(rollout))
+        else:
+            self.ui.print_warning(format_rollout(rollout))
+        return f"Deployment created: {result['stdout']}{format_rollout(rollout)}"
+
+    def _handle_error(self, e: Exception) -> str:
+        if isinstance(e, ValidationError):
+            self.ui.print_error(f"Validation error: {str(e)}")
+            return f"Validation error: {str(e)}"
+        if isinstance(e, SecurityError):
+            self.ui.print_error(f"Security error: {str(e)}")
+            return f"Security error: {str(e)}"
+        if isinstance(e, ResourceError):
+            self.ui.print_error(f"Resource error: {str(e)}")
+            return f"Resource error: {str(e)}"
+        logger.error(f"Unexpected error in CreateDeploymentTool: {str(e)}")
+        self.ui.print_error(f"Unexpected error: {str(e)}")
+        return f"Error: {str(e)}"
+
+    @instrument_tool
     def _run(self, tool_input: str) -> str:
         """Create a Kubernetes deployment with validation and error handling"""
         try:
-            data = json.loads(tool_input)
-            
-            # Validate and sanitize inputs
-            name = self.k8s_ops.validator.validate_name(data.get('name'))
-            image = self.k8s_ops.validator.validate_image(data.get('image'))
-            replicas = self.k8s_ops.validator.validate_replicas(data.get('replicas', 1))
-            namespace = self.k8s_ops.validator.validate_namespace(data.get('namespace', 'default'))
-            port = self.k8s_ops.validator.validate_port(data.get('port', 80))
-            cpu_limit = data.get('cpu_limit', '500m')
-            memory_limit = data.get('memory_limit', '512Mi')
-            env_vars = data.get('env_vars', {})
-            
-            # Generate YAML
-            yaml_content = generate_deployment_yaml(
-                name, image, replicas, namespace, port, cpu_limit, memory_limit, env_vars
-            )
-            
-            # Show generated YAML
-            self.ui.show_yaml(yaml_content, f"Deployment YAML for {name}")
+            name, namespace, yaml_content, (wait, wait_timeout) = self._prepare(tool_input)
             
             # Apply to cluster
             result = self.k8s_ops.apply_yaml(yaml_content)
+            version = result.get("resource_versions", {}).get(f"deployments/{name}")
+            rollout = None
+            if wait:
+                rollout = self.k8s_ops.wait_for_rollout(name, namespace, wait_timeout, min_resource_version=version)
             
-            self.ui.print_success(f"Deployment '{name}' created successfully in namespace '{namespace}'")
-            return f"Deployment created: {result['stdout']}"
+            return self._finish(name, namespace, result, rollout)
             
-        except ValidationError as e:
-            self.ui.print_error(f"Validation error: {str(e)}")
-            return f"Validation error: {str(e)}"
-        except SecurityError as e:
-            self.ui.print_error(f"Security error: {str(e)}")
-            return f"Security error: {str(e)}"
-        except ResourceError as e:
-            self.ui.print_error(f"Resource error: {str(e)}")
-            return f"Resource error: {str(e)}"
         except Exception as e:
-            logger.error(f"Unexpected error in CreateDeploymentTool: {str(e)}")
-            self.ui.print_error(f"Unexpected error: {str(e)}")
-            return f"Error: {str(e)}"
+            return self._handle_error(e)
 
-    def _arun(self, *args, **kwargs):
-        raise NotImplementedError()
+    @instrument_tool
+    async def _arun(self, tool_input: str) -> str:
+        """Create a Kubernetes deployment without blocking the event loop"""
+        try:
+            name, namespace, yaml_content, (wait, wait_timeout) = self._prepare(tool_input)
+            
+            result = await self.k8s_ops.aapply_yaml(yaml_content)
+            version = result.get("resource_versions", {}).get(f"deployments/{name}")
+            rollout = None
+            if wait:
+                rollout = await self.k8s_ops.await_rollout(name, namespace, wait_timeout, min_resource_version=version)
+            
+            return self._finish(name, namespace, result, rollout)
+            
+        except Exception as e:
+            return self._handle_error(e)
 
 
 class CreateServiceTool(BaseTool):
@@ -576,172 +3782,861 @@ class CreateServiceTool(BaseTool):
     service_type (str, default 'ClusterIP')"""
     
     k8s_ops: K8sOperations
-    ui: K8sUI
+    ui: AgentUI
 
-    def __init__(self, k8s_ops: K8sOperations, ui: K8sUI):
+    def __init__(self, k8s_ops: K8sOperations, ui: AgentUI):
         super().__init__(k8s_ops=k8s_ops, ui=ui)
 
+    def _prepare(self, tool_input: str):
+        data = json.loads(tool_input)
+        
+        name = self.k8s_ops.validator.validate_name(data.get('name'))
+        port = self.k8s_ops.validator.validate_port(data.get('port', 80))
+        target_port = self.k8s_ops.validator.validate_port(data.get('target_port', 80))
+        namespace = self.k8s_ops.validator.validate_namespace(data.get('namespace', 'default'))
+        service_type = data.get('service_type', 'ClusterIP')
+        
+        yaml_content = generate_service_yaml(name, port, target_port, namespace, service_type)
+        
+        self.ui.show_yaml(yaml_content, f"Service YAML for {name}")
+        
+        return name, yaml_content
+
+    def _finish(self, name: str, result: Dict[str, Any]) -> str:
+        self.ui.print_success(f"Service '{name}-service' created successfully")
+        return f"Service created: {result['stdout']}"
+
+    def _handle_error(self, e: Exception) -> str:
+        logger.error(f"Error in CreateServiceTool: {str(e)}")
+        self.ui.print_error(f"Error creating service: {str(e)}")
+        return f"Error: {str(e)}"
+
+    @instrument_tool
     def _run(self, tool_input: str) -> str:
         try:
-            data = json.loads(tool_input)
+            name, yaml_content = self._prepare(tool_input)
             
-            name = self.k8s_ops.validator.validate_name(data.get('name'))
-            port = self.k8s_ops.validator.validate_port(data.get('port', 80))
-            target_port = self.k8s_ops.validator.validate_port(data.get('target_port', 80))
-            namespace = self.k8s_ops.validator.validate_namespace(data.get('namespace', 'default'))
-            service_type = data.get('service_type', 'ClusterIP')
+            result = self.k8s_ops.apply_yaml(yaml_content)
             
-            yaml_content = generate_service_yaml(name, port, target_port, namespace, service_type)
+            return self._finish(name, result)
             
-            self.ui.show_yaml(yaml_content, f"Service YAML for {name}")
+        except Exception as e:
+            return self._handle_error(e)
+
+    @instrument_tool
+    async def _arun(self, tool_input: str) -> str:
+        try:
+            name, yaml_content = self._prepare(tool_input)
             
-            result = self.k8s_ops.apply_yaml(yaml_content)
+            result = await self.k8s_ops.aapply_yaml(yaml_content)
             
-            self.ui.print_success(f"Service '{name}-service' created successfully")
-            return f"Service created: {result['stdout']}"
+            return self._finish(name, result)
             
         except Exception as e:
-            logger.error(f"Error in CreateServiceTool: {str(e)}")
-            self.ui.print_error(f"Error creating service: {str(e)}")
-            return f"Error: {str(e)}"
-
-    def _arun(self, *args, **kwargs):
-        raise NotImplementedError()
+            return self._handle_error(e)
 
 
 class ListResourcesTool(BaseTool):
     name: str = "list_resources"
     description: str = """List Kubernetes resources.
-    Input format: JSON with keys: resource_type (str), namespace (str, optional)"""
+    Input format: JSON with keys: resource_type (str), namespace (str, optional),
+    label_selector (str, optional), field_selector (str, optional), limit (int, optional)"""
     
     k8s_ops: K8sOperations
-    ui: K8sUI
+    ui: AgentUI
 
-    def __init__(self, k8s_ops: K8sOperations, ui: K8sUI):
+    def __init__(self, k8s_ops: K8sOperations, ui: AgentUI):
         super().__init__(k8s_ops=k8s_ops, ui=ui)
 
+    def _finish(self, resource_type: str, resources: List[Dict[str, str]], render: bool = True) -> str:
+        if resources:
+            if render:
+                self.ui.show_table(resources, f"{resource_type.title()} Resources")
+            return f"Found {len(resources)} {resource_type}"
+        else:
+            if render:
+                self.ui.print_info(f"No {resource_type} found")
+            return f"No {resource_type} found"
+
+    def _handle_error(self, e: Exception) -> str:
+        logger.error(f"Error in ListResourcesTool: {str(e)}")
+        self.ui.print_error(f"Error listing resources: {str(e)}")
+        return f"Error: {str(e)}"
+
+    def collect(self, resource_type: str, namespace: str = None, render: bool = True, **selectors):
+        """Fetch resources once and return (rows, summary).
+
+        With render=False the terminal table is skipped, which is what
+        API callers that only need the data want. Selectors
+        (label_selector, field_selector, limit) are passed to list_page.
+        """
+        if any(selectors.values()):
+            resources = self.k8s_ops.list_page(resource_type, namespace, **selectors)["items"]
+        else:
+            resources = self.k8s_ops.list_resources(resource_type, namespace)
+        return resources, self._finish(resource_type, resources, render)
+
+    async def acollect(self, resource_type: str, namespace: str = None, render: bool = True, **selectors):
+        """Fetch resources once and return (rows, summary)"""
+        if any(selectors.values()):
+            resources = (await self.k8s_ops.alist_page(resource_type, namespace, **selectors))["items"]
+        else:
+            resources = await self.k8s_ops.alist_resources(resource_type, namespace)
+        return resources, self._finish(resource_type, resources, render)
+
+    @staticmethod
+    def _selectors(data: Dict[str, Any]) -> Dict[str, Any]:
+        return {key: data.get(key) for key in ("label_selector", "field_selector", "limit")}
+
+    @instrument_tool
     def _run(self, tool_input: str) -> str:
         try:
             data = json.loads(tool_input)
             
-            resource_type = data.get('resource_type', 'pods')
-            namespace = data.get('namespace')
-            
-            resources = self.k8s_ops.list_resources(resource_type, namespace)
+            _, summary = self.collect(data.get('resource_type', 'pods'), data.get('namespace'),
+                                      **self._selectors(data))
             
-            if resources:
-                self.ui.show_table(resources, f"{resource_type.title()} Resources")
-                return f"Found {len(resources)} {resource_type}"
-            else:
-                self.ui.print_info(f"No {resource_type} found")
-                return f"No {resource_type} found"
+            return summary
                 
         except Exception as e:
-            logger.error(f"Error in ListResourcesTool: {str(e)}")
-            self.ui.print_error(f"Error listing resources: {str(e)}")
-            return f"Error: {str(e)}"
+            return self._handle_error(e)
 
-    def _arun(self, *args, **kwargs):
-        raise NotImplementedError()
+    @instrument_tool
+    async def _arun(self, tool_input: str) -> str:
+        try:
+            data = json.loads(tool_input)
+            
+            _, summary = await self.acollect(data.get('resource_type', 'pods'), data.get('namespace'),
+                                             **self._selectors(data))
+            
+            return summary
+                
+        except Exception as e:
+            return self._handle_error(e)
 
 
 class ScaleDeploymentTool(BaseTool):
     name: str = "scale_deployment"
     description: str = """Scale a Kubernetes deployment.
-    Input format: JSON with keys: name (str), replicas (int), namespace (str, optional)"""
+    Input format: JSON with keys: name (str), replicas (int), namespace (str, optional),
+    wait (bool, default false) to wait until the new replicas are ready, wait_timeout (int seconds, optional)"""
     
     k8s_ops: K8sOperations
-    ui: K8sUI
+    ui: AgentUI
 
-    def __init__(self, k8s_ops: K8sOperations, ui: K8sUI):
+    def __init__(self, k8s_ops: K8sOperations, ui: AgentUI):
         super().__init__(k8s_ops=k8s_ops, ui=ui)
 
+    def _prepare(self, tool_input: str):
+        data = json.loads(tool_input)
+        
+        name = self.k8s_ops.validator.validate_name(data.get('name'))
+        replicas = self.k8s_ops.validator.validate_replicas(data.get('replicas'))
+        namespace = data.get('namespace')
+        wait = (bool(data.get('wait', False)), data.get('wait_timeout'))
+        
+        return name, replicas, namespace, wait
+
+    def _finish(self, name: str, replicas: int, result: Dict[str, Any], rollout: Dict[str, Any] = None) -> str:
+        self.ui.print_success(f"Deployment '{name}' scaled to {replicas} replicas")
+        if rollout is None:
+            return f"Deployment scaled: {result['stdout']}"
+        if rollout["state"] == "complete":
+            self.ui.print_success(format_rollout(rollout))
+        else:
+            self.ui.print_warning(format_rollout(rollout))
+        return f"Deployment scaled: {result['stdout']}{format_rollout(rollout)}"
+
+    def _handle_error(self, e: Exception) -> str:
+        logger.error(f"Error in ScaleDeploymentTool: {str(e)}")
+        self.ui.print_error(f"Error scaling deployment: {str(e)}")
+        return f"Error: {str(e)}"
+
+    @instrument_tool
     def _run(self, tool_input: str) -> str:
         try:
-            data = json.loads(tool_input)
-            
-            name = self.k8s_ops.validator.validate_name(data.get('name'))
-            replicas = self.k8s_ops.validator.validate_replicas(data.get('replicas'))
-            namespace = data.get('namespace')
+            name, replicas, namespace, (wait, wait_timeout) = self._prepare(tool_input)
             
             result = self.k8s_ops.scale_deployment(name, replicas, namespace)
+            version = result.get("resource_version")
+            rollout = None
+            if wait:
+                rollout = self.k8s_ops.wait_for_rollout(name, namespace, wait_timeout, min_resource_version=version)
             
-            self.ui.print_success(f"Deployment '{name}' scaled to {replicas} replicas")
-            return f"Deployment scaled: {result['stdout']}"
+            return self._finish(name, replicas, result, rollout)
             
         except Exception as e:
-            logger.error(f"Error in ScaleDeploymentTool: {str(e)}")
-            self.ui.print_error(f"Error scaling deployment: {str(e)}")
-            return f"Error: {str(e)}"
+            return self._handle_error(e)
 
-    def _arun(self, *args, **kwargs):
-        raise NotImplementedError()
+    @instrument_tool
+    async def _arun(self, tool_input: str) -> str:
+        try:
+            name, replicas, namespace, (wait, wait_timeout) = self._prepare(tool_input)
+            
+            result = await self.k8s_ops.ascale_deployment(name, replicas, namespace)
+            version = result.get("resource_version")
+            rollout = None
+            if wait:
+                rollout = await self.k8s_ops.await_rollout(name, namespace, wait_timeout, min_resource_version=version)
+            
+            return self._finish(name, replicas, result, rollout)
+            
+        except Exception as e:
+            return self._handle_error(e)
 
 
 class GetLogsTool(BaseTool):
     name: str = "get_logs"
-    description: str = """Get logs from a Kubernetes pod.
-    Input format: JSON with keys: pod_name (str), namespace (str, optional), lines (int, default 100)"""
+    description: str = """Get logs from a Kubernetes pod, or from every pod of a deployment or label selector.
+    Input format: JSON with keys: pod_name (str), namespace (str, optional), lines (int, default 100),
+    deployment (str, optional), label_selector (str, optional), container (str, optional).
+    With deployment or label_selector the logs of all matching pods are merged by timestamp."""
     
     k8s_ops: K8sOperations
-    ui: K8sUI
+    ui: AgentUI
 
-    def __init__(self, k8s_ops: K8sOperations, ui: K8sUI):
+    def __init__(self, k8s_ops: K8sOperations, ui: AgentUI):
         super().__init__(k8s_ops=k8s_ops, ui=ui)
 
+    def _prepare(self, tool_input: str):
+        data = json.loads(tool_input)
+        
+        pod_name = data.get('pod_name')
+        namespace = data.get('namespace')
+        lines = data.get('lines', 100)
+        selection = {
+            "deployment": data.get('deployment'),
+            "label_selector": data.get('label_selector'),
+            "container": data.get('container')
+        }
+        
+        if not pod_name and not selection["deployment"] and not selection["label_selector"]:
+            raise ValidationError("pod_name, deployment or label_selector is required")
+        
+        return pod_name, namespace, lines, selection
+
+    def _finish(self, pod_name: str, logs: str) -> str:
+        if logs:
+            self.ui.print_info(f"Logs from pod '{pod_name}':")
+            self.ui.show_text(logs)
+            return f"Retrieved {len(logs.splitlines())} log lines"
+        else:
+            self.ui.print_info(f"No logs found for pod '{pod_name}'")
+            return "No logs found"
+
+    def _finish_merged(self, selection: Dict[str, str], result: Dict[str, Any]) -> str:
+        source = selection["deployment"] or selection["label_selector"]
+        entries, errors = result["entries"], result["errors"]
+        for error in errors:
+            self.ui.print_warning(f"Could not read logs of pod '{error['pod']}': {error['error']}")
+        if not entries:
+            if errors:
+                return f"Error: logs of {len(errors)} pods of '{source}' could not be read"
+            self.ui.print_info(f"No logs found for '{source}'")
+            return "No logs found"
+        
+        pods = {entry["pod"] for entry in entries}
+        self.ui.print_info(f"Logs from {len(pods)} pods of '{source}':")
+        lines = []
+        for entry in entries:
+            tag = f"{entry['pod']}/{entry['container']}" if entry["container"] else entry["pod"]
+            lines.append(f"{entry['timestamp']} [{tag}] {entry['line']}")
+        self.ui.show_text("\n".join(lines))
+        failed = f" ({len(errors)} could not be read)" if errors else ""
+        return f"Retrieved {len(entries)} log lines from {len(pods)} pods{failed}"
+
+    def _handle_error(self, e: Exception) -> str:
+        logger.error(f"Error in GetLogsTool: {str(e)}")
+        self.ui.print_error(f"Error getting logs: {str(e)}")
+        return f"Error: {str(e)}"
+
+    @instrument_tool
     def _run(self, tool_input: str) -> str:
         try:
-            data = json.loads(tool_input)
-            
-            pod_name = data.get('pod_name')
-            namespace = data.get('namespace')
-            lines = data.get('lines', 100)
+            pod_name, namespace, lines, selection = self._prepare(tool_input)
             
             if not pod_name:
-                raise ValidationError("pod_name is required")
+                result = self.k8s_ops.aggregate_logs(namespace=namespace, lines=lines, **selection)
+                return self._finish_merged(selection, result)
             
             logs = self.k8s_ops.get_logs(pod_name, namespace, lines)
             
-            if logs:
-                self.ui.print_info(f"Logs from pod '{pod_name}':")
-                print(logs)
-                return f"Retrieved {len(logs.splitlines())} log lines"
-            else:
-                self.ui.print_info(f"No logs found for pod '{pod_name}'")
-                return "No logs found"
+            return self._finish(pod_name, logs)
                 
         except Exception as e:
-            logger.error(f"Error in GetLogsTool: {str(e)}")
-            self.ui.print_error(f"Error getting logs: {str(e)}")
-            return f"Error: {str(e)}"
+            return self._handle_error(e)
+
+    @instrument_tool
+    async def _arun(self, tool_input: str) -> str:
+        try:
+            pod_name, namespace, lines, selection = self._prepare(tool_input)
+            
+            if not pod_name:
+                result = await self.k8s_ops.aaggregate_logs(namespace=namespace, lines=lines, **selection)
+                return self._finish_merged(selection, result)
+            
+            logs = await self.k8s_ops.aget_logs(pod_name, namespace, lines)
+            
+            return self._finish(pod_name, logs)
+                
+        except Exception as e:
+            return self._handle_error(e)
+
+
+# Intent Planning
+@dataclass
+class PlannedCall:
+    """One step of a plan: a tool name, or "help" / "status", and its arguments"""
+    tool: str
+    args: Dict[str, Any]
+
+
+@dataclass
+class Plan:
+    calls: List[PlannedCall]
+    source: str  # "rule", "cache", "llm" or "none"
+
+
+# Words normalize_prompt keeps in the cache key; any other token is an entity
+PLAN_VOCABULARY = frozenset("""
+    a an the all any my this that of to in on at for from with using use by and into as is are be it
+    please can could you me i want would like show list get display describe what which how many
+    create make add new deploy deployment deployments service services expose
+    scale resize up down set replica replicas instance instances copies
+    log logs line lines last tail recent container pod pods running
+    named called name image images port ports target type clusterip nodeport loadbalancer
+    namespace namespaces cluster resource resources label labels selector wait until ready
+    help status info configuration config current
+""".split()) | frozenset(RESOURCE_KINDS) | frozenset(kind.kind.lower() for kind in RESOURCE_KINDS.values())
+
+# Wording that may change or remove resources; the agent warns before acting
+DANGEROUS_WORDS = re.compile(r"\b(?:delete|remove|destroy|kill)\b", re.IGNORECASE)
+
+PLAN_TOKEN = re.compile(r"(?<!\w)'[^']*'(?!\w)|(?<!\w)\"[^\"]*\"(?!\w)|[^\s,;!?()]+")
+
+
+def normalize_prompt(text: str) -> Tuple[str, List[str]]:
+    """Split user input into a cache key and the entities it abstracts.
+
+    Command words stay in the key, lowercased; names, images, numbers and
+    quoted strings become numbered slots, so "scale web to 3 replicas" and
+    "Scale api to 5 replicas" share the key "scale {0} to {1} replicas".
+    """
+    words, entities = [], []
+    for token in PLAN_TOKEN.findall(text):
+        quoted = len(token) > 1 and token[0] in "'\"" and token[-1] == token[0]
+        value = token[1:-1].strip() if quoted else token.strip(".:")
+        if not value:
+            continue
+        if not quoted and value.lower() in PLAN_VOCABULARY:
+            words.append(value.lower())
+        else:
+            words.append(f"{{{len(entities)}}}")
+            entities.append(value)
+    return " ".join(words), entities
+
+
+class _Uncacheable(Exception):
+    pass
+
+
+def _templatize(value: Any, entities: List[str]) -> Any:
+    """Replace argument values taken from an entity with a reference to its slot.
+
+    A value that only partly matches an entity (the LLM derived it, for
+    example "nginx" from "nginx:1.25") cannot be re-filled for other
+    inputs, so the plan is not cached.
+    """
+    if value is None or isinstance(value, bool):
+        return value
+    if isinstance(value, (str, int, float)):
+        text = str(value)
+        slots = [index for index, entity in enumerate(entities) if entity == text]
+        if len(slots) == 1:
+            return {"$slot": slots[0], "$type": type(value).__name__}
+        if slots or any(entity.lower() in text.lower() or text.lower() in entity.lower() for entity in entities):
+            raise _Uncacheable(text)
+        return value
+    if isinstance(value, list):
+        return [_templatize(item, entities) for item in value]
+    if isinstance(value, dict):
+        # Keys such as environment variable names are kept only when no entity supplied them
+        if any(_templatize(key, entities) != key for key in value):
+            raise _Uncacheable(repr(value))
+        return {key: _templatize(item, entities) for key, item in value.items()}
+    raise _Uncacheable(repr(value))
+
+
+def _fill(template: Any, entities: List[str]) -> Any:
+    if isinstance(template, list):
+        return [_fill(item, entities) for item in template]
+    if isinstance(template, dict):
+        if "$slot" in template:
+            value = entities[template["$slot"]]
+            return {"int": int, "float": float}.get(template["$type"], str)(value)
+        return {key: _fill(item, entities) for key, item in template.items()}
+    return template
+
+
+def _slots(template: Any) -> set:
+    if isinstance(template, list):
+        return set().union(*(_slots(item) for item in template))
+    if isinstance(template, dict):
+        if "$slot" in template:
+            return {template["$slot"]}
+        return set().union(*(_slots(item) for item in template.values()))
+    return set()
+
+
+class PlanCache:
+    """LRU cache of plan templates keyed by normalized prompt.
+
+    A template records which entity slot fills each argument. Slots the
+    plan does not read are pinned to the value they had, so "describe web"
+    never replays a plan learned for "delete web" although both normalize
+    to "{0} {1}"; a key keeps up to max_variants such pinnings. Lookups
+    and stores are thread-safe.
+    """
+
+    def __init__(self, max_entries: int = 1024, max_variants: int = 8):
+        self.max_entries = max_entries
+        self.max_variants = max_variants
+        self._entries: "OrderedDict[str, List[Tuple[Dict[int, str], List[Dict[str, Any]]]]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.stores = 0
+        self.uncacheable = 0
+        self.evictions = 0
+
+    def get(self, key: str, entities: List[str]) -> Optional[List[PlannedCall]]:
+        with self._lock:
+            for pinned, calls in self._entries.get(key, ()):
+                if any(entities[index].lower() != value for index, value in pinned.items()):
+                    continue
+                try:
+                    planned = [PlannedCall(call["tool"], _fill(call["args"], entities)) for call in calls]
+                except ValueError:
+                    # A slot typed int holds a word this time
+                    continue
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return planned
+            self.misses += 1
+            return None
+
+    def put(self, key: str, entities: List[str], calls: List[PlannedCall]) -> bool:
+        """Store calls as a template for key; False when an argument cannot be re-filled"""
+        try:
+            templates = [{"tool": call.tool, "args": _templatize(call.args, entities)} for call in calls]
+        except _Uncacheable:
+            with self._lock:
+                self.uncacheable += 1
+            return False
+        used = _slots(templates)
+        pinned = {index: entity.lower() for index, entity in enumerate(entities) if index not in used}
+        
+        with self._lock:
+            variants = [variant for variant in self._entries.get(key, []) if variant[0] != pinned]
+            variants.append((pinned, templates))
+            self._entries[key] = variants[-self.max_variants:]
+            self._entries.move_to_end(key)
+            self.stores += 1
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+        return True
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def metrics(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "max_entries": self.max_entries,
+            "entries": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "stores": self.stores,
+            "uncacheable": self.uncacheable,
+            "evictions": self.evictions,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0
+        }
+
+
+# Building blocks of the rule patterns. Names follow DNS-1123, so hyphens
+# and dots are accepted; command words are never taken for a name. Numbers
+# must stand alone, so the "25" of "nginx:1.25" is never read as a count.
+_RULE_STOP = (r"(?!(?:the|a|an|named|called|name|with|using|for|of|in|into|on|to|from|and|as|up|down|all|"
+              r"deployment|service|pod|image|port|namespace|replicas?|logs?|lines?)\b)")
+_RULE_NAME = _RULE_STOP + r"(?<![\w.:/@-])['\"]?([a-z0-9](?:[-a-z0-9.]*[a-z0-9])?)['\"]?(?![\w-])"
+_RULE_IMAGE = _RULE_STOP + r"(?<![\w.:/@-])['\"]?((?=[\w./:@-]*[a-z])[a-z0-9][\w./:@-]*\w)['\"]?(?![\w/:@-])"
+_RULE_INT = r"(\d+)(?![\w:/@-]|\.\d)"
+_RULE_LEADING_INT = r"(?<![\w.:/@-])" + _RULE_INT
+_RULE_REPLICAS = _RULE_LEADING_INT + r"\s+(?:replicas?|instances?|copies|pods?)\b"
+_RULE_PORT = r"(?<!target )(?<!target-)\bport\s*[=:]?\s*" + _RULE_INT
+
+SERVICE_TYPES = {"clusterip": "ClusterIP", "nodeport": "NodePort", "loadbalancer": "LoadBalancer"}
+
+
+def _rule_patterns(*patterns: str) -> List["re.Pattern"]:
+    return [re.compile(pattern, re.IGNORECASE) for pattern in patterns]
+
+
+def _first_match(patterns: List["re.Pattern"], text: str) -> Optional[str]:
+    for pattern in patterns:
+        match = pattern.search(text)
+        if match:
+            return match.group(1)
+    return None
+
+
+class RulePlanner:
+    """Regex rules for the common commands, answered without the LLM.
+
+    Each rule only returns a plan when the input is a single command and
+    the rule found every argument the tool requires. Inputs that join
+    several clauses ("... and then scale it to 10"), or that ask for
+    something no rule implements, are left to the plan cache and the LLM.
+    """
+
+    HELP_INPUTS = {"help", "h", "?", "commands", "usage"}
+
+    CREATE_DEPLOYMENT = _rule_patterns(r"\b(?:create|make|add)\b.*\bdeployment\b")
+    CREATE_SERVICE = _rule_patterns(r"\b(?:create|make|add|expose)\b.*\bservice\b", r"^\s*expose\b")
+    SCALE = _rule_patterns(r"\b(?:scale|resize)\b")
+    LOGS = _rule_patterns(r"\blogs?\b")
+    LIST = _rule_patterns(r"^\s*(?:list|show|get|display)\b", r"\blist\b")
+    HELP = _rule_patterns(r"\bhelp\b")
+    COMPOUND = _rule_patterns(r";|&&|\bthen\b|\balso\b|\bafter(?:wards?|\s+that)\b|\bplus\b")
+    UNSUPPORTED = _rule_patterns(r"\b(?:delete|remove|destroy|kill|restart|roll\s*back|undo|update|upgrade|patch|"
+                                 r"edit|describe|drain|cordon|exec)\b")
+    COMMAND_VERBS = _rule_patterns(r"\b(?:create|make|add|expose)\b", r"\b(?:scale|resize)\b", r"\blogs?\b",
+                                   r"\blist\b")
+    STATUS = _rule_patterns(r"\b(?:status|info|configuration|config)\b")
+
+    NAME = _rule_patterns(rf"\b(?:named|called|name)\s+{_RULE_NAME}")
+    DEPLOYMENT_NAME = _rule_patterns(rf"\bdeployment\s+{_RULE_NAME}", rf"{_RULE_NAME}\s+deployment\b")
+    IMAGE = _rule_patterns(
+        rf"\bimage\s+(?:of\s+)?{_RULE_IMAGE}",
+        rf"\b(?:using|with|from|running)\s+(?:the\s+)?{_RULE_IMAGE}"
+    )
+    REPLICAS = _rule_patterns(_RULE_REPLICAS, r"\breplicas?\s*(?:[=:]|of)?\s*" + _RULE_INT)
+    PORT = _rule_patterns(_RULE_PORT, r"\bon\s+" + _RULE_INT)
+    TARGET_PORT = _rule_patterns(r"\btarget[- ]?port\s*[=:]?\s*" + _RULE_INT)
+    SERVICE_NAME = _rule_patterns(
+        rf"\bfor\s+(?:the\s+)?(?:deployment\s+)?{_RULE_NAME}",
+        rf"\b(?:named|called)\s+{_RULE_NAME}",
+        rf"\bexpose\s+(?:the\s+)?(?:deployment\s+)?{_RULE_NAME}",
+        rf"\bservice\s+{_RULE_NAME}"
+    )
+    SERVICE_TYPE = _rule_patterns(r"\b(clusterip|nodeport|loadbalancer)\b")
+    SCALE_NAME = _rule_patterns(rf"\b(?:scale|resize)\s+(?:up\s+|down\s+)?(?:the\s+)?(?:deployment\s+)?{_RULE_NAME}")
+    SCALE_REPLICAS = _rule_patterns(r"\bto\s+" + _RULE_INT, _RULE_REPLICAS, r"\breplicas?\s*[=:]?\s*" + _RULE_INT)
+    POD_NAME = _rule_patterns(
+        rf"\bpod\s+{_RULE_NAME}",
+        rf"{_RULE_NAME}\s+pod\b",
+        rf"\b(?:from|of|for)\s+(?:the\s+)?{_RULE_NAME}"
+    )
+    CONTAINER = _rule_patterns(rf"\bcontainer\s+{_RULE_NAME}")
+    LINES = _rule_patterns(r"\b(?:last|tail)\s+" + _RULE_INT, _RULE_LEADING_INT + r"\s+lines?\b")
+    LABEL_SELECTOR = _rule_patterns(
+        r"\b(?:label|labels|selector)\s+([\w./-]+!?=[\w./-]*(?:,[\w./-]+!?=[\w./-]*)*)",
+        r"(?:^|\s)-l\s+(\S+)"
+    )
+    NAMESPACE = _rule_patterns(
+        rf"\b(?:in|into|from)\s+(?:the\s+)?{_RULE_NAME}\s+namespace\b",
+        rf"\bnamespace\s+{_RULE_NAME}",
+        rf"(?:^|\s)(?:-n|--namespace)[\s=]+{_RULE_NAME}"
+    )
+    WAIT = _rule_patterns(r"\b(?:and\s+)?wait\b", r"\buntil\s+(?:it\s+is\s+|they\s+are\s+)?ready\b")
+
+    def plan(self, user_input: str) -> Optional[List[PlannedCall]]:
+        text = user_input.strip()
+        if text.lower().rstrip(".!") in self.HELP_INPUTS:
+            return [PlannedCall("help", {})]
+        if self._compound(text):
+            return None
+        
+        for rule in (self._create_deployment, self._create_service, self._scale, self._logs, self._list):
+            call = rule(text)
+            if call is not None:
+                return [call]
+        
+        if self._matches(self.HELP, text):
+            return [PlannedCall("help", {})]
+        if self._matches(self.STATUS, text):
+            return [PlannedCall("status", {})]
+        return None
+
+    @staticmethod
+    def _matches(patterns: List["re.Pattern"], text: str) -> bool:
+        return any(pattern.search(text) for pattern in patterns)
+
+    def _compound(self, text: str) -> bool:
+        """True when the input holds more than one command or one no rule implements"""
+        if self._matches(self.COMPOUND, text) or self._matches(self.UNSUPPORTED, text):
+            return True
+        return sum(len(pattern.findall(text)) for pattern in self.COMMAND_VERBS) > 1
+
+    def _common(self, text: str, args: Dict[str, Any]) -> Dict[str, Any]:
+        """Add the namespace when the input gives one"""
+        namespace = _first_match(self.NAMESPACE, text)
+        if namespace:
+            args["namespace"] = namespace
+        return args
+
+    def _wait(self, text: str, args: Dict[str, Any]) -> Dict[str, Any]:
+        if self._matches(self.WAIT, text):
+            args["wait"] = True
+        return args
+
+    def _create_deployment(self, text: str) -> Optional[PlannedCall]:
+        if not self._matches(self.CREATE_DEPLOYMENT, text):
+            return None
+        name = _first_match(self.NAME, text) or _first_match(self.DEPLOYMENT_NAME, text)
+        image = _first_match(self.IMAGE, text)
+        if not name or not image:
+            return None
+        args = {"name": name, "image": image}
+        replicas = _first_match(self.REPLICAS, text)
+        if replicas:
+            args["replicas"] = int(replicas)
+        port = _first_match(self.PORT[:1], text)
+        if port:
+            args["port"] = int(port)
+        return PlannedCall("create_deployment", self._wait(text, self._common(text, args)))
+
+    def _create_service(self, text: str) -> Optional[PlannedCall]:
+        if not self._matches(self.CREATE_SERVICE, text):
+            return None
+        name = _first_match(self.SERVICE_NAME, text)
+        if not name:
+            return None
+        args = {"name": name}
+        port = _first_match(self.PORT, text)
+        if port:
+            args["port"] = int(port)
+        target_port = _first_match(self.TARGET_PORT, text)
+        if target_port:
+            args["target_port"] = int(target_port)
+        service_type = _first_match(self.SERVICE_TYPE, text)
+        if service_type:
+            args["service_type"] = SERVICE_TYPES[service_type.lower()]
+        return PlannedCall("create_service", self._common(text, args))
+
+    def _scale(self, text: str) -> Optional[PlannedCall]:
+        if not self._matches(self.SCALE, text):
+            return None
+        name = _first_match(self.SCALE_NAME, text) or _first_match(self.DEPLOYMENT_NAME, text)
+        replicas = _first_match(self.SCALE_REPLICAS, text)
+        if not name or replicas is None:
+            return None
+        args = {"name": name, "replicas": int(replicas)}
+        return PlannedCall("scale_deployment", self._wait(text, self._common(text, args)))
+
+    def _logs(self, text: str) -> Optional[PlannedCall]:
+        if not self._matches(self.LOGS, text):
+            return None
+        args = {}
+        deployment = _first_match(self.DEPLOYMENT_NAME, text)
+        label_selector = _first_match(self.LABEL_SELECTOR, text)
+        if deployment:
+            args["deployment"] = deployment
+        elif label_selector:
+            args["label_selector"] = label_selector
+        else:
+            pod_name = _first_match(self.POD_NAME, text)
+            if not pod_name:
+                return None
+            args["pod_name"] = pod_name
+        lines = _first_match(self.LINES, text)
+        if lines:
+            args["lines"] = int(lines)
+        container = _first_match(self.CONTAINER, text)
+        if container:
+            args["container"] = container
+        return PlannedCall("get_logs", self._common(text, args))
+
+    def _list(self, text: str) -> Optional[PlannedCall]:
+        if not self._matches(self.LIST, text):
+            return None
+        kind = next((kind for kind in map(resolve_resource_kind, re.findall(r"[a-z]+", text.lower())[1:])
+                     if kind is not None), None)
+        if kind is None and not re.match(r"\s*list\b", text, re.IGNORECASE):
+            return None
+        args = {"resource_type": kind.plural if kind else "pods"}
+        label_selector = _first_match(self.LABEL_SELECTOR, text)
+        if label_selector:
+            args["label_selector"] = label_selector
+        return PlannedCall("list_resources", self._common(text, args))
+
+
+PLANNER_PROMPT = """You turn requests about a Kubernetes cluster into tool calls.
+
+Tools:
+{tools}
+- help: show the commands the agent understands. No arguments.
+- status: show cluster status and the agent configuration. No arguments.
+
+Answer with JSON only: {{"calls": [{{"tool": "<tool name>", "args": {{<arguments>}}}}]}}
+Use the argument names from the tool descriptions. Copy names, images and numbers
+from the request exactly as written and leave out arguments the request does not give.
+Answer {{"calls": []}} when none of the tools does what the request asks."""
+
+
+def parse_plan_response(content: Any, tool_names: set) -> List[PlannedCall]:
+    """Read the calls out of an LLM reply; raises ValidationError for anything else"""
+    if isinstance(content, list):
+        content = "".join(part.get("text", "") if isinstance(part, dict) else str(part) for part in content)
+    match = re.search(r"\{.*\}", content or "", re.DOTALL)
+    if match is None:
+        raise ValidationError("Planner reply contains no JSON object")
+    try:
+        data = json.loads(match.group(0))
+    except json.JSONDecodeError as e:
+        raise ValidationError(f"Planner reply is not valid JSON: {str(e)}")
+    
+    calls = data.get("calls") if isinstance(data, dict) else None
+    if not isinstance(calls, list):
+        raise ValidationError("Planner reply has no calls list")
+    planned = []
+    for call in calls:
+        if not isinstance(call, dict) or call.get("tool") not in tool_names:
+            raise ValidationError(f"Planner chose an unknown tool: {call}")
+        args = call.get("args") or {}
+        if not isinstance(args, dict):
+            raise ValidationError(f"Planner arguments for {call['tool']} are not an object")
+        planned.append(PlannedCall(call["tool"], args))
+    return planned
+
+
+class IntentPlanner:
+    """Turns free text into tool calls.
+
+    Common commands are answered by the rule engine. Other inputs are
+    looked up in the plan cache by normalized prompt, and only a miss asks
+    the LLM, whose plan is cached as a template for later inputs of the
+    same shape. With config.planner set to "rules" the LLM is never
+    called.
+    """
+
+    SOURCES = ("rule", "cache", "llm", "none")
+
+    def __init__(self, tools: List[BaseTool], llm_factory: Callable[[], Any], config: K8sConfig):
+        self.config = config
+        self.llm_factory = llm_factory
+        self.rules = RulePlanner()
+        self.cache = PlanCache(config.plan_cache_size)
+        self.tool_names = {tool.name for tool in tools} | {"help", "status"}
+        self.prompt = PLANNER_PROMPT.format(
+            tools="\n".join(f"- {tool.name}: {' '.join(tool.description.split())}" for tool in tools)
+        )
+        self._lock = threading.Lock()
+        self.sources = dict.fromkeys(self.SOURCES, 0)
+        self.llm_calls = 0
+        self.llm_errors = 0
+
+    @property
+    def use_llm(self) -> bool:
+        return self.config.planner != "rules"
+
+    @timed_phase("plan")
+    @traced("IntentPlanner.plan", result_attributes=lambda plan: {
+        "plan.source": plan.source,
+        "plan.tools": ",".join(call.tool for call in plan.calls)
+    })
+    def plan(self, user_input: str) -> Plan:
+        plan = self._plan(user_input)
+        with self._lock:
+            self.sources[plan.source] += 1
+        if PROMETHEUS_AVAILABLE:
+            PLANS_TOTAL.labels(plan.source).inc()
+        return plan
+
+    def _plan(self, user_input: str) -> Plan:
+        calls = self.rules.plan(user_input)
+        if calls is not None:
+            return Plan(calls, "rule")
+        
+        key, entities = normalize_prompt(user_input)
+        calls = self.cache.get(key, entities)
+        if calls is not None:
+            return Plan(calls, "cache")
+        
+        if not self.use_llm:
+            return Plan([], "none")
+        calls = self._ask_llm(user_input)
+        if calls is None:
+            return Plan([], "none")
+        self.cache.put(key, entities, calls)
+        return Plan(calls, "llm")
+
+    def _ask_llm(self, user_input: str) -> Optional[List[PlannedCall]]:
+        with self._lock:
+            self.llm_calls += 1
+        try:
+            with tracer.span("llm.plan", {"gen_ai.request.model": self.config.model}, kind="client"):
+                response = self.llm_factory().invoke([("system", self.prompt), ("human", user_input)])
+            return parse_plan_response(response.content, self.tool_names)
+        except Exception as e:
+            with self._lock:
+                self.llm_errors += 1
+            logger.warning(f"LLM planning failed: {str(e)}")
+            return None
 
-    def _arun(self, *args, **kwargs):
-        raise NotImplementedError()
+    def metrics(self) -> Dict[str, Any]:
+        return {
+            "mode": "rules" if not self.use_llm else "auto",
+            "sources": dict(self.sources),
+            "llm_calls": self.llm_calls,
+            "llm_errors": self.llm_errors,
+            "cache": self.cache.metrics()
+        }
 
 
 # Enhanced Agent Setup
 class K8sAgent:
     """Enhanced Kubernetes Agent with comprehensive features"""
     
-    def __init__(self, config: K8sConfig):
+    def __init__(self, config: K8sConfig, ui: AgentUI = None):
         self.config = config
-        self.ui = K8sUI()
+        configure_tracing(config)
+        self.ui = ui or K8sUI()
         self.k8s_ops = K8sOperations(config, self.ui)
         
-        # Initialize LLM
-        self.llm = ChatGoogleGenerativeAI(
-            model=config.model,
-            google_api_key=config.api_key,
-            temperature=config.temperature,
-            max_tokens=config.max_tokens
-        )
+        # The LLM client is built on first use
+        self._llm = None
+        self._llm_lock = threading.Lock()
         
         # Initialize tools
         self.tools = self._create_tools()
+        self._tools_by_name = {tool.name: tool for tool in self.tools}
+        
+        # Free text is planned into tool calls; the LLM is only asked on a rule and cache miss
+        self.planner = IntentPlanner(self.tools, lambda: self.llm, config)
         
         # Create agent
         self.agent = self._create_agent()
     
+    @property
+    def llm(self):
+        """Chat model client; langchain_google_genai is imported and the client built on first access"""
+        if self._llm is None:
+            with self._llm_lock:
+                if self._llm is None:
+                    from langchain_google_genai import ChatGoogleGenerativeAI
+                    self._llm = ChatGoogleGenerativeAI(
+                        model=self.config.model,
+                        google_api_key=self.config.api_key,
+                        temperature=self.config.temperature,
+                        max_tokens=self.config.max_tokens,
+                        timeout=self.config.timeout,
+                        max_retries=2
+                    )
+        return self._llm
+    
     def _create_tools(self) -> List[BaseTool]:
         """Create all available tools"""
         return [
@@ -756,6 +4651,7 @@ class K8sAgent:
         """Create a simplified agent that processes user input and calls appropriate tools"""
         return None  # We'll handle this in the run method
     
+    @traced("K8sAgent.run", attributes=lambda self, user_input: {"agent.input": user_input[:256]})
     def run(self, user_input: str) -> str:
         """Run the agent with user input"""
         try:
@@ -765,161 +4661,31 @@ class K8sAgent:
                 return "No input provided"
             
             # Check for dangerous commands
-            dangerous_keywords = ["delete", "remove", "destroy", "kill"]
-            if any(keyword in user_input.lower() for keyword in dangerous_keywords):
+            if DANGEROUS_WORDS.search(user_input):
                 self.ui.print_warning("⚠️  This command may modify or delete resources. Please review carefully.")
             
-            # Simple command processing
-            user_input_lower = user_input.lower()
-            
-            # Handle help commands
-            if any(cmd in user_input_lower for cmd in ["help", "h", "?"]):
-                self.show_help()
-                return "Help displayed"
-            
-            # Handle status commands
-            if any(cmd in user_input_lower for cmd in ["status", "info"]):
-                self.show_status()
-                return "Status displayed"
-            
-            # Process deployment commands
-            if "create" in user_input_lower and "deployment" in user_input_lower:
-                return self._process_deployment_command(user_input)
+            plan = self.planner.plan(user_input)
+            if not plan.calls:
+                return "I understand you want to work with Kubernetes. Please be more specific about what you'd like to do. Try 'help' for available commands."
             
-            # Process service commands
-            if "create" in user_input_lower and "service" in user_input_lower:
-                return self._process_service_command(user_input)
-            
-            # Process list commands
-            if "list" in user_input_lower:
-                return self._process_list_command(user_input)
-            
-            # Process scale commands
-            if "scale" in user_input_lower:
-                return self._process_scale_command(user_input)
-            
-            # Process logs commands
-            if "log" in user_input_lower:
-                return self._process_logs_command(user_input)
-            
-            # Default response
-            return "I understand you want to work with Kubernetes. Please be more specific about what you'd like to do. Try 'help' for available commands."
+            return "\n".join(self._execute(call) for call in plan.calls)
             
         except Exception as e:
             logger.error(f"Error in agent execution: {str(e)}")
             self.ui.print_error(f"Agent error: {str(e)}")
             return f"Error: {str(e)}"
     
-    def _process_deployment_command(self, user_input: str) -> str:
-        """Process deployment creation commands"""
-        try:
-            # Simple parsing - look for name, image, replicas
-            import re
-            
-            # Extract name
-            name_match = re.search(r"named?\s+['\"]?(\w+)['\"]?", user_input, re.IGNORECASE)
-            name = name_match.group(1) if name_match else "webapp"
-            
-            # Extract image
-            image_match = re.search(r"(\w+)(?::\w+)?\s+image", user_input, re.IGNORECASE)
-            if not image_match:
-                image_match = re.search(r"image\s+(\w+)(?::\w+)?", user_input, re.IGNORECASE)
-            image = image_match.group(1) if image_match else "nginx"
-            
-            # Extract replicas
-            replicas_match = re.search(r"(\d+)\s+replicas?", user_input, re.IGNORECASE)
-            replicas = int(replicas_match.group(1)) if replicas_match else 1
-            
-            # Create deployment
-            tool = CreateDeploymentTool(self.k8s_ops, self.ui)
-            tool_input = json.dumps({
-                "name": name,
-                "image": image,
-                "replicas": replicas
-            })
-            return tool._run(tool_input)
-            
-        except Exception as e:
-            return f"Error processing deployment command: {str(e)}"
-    
-    def _process_service_command(self, user_input: str) -> str:
-        """Process service creation commands"""
-        try:
-            # Simple parsing
-            import re
-            
-            name_match = re.search(r"for\s+['\"]?(\w+)['\"]?", user_input, re.IGNORECASE)
-            name = name_match.group(1) if name_match else "webapp"
-            
-            port_match = re.search(r"port\s+(\d+)", user_input, re.IGNORECASE)
-            port = int(port_match.group(1)) if port_match else 80
-            
-            tool = CreateServiceTool(self.k8s_ops, self.ui)
-            tool_input = json.dumps({
-                "name": name,
-                "port": port
-            })
-            return tool._run(tool_input)
-            
-        except Exception as e:
-            return f"Error processing service command: {str(e)}"
-    
-    def _process_list_command(self, user_input: str) -> str:
-        """Process list commands"""
-        try:
-            resource_type = "pods"
-            if "deployment" in user_input.lower():
-                resource_type = "deployments"
-            elif "service" in user_input.lower():
-                resource_type = "services"
-            
-            tool = ListResourcesTool(self.k8s_ops, self.ui)
-            tool_input = json.dumps({
-                "resource_type": resource_type
-            })
-            return tool._run(tool_input)
-            
-        except Exception as e:
-            return f"Error processing list command: {str(e)}"
-    
-    def _process_scale_command(self, user_input: str) -> str:
-        """Process scale commands"""
-        try:
-            import re
-            
-            name_match = re.search(r"['\"]?(\w+)['\"]?\s+deployment", user_input, re.IGNORECASE)
-            name = name_match.group(1) if name_match else "webapp"
-            
-            replicas_match = re.search(r"(\d+)\s+replicas?", user_input, re.IGNORECASE)
-            replicas = int(replicas_match.group(1)) if replicas_match else 1
-            
-            tool = ScaleDeploymentTool(self.k8s_ops, self.ui)
-            tool_input = json.dumps({
-                "name": name,
-                "replicas": replicas
-            })
-            return tool._run(tool_input)
-            
-        except Exception as e:
-            return f"Error processing scale command: {str(e)}"
-    
-    def _process_logs_command(self, user_input: str) -> str:
-        """Process logs commands"""
-        try:
-            import re
-            
-            pod_match = re.search(r"pod\s+['\"]?(\w+)['\"]?", user_input, re.IGNORECASE)
-            pod_name = pod_match.group(1) if pod_match else "webapp"
-            
-            tool = GetLogsTool(self.k8s_ops, self.ui)
-            tool_input = json.dumps({
-                "pod_name": pod_name
-            })
-            return tool._run(tool_input)
-            
-        except Exception as e:
-            return f"Error processing logs command: {str(e)}"
+    def _execute(self, call: PlannedCall) -> str:
+        """Run one planned call"""
+        if call.tool == "help":
+            self.show_help()
+            return "Help displayed"
+        if call.tool == "status":
+            self.show_status()
+            return "Status displayed"
+        return self._tools_by_name[call.tool]._run(json.dumps(call.args))
     
+    @timed_phase("ui")
     def show_help(self):
         """Show available commands and help"""
         help_text = """
@@ -954,15 +4720,24 @@ Type 'exit' or 'quit' to stop the agent.
         """
         self.ui.print_info(help_text)
     
+    @timed_phase("ui")
     def show_status(self):
         """Show agent and cluster status"""
         try:
-            # Test kubectl connectivity
-            result = self.k8s_ops._run_kubectl(["kubectl", "version", "--client"])
-            if result["success"]:
-                self.ui.print_success("✅ kubectl is available and working")
+            discovery = self.k8s_ops.discovery
+            discovery.start()
+            discovery.wait_ready(self.config.timeout)
+            status = discovery.snapshot()
+            if status["kubectl_available"]:
+                self.ui.print_success(f"✅ kubectl is available and working ({status['client_version']})")
             else:
                 self.ui.print_error("❌ kubectl is not available or not working")
+            if status["reachable"]:
+                self.ui.print_success(
+                    f"✅ Cluster reachable ({status['server_version']}, {status['resource_count']} API resources)"
+                )
+            else:
+                self.ui.print_error(f"❌ Cluster not reachable: {status['error']}")
             
             # Show configuration
             config_info = f"""
@@ -989,8 +4764,88 @@ def load_config() -> K8sConfig:
         temperature=float(os.getenv("K8S_TEMPERATURE", "0.1")),
         max_tokens=int(os.getenv("K8S_MAX_TOKENS", "2048")),
         namespace=os.getenv("K8S_NAMESPACE", "default"),
-        max_replicas=int(os.getenv("K8S_MAX_REPLICAS", "10"))
+        max_replicas=int(os.getenv("K8S_MAX_REPLICAS", "10")),
+        backend=os.getenv("K8S_BACKEND", "auto"),
+        connection_pool_size=int(os.getenv("K8S_CONNECTION_POOL_SIZE", "4")),
+        informer_cache=os.getenv("K8S_INFORMER_CACHE", "false").lower() == "true",
+        log_concurrency=int(os.getenv("K8S_LOG_CONCURRENCY", "8")),
+        scale_concurrency=int(os.getenv("K8S_SCALE_CONCURRENCY", "10")),
+        rollout_timeout=int(os.getenv("K8S_ROLLOUT_TIMEOUT", "300")),
+        apply_field_manager=os.getenv("K8S_APPLY_FIELD_MANAGER", "k8s-agent"),
+        apply_force_conflicts=os.getenv("K8S_APPLY_FORCE_CONFLICTS", "true").lower() == "true",
+        apply_server_side=os.getenv("K8S_APPLY_SERVER_SIDE", "false").lower() == "true",
+        list_page_size=int(os.getenv("K8S_LIST_PAGE_SIZE", "500")),
+        discovery_interval=int(os.getenv("K8S_DISCOVERY_INTERVAL", "300")),
+        trace_exporter=os.getenv("K8S_TRACE_EXPORTER", "none"),
+        trace_file=os.getenv("K8S_TRACE_FILE", "k8s-agent-traces.jsonl"),
+        trace_endpoint=os.getenv("K8S_TRACE_ENDPOINT", "http://localhost:4318/v1/traces"),
+        trace_sample_ratio=float(os.getenv("K8S_TRACE_SAMPLE_RATIO", "1.0")),
+        planner=os.getenv("K8S_PLANNER", "auto"),
+        plan_cache_size=int(os.getenv("K8S_PLAN_CACHE_SIZE", "1024"))
+    )
+
+
+# Modules start-up must not import; they load on first use
+DEFERRED_MODULES = ("langchain_google_genai", "kubernetes", "httpx", "rich.syntax", "rich.table", "rich.progress")
+
+
+def profile_imports(top: int = 15) -> Dict[str, Any]:
+    """Import this module in a fresh interpreter under -X importtime.
+
+    Returns the cumulative import time, the slowest direct imports and
+    which DEFERRED_MODULES were loaded anyway.
+    """
+    code = "import k8s, sys; print(','.join(m for m in k8s.DEFERRED_MODULES if m in sys.modules))"
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        cwd=os.path.dirname(os.path.abspath(__file__)),
+        capture_output=True,
+        text=True,
+        timeout=120
     )
+    if result.returncode != 0:
+        raise K8sError(f"Importing k8s failed: {result.stderr.strip().splitlines()[-1:]}")
+    
+    # Children are reported before their parent, two spaces deeper per level
+    pending, direct, total_ms = [], [], 0.0
+    for line in result.stderr.splitlines():
+        parts = line[len("import time:"):].split("|")
+        if not line.startswith("import time:") or len(parts) != 3 or not parts[1].strip().isdigit():
+            continue
+        name = parts[2].rstrip()
+        depth = (len(name) - len(name.lstrip()) - 1) // 2
+        if depth == 1:
+            pending.append({"module": name.strip(), "ms": round(int(parts[1]) / 1000, 1)})
+        elif depth == 0:
+            if name.strip() == "k8s":
+                direct, total_ms = pending, round(int(parts[1]) / 1000, 1)
+            pending = []
+    
+    loaded = result.stdout.strip()
+    return {
+        "total_ms": total_ms,
+        "imports": sorted(direct, key=lambda entry: entry["ms"], reverse=True)[:top],
+        "deferred_loaded": loaded.split(",") if loaded else []
+    }
+
+
+def profile_startup() -> List[Dict[str, Any]]:
+    """Time the start-up phases of the interactive agent in this process"""
+    phases = []
+    
+    def phase(name: str, fn):
+        start = time.perf_counter()
+        value = fn()
+        phases.append({"phase": name, "ms": round((time.perf_counter() - start) * 1000, 1)})
+        return value
+    
+    config = phase("load_config()", load_config)
+    agent = phase("K8sAgent()", lambda: K8sAgent(config))
+    try:
+        phase("LLM client (first use)", lambda: agent.llm)
+    finally:
+        agent.k8s_ops.close()
+    return phases
 
 
 def main():
@@ -1001,6 +4856,8 @@ def main():
     parser.add_argument("--namespace", help="Default namespace to use")
     parser.add_argument("--dry-run", action="store_true", help="Run in dry-run mode")
     parser.add_argument("--verbose", "-v", action="store_true", help="Enable verbose logging")
+    parser.add_argument("--profile-startup", action="store_true",
+                        help="Report import and start-up time, then exit")
     
     args = parser.parse_args()
     
@@ -1008,6 +4865,16 @@ def main():
     if args.verbose:
         logging.getLogger().setLevel(logging.DEBUG)
     
+    if args.profile_startup:
+        ui = K8sUI()
+        imports = profile_imports()
+        ui.print_header("Start-up profile", f"import k8s: {imports['total_ms']} ms")
+        ui.show_table(imports["imports"], "Slowest direct imports")
+        if imports["deferred_loaded"]:
+            ui.print_warning(f"Loaded at import although deferred: {', '.join(imports['deferred_loaded'])}")
+        ui.show_table(profile_startup(), "Start-up phases")
+        return
+    
     try:
         # Load configuration
         config = load_config()
@@ -1016,6 +4883,10 @@ def main():
         
         # Initialize agent
         agent = K8sAgent(config)
+        agent.k8s_ops.discovery.start()
+        if RICH_AVAILABLE:
+            from rich.progress import Progress, SpinnerColumn, TextColumn
+            from rich.prompt import Prompt
         
         # Show welcome message
         agent.ui.print_header(